@@ -8,10 +8,81 @@ from dotenv import load_dotenv
 # 환경 변수 로드
 load_dotenv()
 
+# 프로젝트 루트 디렉터리 (실행 위치와 상관없이 같은 파일을 쓰도록 경로 기준으로 사용)
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 # DeepSeek API 설정
 DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
 DEEPSEEK_API_URL = "https://api.deepseek.com/v1/chat/completions"
 
+# DeepSeek API 연결 설정 (타임아웃 단위: 초)
+DEEPSEEK_CONNECT_TIMEOUT = float(os.getenv("DEEPSEEK_CONNECT_TIMEOUT", "10"))
+DEEPSEEK_READ_TIMEOUT = float(os.getenv("DEEPSEEK_READ_TIMEOUT", "180"))
+DEEPSEEK_MAX_RETRIES = int(os.getenv("DEEPSEEK_MAX_RETRIES", "4"))
+DEEPSEEK_REQUESTS_PER_MINUTE = float(os.getenv("DEEPSEEK_REQUESTS_PER_MINUTE", "60"))
+# 스트리밍(SSE) 응답 사용 여부
+DEEPSEEK_STREAM = os.getenv("DEEPSEEK_STREAM", "true").lower() in ("1", "true", "yes")
+
+# LLM 응답 캐시 설정 (프롬프트 단위)
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "data/cache/llm_responses.json")
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2048"))
+
+# 논문 분석 결과 캐시 설정 (SQLite 단일 파일)
+ANALYSIS_CACHE_PATH = os.getenv("ANALYSIS_CACHE_PATH", "data/cache/analysis_cache.db")
+ANALYSIS_CACHE_TTL_DAYS = float(os.getenv("ANALYSIS_CACHE_TTL_DAYS", "30"))
+ANALYSIS_CACHE_MAX_MB = int(os.getenv("ANALYSIS_CACHE_MAX_MB", "64"))
+
+# 논문 분석 동시 실행 설정 (동시에 진행되는 최대 API 호출 수)
+ANALYSIS_MAX_CONCURRENCY = int(os.getenv("ANALYSIS_MAX_CONCURRENCY", "6"))
+
+# arXiv 검색 설정
+# 검색할 카테고리 (쉼표로 구분, 교차 등록된 논문은 한 번만 포함)
+ARXIV_CATEGORIES = [
+    category.strip()
+    for category in os.getenv("ARXIV_CATEGORIES", "cs.AI,cs.LG,cs.CL,cs.CV,stat.ML").split(",")
+    if category.strip()
+]
+# 모든 카테고리 검색이 공유하는 분당 최대 요청 수 (arXiv 권장: 3초에 1회)
+ARXIV_REQUESTS_PER_MINUTE = float(os.getenv("ARXIV_REQUESTS_PER_MINUTE", "20"))
+# - window: 제출 기간(submittedDate) 필터를 검색식에 넣어 기간 안의 논문만 받습니다.
+# - scan: 카테고리 전체를 최신순으로 훑으며 기간을 벗어나면 중단합니다.
+ARXIV_QUERY_MODE = os.getenv("ARXIV_QUERY_MODE", "window")
+# 카테고리별 하루 예상 논문 수 (검색 페이지 크기 계산에 사용)
+ARXIV_EXPECTED_DAILY_VOLUME = int(os.getenv("ARXIV_EXPECTED_DAILY_VOLUME", "500"))
+
+# 증분 수집 상태 (마지막 수집 시각과 이미 본 arXiv ID, 상대 경로는 프로젝트 루트 기준)
+HARVEST_STATE_PATH = os.path.join(PROJECT_DIR, os.getenv("HARVEST_STATE_PATH", "data/cache/harvest_state.json"))
+# 제출 후 공개가 늦어지는 논문을 놓치지 않도록 기준 시각 이전으로 다시 확인하는 시간
+HARVEST_OVERLAP_HOURS = float(os.getenv("HARVEST_OVERLAP_HOURS", "24"))
+
+# 중복 논문 제거 (제목+초록의 추정 Jaccard 유사도가 이 값 이상이면 같은 논문으로 봄)
+DEDUPE_THRESHOLD = float(os.getenv("DEDUPE_THRESHOLD", "0.8"))
+
+# Top 10 선정 방식
+# - quality: 저자/제목/초록/최근성 기반 품질 점수
+# - relevance: 관심사 프로필(INTEREST_PROFILES_PATH)과의 BM25 유사도
+RANKING_MODE = os.getenv("RANKING_MODE", "quality")
+INTEREST_PROFILES_PATH = os.getenv("INTEREST_PROFILES_PATH", "config/interest_profiles.json")
+
+# 저자 이력 색인 (저자별 논문 수, Top 10 선정 횟수, 최근 등장일). 품질 점수의 저자 점수에 반영됨
+AUTHOR_INDEX_PATH = os.getenv("AUTHOR_INDEX_PATH", "data/cache/author_index.json")
+# 마지막 Top 10 선정이 이보다 오래된 저자는 이력 점수를 절반만 인정
+AUTHOR_RECENCY_DAYS = float(os.getenv("AUTHOR_RECENCY_DAYS", "365"))
+
+# Top 10 다양성 재순위(MMR). 0이면 점수 순서 그대로, 클수록 이미 고른 논문과 비슷한 논문을 덜 고름
+MMR_DIVERSITY = float(os.getenv("MMR_DIVERSITY", "0.3"))
+# 논문 간 유사도에서 카테고리 겹침이 차지하는 비율 (나머지는 제목+초록 TF-IDF 유사도)
+MMR_CATEGORY_WEIGHT = float(os.getenv("MMR_CATEGORY_WEIGHT", "0.3"))
+
+# 수신자(그룹)별 맞춤 Top 10 프로필. 파일이 없으면 모두에게 같은 보고서를 보냄
+# 형식은 config/recipient_profiles.example.json 참고
+RECIPIENT_PROFILES_PATH = os.getenv("RECIPIENT_PROFILES_PATH", "config/recipient_profiles.json")
+
+# 분석 모드
+# - combined: 논문당 한 번의 JSON 응답으로 분류, 태그, 요약, 번역을 모두 받습니다.
+# - separate: 번역, 분류, 요약을 각각 별도로 호출합니다.
+ANALYSIS_MODE = os.getenv("ANALYSIS_MODE", "combined")
+
 # 분석 프롬프트
 ANALYSIS_PROMPTS = {
     "classification": """
@@ -104,5 +175,33 @@ ANALYSIS_PROMPTS = {
 {abstract}
 
 번역문을 반환해주세요.
+""",
+    
+    "combined": """
+다음 논문을 분석하여 분류, 태그, 요약, 초록 번역을 하나의 JSON 객체로 반환해주세요.
+
+1. classification: 가장 주요한 분야 하나 (문자열)
+
+2. tags: 5-8개의 키워드 (문자열 배열)
+   - 기술적 용어 (2-3개): 논문에서 사용된 핵심 기술이나 알고리즘
+   - 실용적 용어 (2-3개): 실제 적용 분야나 사용 사례
+   - 혁신적 용어 (1-2개): 논문의 주요 기여점이나 혁신적인 부분
+
+3. summary: 일반 독자도 이해하기 쉬운 요약 (문자열)
+   - [연구의 중요성과 배경], [주요 내용과 방법], [기대되는 효과와 기여점] 세 부분으로 구성
+   - 각 부분은 빈 줄로 구분
+   - 중요한 용어는 **용어**와 같이 굵게 표시하고, 구체적인 수치나 예시를 포함
+   - 그 밖의 마크다운 기호(#, -, * 등)는 사용하지 않음
+
+4. translation: 초록 전체의 한국어 번역 (문자열)
+   - 모든 전문 용어는 원문(영어)을 병기하고 <strong>태그로 강조 표시
+   - 의미 단위로 개행
+   - '-입니다' 체계 유지
+
+제목: {title}
+초록: {abstract}
+
+다른 설명 없이 다음 형식의 JSON만 반환해주세요:
+{{"classification": "...", "tags": ["...", "..."], "summary": "...", "translation": "..."}}
 """
-} 
\ No newline at end of file
+}
\ No newline at end of file
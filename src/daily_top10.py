@@ -1,19 +1,31 @@
-import arxiv
 import datetime
-from typing import List, Dict
+from typing import Iterable, List, Dict, Optional
 import pandas as pd
 import pytz
 import time
 import os
 import schedule
-from rank_papers import PaperQualityAnalyzer
+from rank_papers import BatchQualityScorer, PaperQualityAnalyzer, StreamingTopK, paper_fields, ranking_row
 from paper_analyzer import PaperAnalyzer
 from analysis_manager import AnalysisManager
 import json
 from services.email_sender import EmailSender
+from services.analysis_cache import AnalysisCache, get_content_key, get_stage_cache_key, remove_pickle_files
+from services.multi_category_collector import MultiCategoryCollector
+from services.rate_limiter import get_shared_rate_limiter
+from services.harvest_state import HarvestState
+from services.near_duplicates import MinHashDeduper
+from services.relevance_ranker import RelevanceRanker, load_interest_profiles
+from services.personalized_ranking import PersonalizedRanker
+from services.diversity import MMRReranker
+from services.author_index import AuthorIndex
+from config import (
+    ANALYSIS_CACHE_PATH, ANALYSIS_CACHE_TTL_DAYS, ANALYSIS_CACHE_MAX_MB,
+    ARXIV_CATEGORIES, ARXIV_EXPECTED_DAILY_VOLUME, ARXIV_QUERY_MODE, ARXIV_REQUESTS_PER_MINUTE,
+    HARVEST_STATE_PATH, HARVEST_OVERLAP_HOURS, DEDUPE_THRESHOLD, RANKING_MODE, INTEREST_PROFILES_PATH,
+    MMR_DIVERSITY, MMR_CATEGORY_WEIGHT, RECIPIENT_PROFILES_PATH, AUTHOR_INDEX_PATH, AUTHOR_RECENCY_DAYS
+)
 import requests
-import hashlib
-import pickle
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -28,154 +40,125 @@ if hasattr(time, 'tzset'):
 # Initialize analyzers
 paper_analyzer = PaperAnalyzer()
 analysis_manager = AnalysisManager()
+analysis_cache = AnalysisCache(
+    ANALYSIS_CACHE_PATH,
+    ttl_days=ANALYSIS_CACHE_TTL_DAYS,
+    max_bytes=ANALYSIS_CACHE_MAX_MB * 1024 * 1024
+)
+# 예전 버전이 남긴 pickle 캐시는 새 캐시 키와 맞지 않으므로 시작할 때 정리
+remove_pickle_files(os.path.dirname(ANALYSIS_CACHE_PATH))
 
-def get_paper_hash(paper: Dict) -> str:
-    """논문의 고유 해시값을 생성합니다."""
-    paper_data = f"{paper['title']}{paper['url']}{paper['published']}"
-    return hashlib.md5(paper_data.encode()).hexdigest()
-
-def load_cached_analysis(paper_hash: str) -> Dict:
-    """캐시된 분석 결과를 로드합니다."""
-    cache_dir = "data/cache"
-    os.makedirs(cache_dir, exist_ok=True)
-    cache_file = os.path.join(cache_dir, f"{paper_hash}.pkl")
-    
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'rb') as f:
-                return pickle.load(f)
-        except Exception as e:
-            print(f"캐시 로드 중 오류 발생: {e}")
-    return None
+def load_cached_analyses(cache_keys: List[str]) -> Dict[str, Dict]:
+    """캐시된 분석 결과를 한 번에 로드합니다."""
+    try:
+        return analysis_cache.get_many(cache_keys)
+    except Exception as e:
+        print(f"캐시 로드 중 오류 발생: {e}")
+        return {}
 
-def save_cached_analysis(paper_hash: str, analysis_result: Dict):
-    """분석 결과를 캐시에 저장합니다."""
-    cache_dir = "data/cache"
-    os.makedirs(cache_dir, exist_ok=True)
-    cache_file = os.path.join(cache_dir, f"{paper_hash}.pkl")
-    
+def save_cached_analyses(cache_entries: Dict[str, Dict]):
+    """분석 결과를 한 번에 캐시에 저장합니다."""
     try:
-        with open(cache_file, 'wb') as f:
-            pickle.dump(analysis_result, f)
+        analysis_cache.put_many(cache_entries)
     except Exception as e:
         print(f"캐시 저장 중 오류 발생: {e}")
 
-def get_specific_date_papers(target_date: str) -> List[Dict]:
+def get_specific_date_papers(target_date: str, incremental: bool = False) -> List[Dict]:
+    """대상 날짜(UTC)에 제출된 논문을 설정된 모든 카테고리에서 가져옵니다.
+    
+    incremental=True이면 이전 실행 이후 새로 올라온 논문만 가져옵니다.
+    """
     try:
-        # arxiv API 클라이언트 사용
-        client = arxiv.Client(
-            page_size=100,
-            delay_seconds=3.0,
-            num_retries=3
-        )
-        
-        # 단순한 검색 쿼리 사용 (cs.AI 카테고리만)
-        query = 'cat:cs.AI'
-        
-        print(f"검색 쿼리: {query}")
-        
-        papers = []
-        total_papers = 0
-        max_results = 200  # 최대 200개까지 검색 (3일치면 충분)
-        
-        # 날짜 범위 계산
+        # 대상 날짜 하루(UTC)를 검색 기간으로 사용
         target_start = datetime.datetime.strptime(target_date, '%Y-%m-%d').replace(tzinfo=pytz.UTC)
-        search_start = target_start - datetime.timedelta(days=3)  # 3일 전부터 검색
-        search_end = target_start + datetime.timedelta(days=1)  # 다음 날까지
+        target_end = target_start + datetime.timedelta(days=1)
         
-        print(f"검색 기간: {search_start.strftime('%Y-%m-%d')} ~ {search_end.strftime('%Y-%m-%d')}")
+        windowed = ARXIV_QUERY_MODE == "window"
+        print(f"검색 기간: {target_start.strftime('%Y-%m-%d %H:%M')} ~ {target_end.strftime('%Y-%m-%d %H:%M')} (UTC, {'기간 검색' if windowed else '최신순 탐색'})")
+        print(f"검색 카테고리: {', '.join(ARXIV_CATEGORIES)}")
         
-        # arxiv API 클라이언트 설정
-        search = arxiv.Search(
-            query=query,
-            max_results=max_results,
-            sort_by=arxiv.SortCriterion.SubmittedDate,
-            sort_order=arxiv.SortOrder.Descending
+        # 카테고리별 검색을 동시에 실행하되 arXiv 요청 간격은 하나의 제한기로 관리
+        collector = MultiCategoryCollector(
+            ARXIV_CATEGORIES,
+            get_shared_rate_limiter("arxiv", ARXIV_REQUESTS_PER_MINUTE / 60.0),
+            expected_volume=ARXIV_EXPECTED_DAILY_VOLUME,
+            windowed=windowed
         )
         
-        # 논문 수집
-        try:
-            for paper in client.results(search):
-                try:
-                    # 게시일이 검색 범위를 벗어나면 중단
-                    if paper.published < search_start:
-                        print(f"\n검색 범위를 벗어난 논문 발견: {paper.published}")
-                        break
-                    
-                    total_papers += 1
-                    print(f"\n검색된 논문 ({total_papers}):")
-                    print(f"제목: {paper.title}")
-                    print(f"카테고리: {', '.join(paper.categories)}")
-                    print(f"게시일: {paper.published} (UTC)")
-                    print(f"업데이트일: {paper.updated} (UTC)")
-                    
-                    papers.append(paper)
-                    print("-> 논문 추가")
-                    
-                    # 50개 단위로 진행 상황 출력
-                    if total_papers % 50 == 0:
-                        print(f"\n{total_papers}개 논문 처리 완료")
-                        time.sleep(1)
-                    
-                except Exception as e:
-                    print(f"논문 처리 중 오류 발생: {e}")
-                    continue
-                    
-        except arxiv.UnexpectedEmptyPageError:
-            print(f"\n총 {total_papers}개 논문 검색 완료")
+        state = HarvestState(HARVEST_STATE_PATH, overlap_hours=HARVEST_OVERLAP_HOURS) if incremental else None
+        papers = collector.collect(target_start, target_end, state=state, state_prefix='daily_top10')
+        if state is not None:
+            state.save()
         
-        print(f"\n총 검색된 논문 수: {total_papers}")
+        for category, count in collector.category_counts.items():
+            print(f"  {category}: {count}개")
         
         if not papers:
-            print("논문이 발견되지 않았습니다.")
+            print("경고: 대상 기간 내 논문이 없습니다.")
             return []
         
-        # 대상 날짜의 논문만 필터링
-        filtered_papers = []
-        for paper in papers:
-            if target_start <= paper.published < search_end:
-                filtered_papers.append(paper)
-        
-        if filtered_papers:
-            print(f"대상 기간 내 논문 수: {len(filtered_papers)}")
-            return filtered_papers
-        else:
-            print("대상 기간 내 논문이 없습니다. 최신 논문 20개를 사용합니다.")
-            return papers[:20]  # 최신 논문 20개 반환
+        print(f"대상 기간 내 논문 수: {len(papers)}")
+        return papers
         
     except Exception as e:
         print(f"논문 수집 중 오류 발생: {e}")
-        print(f"오류 상세 정보: {str(e)}")
         import traceback
         print(f"스택 트레이스:\n{traceback.format_exc()}")
         return []
 
-def save_top10(papers: List[Dict], analyzer: PaperQualityAnalyzer):
-    # 논문 품질 점수 계산 및 정렬
-    paper_scores = []
-    for paper in papers:
-        score = analyzer.analyze_paper(paper)
-        paper_scores.append({
-            'rank': 0,
-            'title': paper.title.replace('\n', ' '),
-            'url': paper.entry_id,
-            'score': score,
-            'authors': len(paper.authors),
-            'categories': ', '.join(paper.categories),
-            'published': paper.published.strftime('%Y-%m-%d'),
-            'updated': paper.updated.strftime('%Y-%m-%d'),
-            'abstract': paper.summary.replace('\n', ' ')
-        })
+def score_candidates(papers: List, texts: List[str], analyzer: PaperQualityAnalyzer):
+    """설정된 순위 방식으로 후보 논문의 점수 배열을 계산합니다."""
+    if RANKING_MODE == 'relevance':
+        profiles = load_interest_profiles(INTEREST_PROFILES_PATH)
+        if profiles:
+            print(f"관심사 프로필 {len(profiles)}개({', '.join(profiles)})로 순위를 매깁니다.")
+            return RelevanceRanker(profiles).score(texts)
+        print(f"경고: 관심사 프로필({INTEREST_PROFILES_PATH})이 없어 품질 점수로 순위를 매깁니다.")
+    return BatchQualityScorer(analyzer.quality_indicators, analyzer.keyword_matcher,
+                              analyzer.author_index).score_papers(papers)
+
+def prepare_candidates(papers: Iterable, analyzer: PaperQualityAnalyzer) -> Dict:
+    """후보 논문의 점수 계산, 중복 제거, 공통 Top 10 선정을 한 번만 수행합니다.
+    
+    공통 Top 10과 수신자별 Top 10이 같은 결과를 공유합니다.
+    """
+    # 논문 점수 계산 (RANKING_MODE에 따라 품질 점수 또는 관심사 유사도)
+    papers = list(papers)
+    fields = [paper_fields(paper) for paper in papers]
+    texts = [f"{field['title']} {field['abstract']}" for field in fields]
+    scores = score_candidates(papers, texts, analyzer)
     
-    # 점수로 정렬
-    paper_scores.sort(key=lambda x: x['score'], reverse=True)
+    # 재제출, 교차 게시 등으로 거의 같은 논문은 묶음마다 점수가 가장 높은 한 편만 남김
+    kept = MinHashDeduper(threshold=DEDUPE_THRESHOLD).collapse(texts, scores)
+    if len(kept) < len(papers):
+        print(f"중복으로 판단된 논문 {len(papers) - len(kept)}개를 제외했습니다.")
     
-    # 상위 10개만 선택
-    top10 = paper_scores[:10]
+    # 상위 10개만 유지 (나머지 논문은 행으로 만들지 않음)
+    categories = [field['categories'] for field in fields]
+    if MMR_DIVERSITY > 0:
+        # 한 주제에 몰리지 않도록 이미 고른 논문과 비슷한 논문은 점수를 깎아 가며 선택
+        top_indices = MMRReranker(MMR_DIVERSITY, MMR_CATEGORY_WEIGHT).select(
+            texts, categories, scores, 10, candidates=kept
+        )
+    else:
+        top_indices = [i for _, i in StreamingTopK(10).consume_scored((scores[i], i) for i in kept).results()]
+    return {
+        'papers': papers,
+        'texts': texts,
+        'categories': categories,
+        'author_names': [field['author_names'] for field in fields],
+        'scores': scores,
+        'kept': kept,
+        'top_indices': top_indices
+    }
+
+def save_top10(papers: Iterable, analyzer: PaperQualityAnalyzer, candidates: Optional[Dict] = None):
+    if candidates is None:
+        candidates = prepare_candidates(papers, analyzer)
+    papers, scores = candidates['papers'], candidates['scores']
     
     # 순위 추가
-    for i, paper in enumerate(top10, 1):
-        paper['rank'] = i
+    top10 = [ranking_row(papers[i], scores[i], rank) for rank, i in enumerate(candidates['top_indices'], 1)]
     
     # DataFrame 생성
     df = pd.DataFrame(top10)
@@ -198,6 +181,82 @@ def save_top10(papers: List[Dict], analyzer: PaperQualityAnalyzer):
     
     return top10
 
+def select_personal_top10(candidates: Dict, profiles: Dict[str, Dict]) -> Dict[str, Dict]:
+    """수신자 그룹별 Top 10을 프로필 x 논문 한 번의 행렬 곱으로 고릅니다.
+    
+    관련 논문이 10개보다 적은 그룹은 공통 Top 10 순서로 나머지를 채웁니다.
+    """
+    selections = PersonalizedRanker(profiles, top_k=10).select(
+        candidates['texts'], candidates['categories'],
+        eligible=candidates['kept'], fallback=candidates['top_indices']
+    )
+    papers = candidates['papers']
+    return {
+        name: {
+            'emails': profiles[name].get('emails', []),
+            'papers': [ranking_row(papers[i], score, rank) for rank, (i, score) in enumerate(selected, 1)]
+        }
+        for name, selected in selections.items()
+    }
+
+def analyze_papers(papers: List[Dict]) -> List[Optional[Dict]]:
+    """캐시를 확인한 뒤 나머지 논문을 분석합니다. 실패한 논문의 자리는 None입니다."""
+    # 캐시 확인 (분석 단계별)
+    fingerprints = paper_analyzer.stage_fingerprints()
+    content_keys = [get_content_key(paper) for paper in papers]
+    cached_entries = load_cached_analyses([
+        get_stage_cache_key(stage, content_key, fingerprint)
+        for content_key in content_keys
+        for stage, stage_fingerprints in fingerprints.items()
+        for fingerprint in stage_fingerprints
+    ])
+    
+    analysis_results = [None] * len(papers)
+    pending = []
+    for i, (paper, content_key) in enumerate(zip(papers, content_keys)):
+        cached_stages = {}
+        for stage, stage_fingerprints in fingerprints.items():
+            for fingerprint in stage_fingerprints:
+                entry = cached_entries.get(get_stage_cache_key(stage, content_key, fingerprint))
+                if entry:
+                    cached_stages[stage] = entry
+                    break
+        
+        if len(cached_stages) == len(fingerprints):
+            print(f"캐시된 분석 결과를 사용합니다: {paper['title']}")
+            analysis_results[i] = paper_analyzer.assemble_result(paper, cached_stages)
+        else:
+            if cached_stages:
+                print(f"캐시된 단계({', '.join(cached_stages)})를 제외하고 분석합니다: {paper['title']}")
+            pending.append((i, cached_stages))
+    
+    # 캐시에 없는 논문은 순위를 유지한 채 동시에 분석
+    if pending:
+        print(f"\n{len(pending)}개 논문에 대해 새로운 분석을 수행합니다.")
+        new_results = paper_analyzer.analyze_papers_concurrently(
+            [papers[i] for i, _ in pending],
+            cached_stages=[cached_stages for _, cached_stages in pending]
+        )
+        
+        cache_entries = {}
+        for (i, _), result in zip(pending, new_results):
+            if result is None:
+                continue
+            for stage, entry in paper_analyzer.split_stages(result).items():
+                cache_entries[get_stage_cache_key(stage, content_keys[i], entry['fingerprint'])] = entry
+            analysis_results[i] = result
+        
+        # 캐시에 저장
+        save_cached_analyses(cache_entries)
+    
+    # Add submission_date and html_url to result
+    for paper, result in zip(papers, analysis_results):
+        if result is not None:
+            result['submission_date'] = paper['published']
+            result['html_url'] = paper['url']
+    
+    return analysis_results
+
 def analyze_and_generate_report(papers: List[Dict], target_date: str):
     """논문을 분석하고 보고서를 생성합니다."""
     print("논문 분석 중...")
@@ -206,35 +265,47 @@ def analyze_and_generate_report(papers: List[Dict], target_date: str):
     os.makedirs("data/analysis", exist_ok=True)
     os.makedirs("config", exist_ok=True)
     
+    # 저자 이력 색인: 아직 반영하지 않은 과거 Top 10 기록만 더해서 사용
+    author_index = AuthorIndex(AUTHOR_INDEX_PATH, recency_days=AUTHOR_RECENCY_DAYS)
+    backfilled = author_index.update_from_history('data/daily_top10')
+    if backfilled:
+        print(f"과거 Top 10 기록 {backfilled}개를 저자 색인에 반영했습니다.")
+    
     # Initialize analyzers
-    analyzer = PaperQualityAnalyzer()
+    analyzer = PaperQualityAnalyzer(author_index=author_index)
     
     # Get top 10 papers
-    top10_papers = save_top10(papers, analyzer)
+    candidates = prepare_candidates(papers, analyzer)
+    top10_papers = save_top10(candidates['papers'], analyzer, candidates)
     
-    # Analyze papers
-    analysis_results = []
-    for paper in top10_papers:
-        print(f"\n논문 분석 시작: {paper['title']}")
-        
-        # 캐시 확인
-        paper_hash = get_paper_hash(paper)
-        cached_result = load_cached_analysis(paper_hash)
-        
-        if cached_result:
-            print("캐시된 분석 결과를 사용합니다.")
-            result = cached_result
-        else:
-            print("새로운 분석을 수행합니다.")
-            result = paper_analyzer.analyze_paper(paper)
-            # Add submission_date and html_url to result
-            result['submission_date'] = paper['published']
-            result['html_url'] = paper['url']
-            # 캐시에 저장
-            save_cached_analysis(paper_hash, result)
-        
-        analysis_results.append(result)
-        print(f"분석 완료: {paper['title']}")
+    # 오늘의 후보와 Top 10을 저자 색인에 반영 (점수 계산 뒤에 반영하므로 오늘 논문끼리는 영향 없음)
+    today = datetime.datetime.now(pytz.UTC).date()
+    author_index.record(
+        today.strftime('%Y%m%d'),
+        candidates['author_names'],
+        [paper['author_names'].split('; ') for paper in top10_papers],
+        today
+    )
+    author_index.save()
+    
+    # 수신자 그룹별 Top 10 (프로필이 없으면 모두에게 공통 보고서를 보냄)
+    recipient_profiles = load_interest_profiles(RECIPIENT_PROFILES_PATH)
+    group_reports = select_personal_top10(candidates, recipient_profiles) if recipient_profiles else {}
+    if group_reports:
+        print(f"수신자 그룹 {len(group_reports)}개({', '.join(group_reports)})의 맞춤 Top 10을 선정했습니다.")
+    
+    # 여러 목록에 함께 뽑힌 논문은 한 번만 분석 (LLM 호출은 선정된 논문의 합집합만큼)
+    unique_papers = {}
+    for paper in top10_papers + [paper for report in group_reports.values() for paper in report['papers']]:
+        unique_papers.setdefault(paper['url'], paper)
+    results_by_url = dict(zip(unique_papers, analyze_papers(list(unique_papers.values()))))
+    analysis_results = [results_by_url[paper['url']] for paper in top10_papers]
+    
+    # 분석에 실패한 논문은 보고서에서 제외
+    failed_count = sum(1 for result in analysis_results if result is None)
+    if failed_count:
+        print(f"경고: {failed_count}개 논문의 분석에 실패했습니다.")
+    analysis_results = [result for result in analysis_results if result is not None]
     
     # Save analysis results
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -253,7 +324,17 @@ def analyze_and_generate_report(papers: List[Dict], target_date: str):
     # Send email report
     print("\n이메일 발송 중...")
     email_sender = EmailSender()
-    email_sender.send_report(analysis_results)
+    if group_reports:
+        email_sender.send_personalized_reports(analysis_results, {
+            name: {
+                'emails': report['emails'],
+                'papers': [results_by_url[paper['url']] for paper in report['papers']
+                           if results_by_url[paper['url']] is not None]
+            }
+            for name, report in group_reports.items()
+        })
+    else:
+        email_sender.send_report(analysis_results)
     
     return analysis_results
 
@@ -1,51 +1,240 @@
 import json
-import requests
-from typing import Dict, Any, List
+import hashlib
+import inspect
+from typing import Dict, Any, List, Callable
 import time
-from config import DEEPSEEK_API_KEY, DEEPSEEK_API_URL, ANALYSIS_PROMPTS
+from concurrent.futures import ThreadPoolExecutor
+from config import (
+    DEEPSEEK_API_KEY, DEEPSEEK_API_URL, DEEPSEEK_CONNECT_TIMEOUT, DEEPSEEK_READ_TIMEOUT,
+    DEEPSEEK_MAX_RETRIES, DEEPSEEK_REQUESTS_PER_MINUTE, DEEPSEEK_STREAM,
+    ANALYSIS_PROMPTS, ANALYSIS_MAX_CONCURRENCY, ANALYSIS_MODE,
+    LLM_CACHE_PATH, LLM_CACHE_MAX_ENTRIES
+)
+from services.deepseek_client import DeepSeekClient
+from services.llm_cache import LLMResponseCache
+
+# 모든 분석 요청에 공통으로 사용하는 시스템 프롬프트
+SYSTEM_PROMPT = """You are a helpful AI assistant that analyzes academic papers.
+When analyzing papers:
+1. For classification, provide one main field and 5-8 tags
+2. For summary, structure the content clearly with sections
+3. For translation, maintain academic tone while being clear
+Always format your response according to the specified format in the prompt."""
+
+# 통합 분석(JSON) 응답의 필드별 타입
+COMBINED_RESPONSE_SCHEMA = {
+    "classification": str,
+    "tags": list,
+    "summary": str,
+    "translation": str
+}
+
+# 번역 응답에서 번역문 뒤에 붙는 설명 부분의 시작 문자열
+TRANSLATION_STOP_MARKERS = ("번역 규칙", "---", "번역 특징")
+
+# 초록 번역 프롬프트
+TRANSLATION_PROMPT = """다음은 논문 초록을 한국어로 번역하는 요구사항입니다:
+
+1. 번역 대상: 다음 영문 초록을 한국어로 번역해주세요.
+2. 번역 규칙:
+   - 모든 전문 용어는 원문(영어)을 병기하고 <strong>태그로 강조 표시합니다. (예: 분리 배치 정규화(<strong>Separated Batch Normalization, SeBN</strong>))
+   - 의미 단위로 개행해 가독성을 높입니다.
+   - '-입니다' 체계를 유지하며 자연스러운 전문성을 확보합니다.
+   - 모델명, 기술, 성능 지표 등은 <strong>태그로 굵게 표시해 시각적 강조를 적용합니다.
+
+영문 초록:
+{abstract}
+
+한국어 번역:"""
+
+# 분석 단계
+ANALYSIS_STAGES = ("translation", "classification", "summary")
+
+# 호출 방식별 모델 설정
+STAGE_SETTINGS = {
+    "translation": {"model": "deepseek-chat", "temperature": 0.7, "max_tokens": 2000},
+    "classification": {"model": "deepseek-reasoner", "temperature": 0.7, "max_tokens": 2000},
+    "summary": {"model": "deepseek-reasoner", "temperature": 0.7, "max_tokens": 2000},
+    "combined": {"model": "deepseek-chat", "temperature": 0.7, "max_tokens": 4000}
+}
+
+def _fingerprint(*parts: Any) -> str:
+    """프롬프트, 설정, 후처리 함수의 소스 코드로부터 지문을 계산합니다."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if callable(part):
+            try:
+                part = inspect.getsource(part)
+            except (OSError, TypeError):
+                part = part.__qualname__
+        digest.update(json.dumps(part, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
 
 class PaperAnalyzer:
     def __init__(self):
         if not DEEPSEEK_API_KEY:
             raise ValueError("DEEPSEEK_API_KEY 환경 변수가 설정되지 않았습니다.")
             
-        self.headers = {
-            "Authorization": f"Bearer {DEEPSEEK_API_KEY}",
-            "Content-Type": "application/json"
-        }
+        self.client = DeepSeekClient(
+            DEEPSEEK_API_KEY,
+            DEEPSEEK_API_URL,
+            connect_timeout=DEEPSEEK_CONNECT_TIMEOUT,
+            read_timeout=DEEPSEEK_READ_TIMEOUT,
+            max_retries=DEEPSEEK_MAX_RETRIES,
+            pool_size=ANALYSIS_MAX_CONCURRENCY,
+            requests_per_minute=DEEPSEEK_REQUESTS_PER_MINUTE
+        )
+        self.analysis_mode = ANALYSIS_MODE
+        self.stream = DEEPSEEK_STREAM
+        self.response_cache = LLMResponseCache(max_entries=LLM_CACHE_MAX_ENTRIES, path=LLM_CACHE_PATH)
+        self._fingerprints = self._compute_fingerprints()
     
-    def _call_api(self, prompt: str, model: str = "deepseek-chat") -> str:
-        """DeepSeek API를 호출하여 응답을 받아옵니다."""
+    def _call_api(self, prompt: str, model: str = "deepseek-chat", max_tokens: int = 2000,
+                  temperature: float = 0.7, response_format: Dict[str, Any] = None,
+                  on_chunk: Callable[[str], None] = None, stop_markers: tuple = (),
+                  validate: Callable[[str], Any] = None) -> str:
+        """DeepSeek API를 호출하여 응답을 받아옵니다.
+        
+        스트리밍 모드에서는 조각마다 on_chunk를 호출하고, stop_markers가 나타나면
+        나머지 생성을 기다리지 않고 응답을 끝냅니다.
+        같은 요청에 대한 응답은 캐시에서 바로 반환합니다.
+        validate를 주면 검증을 통과한 응답만 캐시에 저장하며(실패하면 예외를 그대로 전달),
+        캐시에 남아 있던 응답이 검증에 실패하면 지우고 다시 호출합니다.
+        """
+        cache_key = LLMResponseCache.make_key(
+            model, SYSTEM_PROMPT, prompt, temperature, max_tokens,
+            response_format=response_format,
+            stop_markers=list(stop_markers) if self.stream else None
+        )
+        cached = self.response_cache.get(cache_key)
+        if cached is not None and validate is not None:
+            try:
+                validate(cached)
+            except ValueError:
+                self.response_cache.discard(cache_key)
+                cached = None
+        if cached is not None:
+            if on_chunk:
+                on_chunk(cached)
+            return cached
+        
+        payload = {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+        if response_format:
+            payload["response_format"] = response_format
+        
         try:
-            response = requests.post(
-                DEEPSEEK_API_URL,
-                headers={
-                    "Authorization": f"Bearer {DEEPSEEK_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": """You are a helpful AI assistant that analyzes academic papers.
-When analyzing papers:
-1. For classification, provide one main field and 5-8 tags
-2. For summary, structure the content clearly with sections
-3. For translation, maintain academic tone while being clear
-Always format your response according to the specified format in the prompt."""
-                        },
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.7,
-                    "max_tokens": 2000
-                }
-            )
-            response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"].strip()
+            if self.stream:
+                content = self.client.stream_chat_completion(
+                    payload,
+                    on_chunk=on_chunk,
+                    stop_markers=stop_markers
+                ).strip()
+            else:
+                response = self.client.chat_completion(payload)
+                content = response["choices"][0]["message"]["content"].strip()
         except Exception as e:
             print(f"API 호출 중 오류 발생: {str(e)}")
             raise
+        
+        if content:
+            if validate is not None:
+                validate(content)
+            self.response_cache.put(cache_key, content)
+        return content
+    
+    def _compute_fingerprints(self) -> Dict[str, Dict[str, str]]:
+        """호출 방식별, 단계별 파이프라인 지문을 계산합니다."""
+        separate = {
+            "translation": _fingerprint(
+                SYSTEM_PROMPT, TRANSLATION_PROMPT, STAGE_SETTINGS["translation"],
+                TRANSLATION_STOP_MARKERS, self._strip_translation_extras
+            ),
+            "classification": _fingerprint(
+                SYSTEM_PROMPT, ANALYSIS_PROMPTS["classification"], STAGE_SETTINGS["classification"],
+                self._parse_classification, self._normalize_tags
+            ),
+            "summary": _fingerprint(
+                SYSTEM_PROMPT, ANALYSIS_PROMPTS["summary"], STAGE_SETTINGS["summary"],
+                self._clean_response
+            )
+        }
+        
+        # 통합 호출은 하나의 프롬프트를 공유하므로 단계별로는 후처리 코드만 다름
+        combined_parts = (
+            SYSTEM_PROMPT, ANALYSIS_PROMPTS["combined"], STAGE_SETTINGS["combined"],
+            list(COMBINED_RESPONSE_SCHEMA), self._parse_combined_response
+        )
+        combined = {
+            "translation": _fingerprint(*combined_parts, self._strip_translation_extras),
+            "classification": _fingerprint(*combined_parts, self._normalize_tags),
+            "summary": _fingerprint(*combined_parts, self._clean_response)
+        }
+        
+        return {"separate": separate, "combined": combined}
+    
+    def stage_fingerprints(self) -> Dict[str, List[str]]:
+        """분석 단계별 파이프라인 지문 후보를 반환합니다.
+        
+        현재 분석 모드에서 사용하는 호출 방식의 지문이 먼저 오며,
+        다른 방식으로 만들어진 결과도 재사용할 수 있도록 함께 반환합니다.
+        """
+        if self.analysis_mode == "combined":
+            order = ("combined", "separate")
+        else:
+            order = ("separate", "combined")
+        return {stage: [self._fingerprints[mode][stage] for mode in order] for stage in ANALYSIS_STAGES}
+    
+    def flush_cache(self):
+        """LLM 응답 캐시를 파일에 저장하고 적중 통계를 출력합니다."""
+        self.response_cache.flush()
+        stats = self.response_cache.stats()
+        print(f"LLM 응답 캐시: 적중 {stats['hits']}회, 미스 {stats['misses']}회 (적중률 {stats['hit_rate']:.0%})")
+    
+    def _parse_combined_response(self, response: str) -> Dict[str, Any]:
+        """통합 분석 JSON 응답을 스키마에 맞춰 파싱합니다.
+        
+        JSON 형식이 아니거나 필드가 스키마와 맞지 않으면 ValueError를 발생시킵니다.
+        """
+        text = response.strip()
+        # 코드 블록으로 감싸진 응답 처리
+        if text.startswith('```'):
+            text = text.strip('`').strip()
+            if text.startswith('json'):
+                text = text[len('json'):]
+        
+        data = json.loads(text)
+        if not isinstance(data, dict):
+            raise ValueError("통합 분석 응답이 JSON 객체가 아닙니다.")
+        
+        parsed = {}
+        for field, field_type in COMBINED_RESPONSE_SCHEMA.items():
+            value = data.get(field)
+            if not isinstance(value, field_type):
+                raise ValueError(f"통합 분석 응답의 '{field}' 필드가 올바르지 않습니다.")
+            parsed[field] = value
+        
+        if not parsed["classification"].strip():
+            raise ValueError("통합 분석 응답에 분류가 없습니다.")
+        if not all(isinstance(tag, str) for tag in parsed["tags"]):
+            raise ValueError("통합 분석 응답의 태그가 문자열 목록이 아닙니다.")
+        if not parsed["summary"].strip() or not parsed["translation"].strip():
+            raise ValueError("통합 분석 응답에 요약 또는 번역이 없습니다.")
+        
+        return {
+            "classification": parsed["classification"].strip().strip('[]').strip(),
+            "tags": self._normalize_tags(parsed["classification"], parsed["tags"]),
+            "summary": parsed["summary"],
+            "translation": parsed["translation"]
+        }
     
     def _parse_classification(self, response: str) -> Dict[str, Any]:
         """분류 응답을 파싱합니다."""
@@ -74,6 +263,16 @@ Always format your response according to the specified format in the prompt."""
                 # 빈 태그 제거
                 tags = [tag for tag in tags if tag]
         
+        return {
+            "classification": classification,
+            "tags": self._normalize_tags(classification, tags)
+        }
+    
+    def _normalize_tags(self, classification: str, tags: List[str]) -> List[str]:
+        """태그를 정리하고, 부족하면 분류에 맞는 기본 태그로 보완합니다."""
+        tags = [tag.strip().strip('[]').strip() for tag in tags]
+        tags = [tag for tag in tags if tag]
+        
         # 태그가 없거나 3개 미만이면 기본 태그 생성
         if not tags or len(tags) < 3:
             if '컴퓨터 비전' in classification:
@@ -86,10 +285,7 @@ Always format your response according to the specified format in the prompt."""
         # 백엔드 관련 태그 제거
         tags = [tag for tag in tags if not any(x in tag.lower() for x in ['backend', 'api', 'server', 'database'])]
         
-        return {
-            "classification": classification,
-            "tags": tags
-        }
+        return tags
     
     def _clean_response(self, text: str) -> str:
         """응답을 HTML 형식으로 변환하고 정리합니다."""
@@ -143,87 +339,145 @@ Always format your response according to the specified format in the prompt."""
         """초록을 한국어로 번역합니다."""
         print("한국어 번역 중...")
         
-        prompt = f"""다음은 논문 초록을 한국어로 번역하는 요구사항입니다:
-
-1. 번역 대상: 다음 영문 초록을 한국어로 번역해주세요.
-2. 번역 규칙:
-   - 모든 전문 용어는 원문(영어)을 병기하고 <strong>태그로 강조 표시합니다. (예: 분리 배치 정규화(<strong>Separated Batch Normalization, SeBN</strong>))
-   - 의미 단위로 개행해 가독성을 높입니다.
-   - '-입니다' 체계를 유지하며 자연스러운 전문성을 확보합니다.
-   - 모델명, 기술, 성능 지표 등은 <strong>태그로 굵게 표시해 시각적 강조를 적용합니다.
-
-영문 초록:
-{abstract}
-
-한국어 번역:"""
+        prompt = TRANSLATION_PROMPT.format(abstract=abstract)
         
-        response = self._call_api(prompt, model="deepseek-chat")
-        
-        # 번역 규칙 부분 제거
-        if "번역 규칙" in response:
-            response = response.split("번역 규칙")[0].strip()
-            
-        # '---' 이후의 내용 제거
-        if "---" in response:
-            response = response.split("---")[0].strip()
-            
-        # '번역 특징' 부분 제거
-        if "번역 특징" in response:
-            response = response.split("번역 특징")[0].strip()
+        response = self._call_api(prompt, stop_markers=TRANSLATION_STOP_MARKERS, **STAGE_SETTINGS["translation"])
+        response = self._strip_translation_extras(response)
         
         print("번역 완료")
         return response
+    
+    def _strip_translation_extras(self, response: str) -> str:
+        """번역 응답에서 번역문 이외의 설명 부분을 제거합니다."""
+        # 번역 규칙, '---' 구분선, 번역 특징 이후의 내용 제거
+        for marker in TRANSLATION_STOP_MARKERS:
+            if marker in response:
+                response = response.split(marker)[0].strip()
+        
+        return response
 
-    def _analyze_paper_content(self, title: str, abstract: str) -> Dict[str, Any]:
-        """논문 내용을 분석합니다."""
-        # 분류 및 태그 생성
+    def _classify_paper(self, title: str, abstract: str) -> Dict[str, Any]:
+        """논문의 분류와 태그를 생성합니다."""
         classification_response = self._call_api(
             ANALYSIS_PROMPTS["classification"].format(
                 title=title,
                 abstract=abstract
             ),
-            model="deepseek-reasoner"
+            **STAGE_SETTINGS["classification"]
         )
-        classification_result = self._parse_classification(classification_response)
-        
-        # 요약 생성
+        return self._parse_classification(classification_response)
+    
+    def _summarize_paper(self, title: str, abstract: str) -> str:
+        """논문 요약을 생성합니다."""
         summary_response = self._call_api(
             ANALYSIS_PROMPTS["summary"].format(
                 title=title,
                 abstract=abstract
             ),
-            model="deepseek-reasoner"
+            **STAGE_SETTINGS["summary"]
         )
-        summary = self._clean_response(summary_response)
-        
+        return self._clean_response(summary_response)
+    
+    def _combine_content(self, classification_result: Dict[str, Any], summary: str) -> Dict[str, Any]:
+        """분류 결과와 요약을 하나의 분석 결과로 합칩니다."""
         return {
             "classification": classification_result["classification"],
             "tags": list(set(classification_result["tags"])),
             "summary": summary
         }
-    
-    def analyze_paper(self, paper: Dict[str, Any]) -> Dict[str, Any]:
-        """논문을 분석하고 결과를 반환합니다."""
-        print(f"\n논문 분석 시작: {paper['title']}")
-        
-        # 번역 생성
-        print("한국어 번역 중...")
-        translation = self._translate_abstract(paper["abstract"])
-        print("번역 완료")
-        
-        # 논문 내용 분석
-        print("논문 내용 분석 중...")
-        analysis_result = self._analyze_paper_content(paper["title"], paper["abstract"])
-        print("분석 완료")
-        
-        # 결과 반환
-        result = {
+
+    def _build_result(self, paper: Dict[str, Any], analysis_result: Dict[str, Any], translation: str) -> Dict[str, Any]:
+        """분석 결과를 반환 형식으로 구성합니다."""
+        return {
             "paper_id": paper["url"],
             "title": paper["title"],
             **analysis_result,
             "translation": translation,
             "original_abstract": paper["abstract"]
         }
+    
+    def _run_stage(self, stage: str, paper: Dict[str, Any]) -> Dict[str, Any]:
+        """분석 단계 하나를 개별 호출로 실행하고, 결과를 지문과 함께 반환합니다."""
+        if stage == "translation":
+            value = self._translate_abstract(paper["abstract"])
+        elif stage == "classification":
+            value = self._classify_paper(paper["title"], paper["abstract"])
+        else:
+            value = self._summarize_paper(paper["title"], paper["abstract"])
+        
+        return {"fingerprint": self._fingerprints["separate"][stage], "value": value}
+    
+    def _analyze_paper_combined(self, paper: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """한 번의 JSON 응답으로 분류, 태그, 요약, 번역을 모두 생성합니다."""
+        response = self._call_api(
+            ANALYSIS_PROMPTS["combined"].format(
+                title=paper["title"],
+                abstract=paper["abstract"]
+            ),
+            response_format={"type": "json_object"},
+            validate=self._parse_combined_response,
+            **STAGE_SETTINGS["combined"]
+        )
+        parsed = self._parse_combined_response(response)
+        
+        values = {
+            "translation": self._strip_translation_extras(parsed["translation"]),
+            "classification": {"classification": parsed["classification"], "tags": parsed["tags"]},
+            "summary": self._clean_response(parsed["summary"])
+        }
+        return {
+            stage: {"fingerprint": self._fingerprints["combined"][stage], "value": value}
+            for stage, value in values.items()
+        }
+    
+    def assemble_result(self, paper: Dict[str, Any], stages: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """단계별 결과를 하나의 분석 결과로 구성합니다."""
+        analysis_result = self._combine_content(stages["classification"]["value"], stages["summary"]["value"])
+        result = self._build_result(paper, analysis_result, stages["translation"]["value"])
+        # 각 단계를 만든 파이프라인 지문 (단계별 캐시 키에 사용)
+        result["analysis_stages"] = {stage: stages[stage]["fingerprint"] for stage in ANALYSIS_STAGES}
+        return result
+    
+    def split_stages(self, result: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """분석 결과를 단계별 캐시 항목으로 나눕니다."""
+        values = {
+            "translation": result["translation"],
+            "classification": {"classification": result["classification"], "tags": result["tags"]},
+            "summary": result["summary"]
+        }
+        return {
+            stage: {"fingerprint": result["analysis_stages"][stage], "value": values[stage]}
+            for stage in ANALYSIS_STAGES
+        }
+    
+    def _use_combined(self, missing: List[str]) -> bool:
+        """남은 단계를 한 번의 통합 호출로 처리할지 결정합니다."""
+        return self.analysis_mode == "combined" and len(missing) > 1
+    
+    def analyze_paper(self, paper: Dict[str, Any], cached_stages: Dict[str, Dict[str, Any]] = None) -> Dict[str, Any]:
+        """논문을 분석하고 결과를 반환합니다.
+        
+        cached_stages에 있는 단계는 다시 호출하지 않고 그대로 사용합니다.
+        """
+        print(f"\n논문 분석 시작: {paper['title']}")
+        
+        stages = dict(cached_stages or {})
+        missing = [stage for stage in ANALYSIS_STAGES if stage not in stages]
+        
+        if self._use_combined(missing):
+            try:
+                combined = self._analyze_paper_combined(paper)
+                stages.update({stage: combined[stage] for stage in missing})
+                missing = []
+            except ValueError as e:
+                # JSON 응답이 올바르지 않으면 개별 호출 방식으로 전환
+                print(f"통합 분석 응답이 올바르지 않아 개별 분석으로 전환합니다: {str(e)}")
+        
+        for stage in missing:
+            stages[stage] = self._run_stage(stage, paper)
+        
+        result = self.assemble_result(paper, stages)
+        self.response_cache.flush()
         
         print(f"논문 분석 완료: {paper['title']}")
         return result
@@ -234,4 +488,51 @@ Always format your response according to the specified format in the prompt."""
         for paper in papers:
             result = self.analyze_paper(paper)
             results.append(result)
-        return results 
\ No newline at end of file
+        return results
+    
+    def analyze_papers_concurrently(self, papers: list, max_concurrency: int = None, cached_stages: list = None) -> list:
+        """여러 논문을 동시에 분석합니다.
+        
+        모든 논문의 번역, 분류, 요약 호출을 하나의 스레드 풀에서 병렬로 실행하며
+        동시에 진행되는 API 호출 수는 max_concurrency로 제한됩니다.
+        결과는 입력 순서를 유지하고, 분석에 실패한 논문의 자리는 None으로 채워집니다.
+        cached_stages를 주면 논문별로 이미 캐시된 단계는 건너뜁니다.
+        """
+        max_concurrency = max_concurrency or ANALYSIS_MAX_CONCURRENCY
+        cached_stages = cached_stages or [None] * len(papers)
+        results = []
+        
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            # 논문 순서대로 작업을 제출해 상위 논문의 결과가 먼저 완성되도록 합니다
+            jobs = [self._submit_paper(executor, paper, stages) for paper, stages in zip(papers, cached_stages)]
+            
+            for paper, collect in zip(papers, jobs):
+                try:
+                    results.append(collect())
+                except Exception as e:
+                    # 한 논문의 실패가 다른 논문의 분석을 중단시키지 않도록 합니다
+                    print(f"논문 분석 실패: {paper['title']} ({str(e)})")
+                    results.append(None)
+        
+        self.flush_cache()
+        return results
+    
+    def _submit_paper(self, executor: ThreadPoolExecutor, paper: Dict[str, Any],
+                      cached_stages: Dict[str, Dict[str, Any]] = None) -> Callable[[], Dict[str, Any]]:
+        """논문 분석 작업을 스레드 풀에 제출하고, 결과를 모으는 함수를 반환합니다."""
+        stages = dict(cached_stages or {})
+        missing = [stage for stage in ANALYSIS_STAGES if stage not in stages]
+        
+        if self._use_combined(missing):
+            # 논문당 한 번의 호출이면 충분하므로 논문 단위로 제출합니다
+            return executor.submit(self.analyze_paper, paper, stages).result
+        
+        futures = {stage: executor.submit(self._run_stage, stage, paper) for stage in missing}
+        
+        def collect() -> Dict[str, Any]:
+            stages.update({stage: future.result() for stage, future in futures.items()})
+            result = self.assemble_result(paper, stages)
+            print(f"논문 분석 완료: {paper['title']}")
+            return result
+        
+        return collect
@@ -1,13 +1,91 @@
 import arxiv
 import datetime
-from typing import List, Dict
+import heapq
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 import pytz
-import time
 import os
+from services.arxiv_search import iter_window_papers, page_size_for
+from services.harvest_state import HarvestState
+from services.keyword_matcher import KeywordMatcher
+from services.author_index import AUTHOR_REPUTATION_MAX, AuthorIndex
+from config import ARXIV_EXPECTED_DAILY_VOLUME, HARVEST_STATE_PATH, HARVEST_OVERLAP_HOURS
+
+METHOD_KEYWORDS = ['method', 'approach', 'algorithm', 'technique', 'framework', 'model', 'architecture']
+EVAL_KEYWORDS = ['experiment', 'evaluation', 'result', 'performance', 'benchmark', 'comparison']
+
+# 내용 점수용 키워드 그룹과 그룹별 (키워드당 점수, 최대 점수)
+CONTENT_LEXICON = {'method': METHOD_KEYWORDS, 'eval': EVAL_KEYWORDS}
+CONTENT_WEIGHTS = {'method': (0.2, 0.6), 'eval': (0.2, 0.4)}
+DEFAULT_CONTENT_MATCHER = KeywordMatcher(CONTENT_LEXICON)
+
+# 세부 점수별 최대값 (가중합을 0~1 범위로 맞추는 데 사용)
+# 저자 점수는 저자 수/정보 완성도(최대 1.5)에 저자 이력 점수가 더해짐
+SUBSCORE_MAX = {
+    'author_metrics': 1.5 + AUTHOR_REPUTATION_MAX,
+    'paper_metrics': 2.3,
+    'time_metrics': 1.0,
+    'content_metrics': 1.0
+}
+
+def _author_name(author) -> str:
+    if isinstance(author, str):
+        return author.strip()
+    if isinstance(author, dict):
+        return author.get('name') or ''
+    return getattr(author, 'name', None) or ''
+
+def _as_list(value) -> List:
+    # 수집기에 따라 저자/카테고리가 쉼표로 구분된 문자열로 오는 경우가 있음
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(',') if item.strip()]
+    return list(value)
+
+def _as_utc(value):
+    if value is None or pd.isna(value):
+        return None
+    value = pd.Timestamp(value)
+    return value.tz_localize('UTC') if value.tzinfo is None else value.tz_convert('UTC')
+
+def paper_fields(paper) -> Dict:
+    """arxiv.Result 객체와 dict 형식의 논문을 같은 필드 구성으로 변환합니다."""
+    if isinstance(paper, dict):
+        published = paper.get('published') or paper.get('submission_date')
+        updated = paper.get('updated') or published
+        title = paper.get('title') or ''
+        abstract = paper.get('abstract') or paper.get('summary') or ''
+        authors = _as_list(paper.get('authors'))
+        categories = _as_list(paper.get('categories'))
+    else:
+        published = paper.published
+        updated = paper.updated
+        title = paper.title or ''
+        abstract = paper.summary or ''
+        authors = list(paper.authors)
+        categories = list(paper.categories)
+    names = [_author_name(author) for author in authors]
+    return {
+        'title': title,
+        'abstract': abstract,
+        'author_count': len(authors),
+        'named_authors': sum(1 for name in names if name),
+        'author_names': [name for name in names if name],
+        'category_count': len(categories),
+        'categories': categories,
+        'published': _as_utc(published),
+        'updated': _as_utc(updated)
+    }
 
 class PaperQualityAnalyzer:
-    def __init__(self):
+    def __init__(self, content_lexicon: Dict[str, List[str]] = None, author_index: AuthorIndex = None):
+        # 키워드 매처는 어휘 목록마다 한 번만 컴파일
+        self.keyword_matcher = KeywordMatcher(content_lexicon) if content_lexicon else DEFAULT_CONTENT_MATCHER
+        # 저자 이력 조회 테이블 (없으면 이력 점수 0)
+        self.author_index = author_index
         self.quality_indicators = {
             'author_metrics': 0.3,    # 저자 관련 지표
             'paper_metrics': 0.3,     # 논문 특성 지표
@@ -15,41 +93,34 @@ class PaperQualityAnalyzer:
             'content_metrics': 0.2    # 내용 관련 지표
         }
     
-    def analyze_paper(self, paper: Dict) -> float:
-        """논문의 품질 점수를 계산합니다."""
+    def analyze_paper(self, paper, now: datetime.datetime = None) -> float:
+        """논문의 품질 점수(0~1)를 계산합니다.
+        
+        네 가지 세부 점수를 최대값으로 나눈 뒤 quality_indicators 가중치로 합산합니다.
+        arxiv.Result 객체와 dict를 모두 받습니다.
+        """
         try:
+            now = _as_utc(now or datetime.datetime.now(pytz.UTC))
+            subscores = {
+                'author_metrics': self._calculate_author_score(paper, now),
+                'paper_metrics': self._calculate_paper_score(paper),
+                'time_metrics': self._calculate_time_score(paper, now),
+                'content_metrics': self._calculate_content_score(paper)
+            }
             score = 0.0
-            
-            # 제목 분석
-            title = paper.get('title', '')
-            if len(title) > 0:
-                score += 0.2
-            
-            # 저자 수 분석
-            authors = paper.get('authors', [])
-            if len(authors) >= 2:
-                score += 0.2
-            
-            # 카테고리 분석
-            categories = paper.get('categories', [])
-            if len(categories) >= 1:
-                score += 0.2
-            
-            # 초록 분석
-            abstract = paper.get('abstract', '')
-            if len(abstract) > 100:
-                score += 0.4
-            
-            return min(score, 1.0)
+            for name, weight in self.quality_indicators.items():
+                score += weight * (subscores[name] / SUBSCORE_MAX[name])
+            return score
             
         except Exception as e:
             print(f"논문 품질 분석 중 오류 발생: {e}")
             return 0.0
     
-    def _calculate_author_score(self, paper) -> float:
+    def _calculate_author_score(self, paper, now: datetime.datetime = None) -> float:
+        fields = paper_fields(paper)
         score = 0
         # 저자 수 평가 (1-5명이 최적)
-        author_count = len(paper.authors)
+        author_count = fields['author_count']
         if 1 <= author_count <= 3:
             score += 1.0
         elif 4 <= author_count <= 5:
@@ -60,17 +131,23 @@ class PaperQualityAnalyzer:
             score += 0.3
             
         # 저자 정보 완성도
-        if all(hasattr(author, 'name') for author in paper.authors):
+        if fields['named_authors'] == author_count:
             score += 0.5
-        elif any(hasattr(author, 'name') for author in paper.authors):
+        elif fields['named_authors'] > 0:
             score += 0.3
+        
+        # 저자 이력 (과거 Top 10 선정 횟수와 최근성)
+        if self.author_index is not None:
+            today = _as_utc(now or datetime.datetime.now(pytz.UTC)).toordinal()
+            score += self.author_index.paper_reputation(fields['author_names'], today)
             
         return score
     
     def _calculate_paper_score(self, paper) -> float:
+        fields = paper_fields(paper)
         score = 0
         # 제목 품질 평가
-        title_words = paper.title.split()
+        title_words = fields['title'].split()
         title_length = len(title_words)
         if 5 <= title_length <= 10:
             score += 0.8
@@ -84,7 +161,7 @@ class PaperQualityAnalyzer:
             score += 0.2
             
         # 초록 품질 평가
-        abstract_words = paper.summary.split()
+        abstract_words = fields['abstract'].split()
         abstract_length = len(abstract_words)
         if abstract_length >= 200:
             score += 0.8
@@ -94,7 +171,7 @@ class PaperQualityAnalyzer:
             score += 0.4
             
         # 카테고리 다양성
-        category_count = len(paper.categories)
+        category_count = fields['category_count']
         if category_count >= 3:
             score += 0.5
         elif category_count == 2:
@@ -104,24 +181,26 @@ class PaperQualityAnalyzer:
             
         return score
     
-    def _calculate_time_score(self, paper) -> float:
+    def _calculate_time_score(self, paper, now: datetime.datetime = None) -> float:
+        fields = paper_fields(paper)
         score = 0
-        current_time = datetime.datetime.now(pytz.UTC)
+        current_time = _as_utc(now or datetime.datetime.now(pytz.UTC))
+        published, updated = fields['published'], fields['updated']
         
-        # 최근성 평가
-        time_diff = current_time - paper.updated
-        if time_diff.days <= 1:
+        # 최근성 평가 (날짜를 모르면 가장 낮은 점수)
+        days = (current_time - updated).days if updated is not None else None
+        if days is not None and days <= 1:
             score += 0.5
-        elif time_diff.days <= 3:
+        elif days is not None and days <= 3:
             score += 0.4
-        elif time_diff.days <= 5:
+        elif days is not None and days <= 5:
             score += 0.3
         else:
             score += 0.2
             
         # 버전 관리 평가
-        if paper.published != paper.updated:
-            update_diff = paper.updated - paper.published
+        if published is not None and updated is not None and published != updated:
+            update_diff = updated - published
             if update_diff.days <= 3:
                 score += 0.5
             else:
@@ -131,81 +210,226 @@ class PaperQualityAnalyzer:
     
     def _calculate_content_score(self, paper) -> float:
         score = 0
-        abstract = paper.summary.lower()
+        counts = self.keyword_matcher.counts(paper_fields(paper)['abstract'])
         
-        # 방법론 언급 평가
-        method_keywords = ['method', 'approach', 'algorithm', 'technique', 'framework', 'model', 'architecture']
-        method_count = sum(1 for keyword in method_keywords if keyword in abstract)
-        score += min(method_count * 0.2, 0.6)  # 최대 0.6점
+        # 방법론(최대 0.6점), 실험/평가(최대 0.4점) 언급 평가
+        for group, (per_keyword, cap) in CONTENT_WEIGHTS.items():
+            score += min(counts.get(group, 0) * per_keyword, cap)
         
-        # 실험/평가 언급 평가
-        eval_keywords = ['experiment', 'evaluation', 'result', 'performance', 'benchmark', 'comparison']
-        eval_count = sum(1 for keyword in eval_keywords if keyword in abstract)
-        score += min(eval_count * 0.2, 0.4)  # 최대 0.4점
+        return score
+
+class BatchQualityScorer:
+    """PaperQualityAnalyzer와 같은 점수를 열 단위(NumPy/pandas) 연산으로 한 번에 계산합니다.
+    
+    논문 목록뿐 아니라 paper_fields() 열 구성을 가진 DataFrame도 받으므로
+    저장된 기록 전체(수만~수십만 편)를 다시 순위 매길 때도 사용할 수 있습니다.
+    """
+    
+    def __init__(self, quality_indicators: Dict[str, float] = None, keyword_matcher: KeywordMatcher = None,
+                 author_index: AuthorIndex = None):
+        self.quality_indicators = quality_indicators or PaperQualityAnalyzer().quality_indicators
+        self.keyword_matcher = keyword_matcher or DEFAULT_CONTENT_MATCHER
+        self.author_index = author_index
+    
+    @staticmethod
+    def to_frame(papers) -> pd.DataFrame:
+        """논문 목록을 점수 계산용 열(DataFrame)로 변환합니다."""
+        frame = pd.DataFrame([paper_fields(paper) for paper in papers],
+                             columns=['title', 'abstract', 'author_count', 'named_authors',
+                                      'author_names', 'category_count', 'published', 'updated'])
+        frame['published'] = pd.to_datetime(frame['published'], utc=True)
+        frame['updated'] = pd.to_datetime(frame['updated'], utc=True)
+        return frame
+    
+    def score_papers(self, papers, now: datetime.datetime = None) -> np.ndarray:
+        return self.score_frame(self.to_frame(papers), now)
+    
+    def score_frame(self, frame: pd.DataFrame, now: datetime.datetime = None) -> np.ndarray:
+        """논문별 품질 점수 배열을 반환합니다 (입력 행 순서 유지)."""
+        frame = frame.reset_index(drop=True)
+        now = _as_utc(now or datetime.datetime.now(pytz.UTC))
+        subscores = {
+            'author_metrics': self._author_scores(frame, now),
+            'paper_metrics': self._paper_scores(frame),
+            'time_metrics': self._time_scores(frame, now),
+            'content_metrics': self._content_scores(frame)
+        }
+        score = np.zeros(len(frame))
+        for name, weight in self.quality_indicators.items():
+            score += weight * (subscores[name] / SUBSCORE_MAX[name])
+        return score
+    
+    def _author_scores(self, frame: pd.DataFrame, now: pd.Timestamp) -> np.ndarray:
+        count = frame['author_count'].to_numpy()
+        named = frame['named_authors'].to_numpy()
+        score = np.select(
+            [(count >= 1) & (count <= 3), (count >= 4) & (count <= 5), (count >= 6) & (count <= 8)],
+            [1.0, 0.8, 0.5], default=0.3
+        )
+        score = score + np.select([named == count, named > 0], [0.5, 0.3], default=0.0)
         
+        # 저자 이력: 논문마다 저자 수만큼만 조회 테이블을 찾음 (저자 이름 열이 없으면 0)
+        if self.author_index is not None and 'author_names' in frame:
+            today = now.toordinal()
+            reputation = np.fromiter(
+                (self.author_index.paper_reputation(names if isinstance(names, list) else [], today)
+                 for names in frame['author_names']),
+                dtype=float, count=len(frame)
+            )
+            score = score + reputation
         return score
+    
+    def _paper_scores(self, frame: pd.DataFrame) -> np.ndarray:
+        # 단어 분리는 pandas .str 연산보다 str.split()을 한 번 도는 편이 빠르고 스칼라 경로와 결과가 같음
+        title_words = [title.split() for title in frame['title'].fillna('')]
+        title_length = np.fromiter(map(len, title_words), dtype=int, count=len(frame))
+        score = np.select(
+            [(title_length >= 5) & (title_length <= 10), (title_length >= 11) & (title_length <= 15)],
+            [0.8, 0.6], default=0.4
+        )
+        
+        # 대문자로 시작하는 단어가 있는지
+        has_upper = np.fromiter((any(word[0].isupper() for word in words) for words in title_words),
+                                dtype=bool, count=len(frame))
+        score = score + np.where(has_upper, 0.2, 0.0)
+        
+        abstract_length = np.fromiter((len(text.split()) for text in frame['abstract'].fillna('')),
+                                      dtype=int, count=len(frame))
+        score = score + np.select([abstract_length >= 200, abstract_length >= 100], [0.8, 0.6], default=0.4)
+        
+        category_count = frame['category_count'].to_numpy()
+        return score + np.select([category_count >= 3, category_count == 2], [0.5, 0.3], default=0.1)
+    
+    def _time_scores(self, frame: pd.DataFrame, now: pd.Timestamp) -> np.ndarray:
+        published = pd.to_datetime(frame['published'], utc=True)
+        updated = pd.to_datetime(frame['updated'], utc=True)
+        
+        # timedelta.days와 같이 내림한 일 수 (날짜가 없으면 NaN)
+        days = ((now - updated) // pd.Timedelta(days=1)).to_numpy(dtype=float)
+        score = np.select([days <= 1, days <= 3, days <= 5], [0.5, 0.4, 0.3], default=0.2)
+        
+        revised = (published.notna() & updated.notna() & (published != updated)).to_numpy()
+        update_days = ((updated - published) // pd.Timedelta(days=1)).to_numpy(dtype=float)
+        return score + np.where(revised, np.where(update_days <= 3, 0.5, 0.3), 0.0)
+    
+    def _content_scores(self, frame: pd.DataFrame) -> np.ndarray:
+        # 초록마다 컴파일된 정규식으로 한 번만 훑어 그룹별 키워드 수를 셈
+        counts = self.keyword_matcher.count_many(frame['abstract'].fillna(''))
+        score = np.zeros(len(frame))
+        for group, (per_keyword, cap) in CONTENT_WEIGHTS.items():
+            group_counts = np.asarray(counts.get(group, [0] * len(frame)), dtype=int)
+            score = score + np.minimum(group_counts * per_keyword, cap)
+        return score
+
+class StreamingTopK:
+    """논문을 chunk_size개씩 점수 매기면서 상위 k개만 최소 힙에 남기는 순위기
+    
+    제너레이터도 받으며 O(n log k) 시간, O(k + chunk_size) 메모리로 동작합니다.
+    k가 None이면 자르지 않고 모든 논문을 순위대로 반환합니다.
+    """
+    
+    def __init__(self, k: Optional[int], scorer: BatchQualityScorer = None, chunk_size: int = 1000,
+                 now: datetime.datetime = None):
+        self.k = k
+        self.scorer = scorer or BatchQualityScorer()
+        self.chunk_size = chunk_size
+        # 모든 청크가 같은 기준 시각으로 최근성 점수를 계산하도록 고정
+        self.now = now or datetime.datetime.now(pytz.UTC)
+        self.seen = 0
+        self._heap = []  # (점수, -입력 순서, 논문)
+    
+    def consume(self, papers: Iterable) -> 'StreamingTopK':
+        iterator = iter(papers)
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return self
+            self.consume_scored(zip(self.scorer.score_papers(chunk, self.now), chunk))
+    
+    def consume_scored(self, scored_papers: Iterable[Tuple[float, object]]) -> 'StreamingTopK':
+        """이미 점수를 매긴 (점수, 논문) 쌍을 받습니다."""
+        for score, paper in scored_papers:
+            item = (float(score), -self.seen, paper)
+            self.seen += 1
+            if self.k is None or len(self._heap) < self.k:
+                heapq.heappush(self._heap, item)
+            elif item[:2] > self._heap[0][:2]:
+                heapq.heapreplace(self._heap, item)
+        return self
+    
+    def results(self) -> List[Tuple[float, object]]:
+        """(점수, 논문) 목록을 점수 내림차순(동점이면 입력 순서)으로 반환합니다."""
+        ordered = sorted(self._heap, key=lambda item: (item[0], item[1]), reverse=True)
+        return [(score, paper) for score, _, paper in ordered]
+
+def select_top_k(papers: Iterable, k: int, scorer: BatchQualityScorer = None,
+                 now: datetime.datetime = None) -> List[Tuple[float, object]]:
+    """점수 상위 k개의 (점수, 논문) 목록을 반환합니다."""
+    return StreamingTopK(k, scorer, now=now).consume(papers).results()
 
-def get_recent_papers(days: int = 7) -> List[Dict]:
+def ranking_row(paper, score: float, rank: int) -> Dict:
+    """순위표(출력/CSV)에 들어갈 한 행을 만듭니다. 상위 K개에 든 논문에만 호출합니다."""
+    return {
+        'rank': rank,
+        'title': paper.title.replace('\n', ' '),  # 제목에서 줄바꿈 제거
+        'url': paper.entry_id,  # arXiv 링크
+        'score': score,
+        'authors': len(paper.authors),
+        'author_names': '; '.join(author.name for author in paper.authors),  # 저자 색인 갱신에 사용
+        'categories': ', '.join(paper.categories),  # 카테고리 추가
+        'published': paper.published.strftime('%Y-%m-%d'),  # 날짜 형식 지정
+        'updated': paper.updated.strftime('%Y-%m-%d'),  # 업데이트 날짜 추가
+        'abstract': paper.summary.replace('\n', ' ')  # 초록 추가
+    }
+
+def iter_recent_papers(days: int = 7, incremental: bool = False, max_results: int = 100) -> Iterator:
+    """최근 며칠간 제출된 cs.AI 논문을 받아오는 대로 하나씩 반환합니다.
+    
+    incremental=True이면 이전 실행 이후 새로 올라온 논문만 가져옵니다.
+    """
     # 7일 전 날짜 계산 (UTC 기준)
     end_date = datetime.datetime.now(pytz.UTC)
     start_date = end_date - datetime.timedelta(days=days)
     
-    # arXiv 검색 쿼리 생성
-    client = arxiv.Client()
-    search = arxiv.Search(
-        query='cat:cs.AI',
-        max_results=100,  # 한 번에 가져올 최대 결과 수 제한
-        sort_by=arxiv.SortCriterion.SubmittedDate,
-        sort_order=arxiv.SortOrder.Descending
-    )
+    # arXiv 검색 클라이언트 (기간 필터를 검색식에 포함)
+    client = arxiv.Client(page_size=min(max_results, page_size_for(ARXIV_EXPECTED_DAILY_VOLUME * days)))
+    state = HarvestState(HARVEST_STATE_PATH, overlap_hours=HARVEST_OVERLAP_HOURS) if incremental else None
     
     # 논문 수집
-    papers = []
+    count = 0
     try:
-        for paper in client.results(search):
-            if paper.published < start_date:
-                break
-            papers.append(paper)
-            time.sleep(0.1)  # API 요청 간 간격 추가
+        for paper in iter_window_papers(client, ['cs.AI'], start_date, end_date, max_results=max_results,
+                                        state=state, state_key='rank_papers:cat:cs.AI'):
+            count += 1
+            yield paper
     except Exception as e:
         print(f"논문 수집 중 오류 발생: {e}")
-        if not papers:  # 논문을 하나도 수집하지 못한 경우
+        if not count:  # 논문을 하나도 수집하지 못한 경우
             raise
     
-    return papers
+    if state is not None:
+        state.save()
 
-def main():
+def get_recent_papers(days: int = 7, incremental: bool = False, max_results: int = 100) -> List[Dict]:
+    """최근 며칠간 제출된 cs.AI 논문을 가져옵니다.
+    
+    incremental=True이면 이전 실행 이후 새로 올라온 논문만 가져옵니다.
+    """
+    return list(iter_recent_papers(days, incremental=incremental, max_results=max_results))
+
+def main(top_k: Optional[int] = None):
+    """최근 7일간의 cs.AI 논문 순위를 출력하고 CSV로 저장합니다. top_k를 주면 상위 top_k개만 남깁니다."""
     # 논문 품질 분석기 초기화
     analyzer = PaperQualityAnalyzer()
     
-    # 최근 7일간의 논문 가져오기
-    print("최근 7일간의 cs.AI 논문을 가져오는 중...")
-    papers = get_recent_papers()
-    print(f"총 {len(papers)}개의 논문을 가져왔습니다.")
-    
-    # 논문 품질 점수 계산 및 정렬
-    print("논문 품질 점수를 계산하는 중...")
-    paper_scores = []
-    for paper in papers:
-        score = analyzer.analyze_paper(paper)
-        paper_scores.append({
-            'rank': 0,  # 순위는 나중에 추가
-            'title': paper.title.replace('\n', ' '),  # 제목에서 줄바꿈 제거
-            'url': paper.entry_id,  # arXiv 링크
-            'score': score,
-            'authors': len(paper.authors),
-            'categories': ', '.join(paper.categories),  # 카테고리 추가
-            'published': paper.published.strftime('%Y-%m-%d'),  # 날짜 형식 지정
-            'updated': paper.updated.strftime('%Y-%m-%d'),  # 업데이트 날짜 추가
-            'abstract': paper.summary.replace('\n', ' ')  # 초록 추가
-        })
-    
-    # 점수로 정렬
-    paper_scores.sort(key=lambda x: x['score'], reverse=True)
-    
-    # 순위 추가
-    for i, paper in enumerate(paper_scores, 1):
-        paper['rank'] = i
+    # 최근 7일간의 논문을 받아오는 대로 점수를 매김 (top_k가 있으면 상위 top_k개만 유지)
+    print("최근 7일간의 cs.AI 논문을 가져와 품질 점수를 계산하는 중...")
+    ranker = StreamingTopK(top_k, BatchQualityScorer(analyzer.quality_indicators, analyzer.keyword_matcher))
+    ranker.consume(iter_recent_papers())
+    print(f"총 {ranker.seen}개의 논문을 가져왔습니다.")
+    
+    # 상위 논문만 순위표 행으로 변환
+    paper_scores = [ranking_row(paper, score, rank) for rank, (score, paper) in enumerate(ranker.results(), 1)]
     
     # DataFrame 생성
     df = pd.DataFrame(paper_scores)
@@ -0,0 +1,154 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from .arxiv_utils import parse_arxiv_id
+
+logger = logging.getLogger(__name__)
+
+
+def get_content_key(paper: Dict) -> str:
+    """arXiv 기본 ID와 초록 내용 해시로 논문 내용 키를 생성합니다.
+
+    URL의 버전이 바뀌어도 초록이 같으면 같은 키가 됩니다.
+    """
+    base_id, _ = parse_arxiv_id(paper["url"])
+    abstract = " ".join(paper["abstract"].split())
+    abstract_hash = hashlib.sha256(abstract.encode("utf-8")).hexdigest()[:16]
+    return f"{base_id}:{abstract_hash}"
+
+
+def get_stage_cache_key(stage: str, content_key: str, fingerprint: str) -> str:
+    """분석 단계별 캐시 키를 생성합니다.
+
+    파이프라인 지문이 포함되므로 프롬프트나 모델 설정이 바뀐 단계만 무효화됩니다.
+    """
+    return f"{stage}:{content_key}:{fingerprint}"
+
+
+def remove_pickle_files(cache_dir: str) -> int:
+    """예전 버전이 남긴 <해시>.pkl 캐시 파일을 지우고 지운 파일 수를 반환합니다.
+
+    예전 캐시는 단계별 캐시 키와 맞지 않아 다시 쓸 수 없으므로 옮기지 않고 삭제만 합니다.
+    """
+    removed = 0
+    for pickle_file in glob.glob(os.path.join(cache_dir, "*.pkl")):
+        try:
+            os.remove(pickle_file)
+            removed += 1
+        except OSError as e:
+            logger.error(f"캐시 파일 삭제 중 오류 발생 ({pickle_file}): {str(e)}")
+    if removed:
+        logger.info(f"예전 pickle 캐시 {removed}개를 삭제했습니다.")
+    return removed
+
+
+class AnalysisCache:
+    """SQLite(WAL) 단일 파일에 분석 결과를 저장하는 키-값 캐시
+
+    항목은 TTL이 지나거나 전체 크기가 상한을 넘으면 가장 오래 사용되지 않은 것부터 제거됩니다.
+    """
+
+    def __init__(self, path: str, ttl_days: float = 30, max_bytes: int = 64 * 1024 * 1024):
+        self.path = path
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS analysis_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_analysis_cache_accessed ON analysis_cache (accessed_at)"
+            )
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키의 캐시 값을 한 번의 트랜잭션으로 조회합니다. 없는 키는 결과에서 빠집니다."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        now = time.time()
+        placeholders = ",".join("?" for _ in keys)
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                f"SELECT key, value FROM analysis_cache WHERE key IN ({placeholders}) AND created_at >= ?",
+                (*keys, now - self.ttl_seconds)
+            ).fetchall()
+            if rows:
+                self._conn.executemany(
+                    "UPDATE analysis_cache SET accessed_at = ? WHERE key = ?",
+                    [(now, key) for key, _ in rows]
+                )
+
+        results = {}
+        for key, value in rows:
+            try:
+                results[key] = json.loads(value)
+            except ValueError as e:
+                logger.error(f"캐시 값 역직렬화 중 오류 발생 ({key}): {str(e)}")
+        return results
+
+    def put_many(self, items: Dict[str, Any]):
+        """여러 값을 한 번의 트랜잭션으로 저장한 뒤 만료·용량 초과 항목을 정리합니다."""
+        if not items:
+            return
+
+        now = time.time()
+        rows = []
+        for key, value in items.items():
+            encoded = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+            rows.append((key, encoded, len(encoded.encode("utf-8")), now, now))
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO analysis_cache (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._evict(now)
+
+    def get(self, key: str) -> Optional[Any]:
+        """단일 키의 캐시 값을 조회합니다."""
+        return self.get_many([key]).get(key)
+
+    def put(self, key: str, value: Any):
+        """단일 값을 저장합니다."""
+        self.put_many({key: value})
+
+    def _evict(self, now: float):
+        """TTL이 지난 항목을 지우고, 전체 크기가 상한을 넘으면 오래 사용되지 않은 항목부터 지웁니다."""
+        self._conn.execute("DELETE FROM analysis_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM analysis_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        stale_keys = []
+        for key, size in self._conn.execute("SELECT key, size FROM analysis_cache ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            stale_keys.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM analysis_cache WHERE key = ?", stale_keys)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,165 +1,328 @@
 import os
+import threading
 import time
 import arxiv
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 import pytz
 from bs4 import BeautifulSoup
-import re
-from pdfminer.high_level import extract_text
-from pdfminer.pdfparser import PDFSyntaxError
+
+from config import HARVEST_OVERLAP_HOURS, HARVEST_STATE_PATH
+
+from .arxiv_search import build_category_query, iter_window_papers
+from .download_pipeline import DownloadPipeline
+from .harvest_state import HarvestState
+from .http_cache import HttpCache, is_immutable_url
+from .html_text_extractor import MainTextParser
+from .pdf_text_extractor import PdfTextExtractor
 
 logger = logging.getLogger(__name__)
 
 class ArxivCollector:
-    def __init__(self):
+    def __init__(self, incremental: bool = True, harvest_state_path: Optional[str] = None,
+                 harvest_overlap_hours: Optional[float] = None,
+                 pipeline: Optional[DownloadPipeline] = None,
+                 extractor: Optional[PdfTextExtractor] = None,
+                 in_memory: bool = True, keep_pdfs: bool = False,
+                 html_first: bool = True, min_html_chars: int = 1000,
+                 http_cache: Optional[HttpCache] = None):
         self.max_papers = 1000  # 최대 논문 수 증가
         self.target_categories = ['cs.AI']  # cs.AI만 검색
         self.base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        # 증분 수집: 이전 실행 이후 새로 올라온 논문만 가져옴
+        # (daily_top10과 같은 상태 파일과 겹침 구간을 쓰지만 기준 시각은 'arxiv_collector:' 키로 따로 둠.
+        #  한쪽이 이미 본 논문을 다른 쪽이 건너뛰지 않도록 수집기마다 별도로 관리)
+        self.incremental = incremental
+        self.harvest_state_path = harvest_state_path or HARVEST_STATE_PATH
+        self.harvest_overlap_hours = (HARVEST_OVERLAP_HOURS if harvest_overlap_hours is None
+                                      else harvest_overlap_hours)
         self.papers_dir = os.path.join(self.base_dir, 'data', 'papers')
         self.html_dir = os.path.join(self.base_dir, 'data', 'html')
         self.text_dir = os.path.join(self.base_dir, 'data', 'text')
         os.makedirs(self.papers_dir, exist_ok=True)
         os.makedirs(self.html_dir, exist_ok=True)
         os.makedirs(self.text_dir, exist_ok=True)
+        # 조건부 요청(ETag/Last-Modified)용 디스크 캐시 (파일로 저장하는 다운로드에만 사용, 처음 사용할 때 만들어짐)
+        self.http_cache = http_cache or HttpCache(os.path.join(self.base_dir, 'data', 'cache', 'http'))
+        # 세션 재사용, 호스트별 제한, 항목별 제한 시간을 갖춘 다운로드 도구
+        self.pipeline = pipeline or DownloadPipeline(cache=self.http_cache)
+        # 모든 코어를 쓰는 PDF 텍스트 추출기 (문서별 제한 시간, 페이지 수 제한 지원)
+        self.extractor = extractor or PdfTextExtractor()
+        # in_memory: 내려받은 PDF를 파일로 쓰지 않고 바로 텍스트 추출기에 전달
+        # keep_pdfs: 원본 PDF를 내용 해시(SHA-256) 경로에 보관 (in_memory 모드에서만 사용)
+        self.in_memory = in_memory
+        self.keep_pdfs = keep_pdfs
+        # html_first: HTML 버전에서 본문을 먼저 추출하고, 없을 때만 PDF를 받아 추출
+        # (False이면 PDF와 HTML을 모두 받음)
+        self.html_first = html_first
+        self.min_html_chars = min_html_chars
 
     def download_pdf(self, url: str, filename: str) -> bool:
         """PDF 파일 다운로드"""
         try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
-            filepath = os.path.join(self.papers_dir, filename)
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            self._fetch_pdf(url, os.path.join(self.papers_dir, filename))
             return True
         except Exception as e:
             logger.error(f"PDF 다운로드 중 오류 발생: {str(e)}")
             return False
 
+    def _fetch_pdf(self, url: str, filepath: str):
+        """PDF를 임시 파일로 받은 뒤 완료되면 제자리로 옮깁니다. 실패하면 예외를 그대로 전달합니다."""
+        # 같은 arXiv 버전의 파일이 이미 있으면 요청하지 않음
+        if os.path.exists(filepath) and is_immutable_url(url):
+            return
+        tmp_path = f"{filepath}.part"
+        try:
+            with open(tmp_path, 'wb') as f:
+                self.pipeline.download(url, f.write, use_cache=True)
+            os.replace(tmp_path, filepath)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _store_pdf(self, data: bytes, sha256: str) -> str:
+        """PDF를 내용 해시 경로(papers/<해시 앞 2자리>/<해시>.pdf)에 저장하고 경로를 반환합니다.
+
+        같은 내용이 이미 있으면 다시 쓰지 않습니다.
+        """
+        filepath = os.path.join(self.papers_dir, sha256[:2], f"{sha256}.pdf")
+        if not os.path.exists(filepath):
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            tmp_path = f"{filepath}.{threading.get_ident()}.part"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, filepath)
+        return filepath
+
     def download_html(self, entry_id: str) -> bool:
         """HTML 버전 논문 다운로드 및 저장"""
         try:
-            # HTML URL 생성 (experimental 버전)
-            paper_id = entry_id.split('/')[-1]
-            html_url = f"https://arxiv.org/html/{paper_id}"
-            
-            # HTML 다운로드
-            response = requests.get(html_url)
-            response.raise_for_status()
-            
-            # BeautifulSoup으로 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 메타데이터 제거
-            for element in soup.find_all(['script', 'style', 'nav', 'header', 'footer']):
-                element.decompose()
-            
-            # 본문 추출
-            main_content = soup.find('main')
-            if not main_content:
-                logger.error(f"본문을 찾을 수 없음: {html_url}")
-                return False
-            
-            # 이미지 URL 수정
-            for img in main_content.find_all('img'):
-                if img.get('src', '').startswith('/'):
-                    img['src'] = f"https://arxiv.org{img['src']}"
-            
-            # 파일명 생성
-            filename = f"{paper_id}.html"
-            
-            # HTML 저장
-            filepath = os.path.join(self.html_dir, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(str(main_content))
-            
+            self._fetch_html(entry_id)
             return True
         except Exception as e:
             logger.error(f"HTML 다운로드 중 오류 발생: {str(e)}")
             return False
 
+    def _fetch_html(self, entry_id: str):
+        """HTML 버전 논문의 본문을 저장합니다. 실패하면 예외를 그대로 전달합니다."""
+        # HTML URL 생성 (experimental 버전)
+        paper_id = entry_id.split('/')[-1]
+        html_url = f"https://arxiv.org/html/{paper_id}"
+        filepath = os.path.join(self.html_dir, f"{paper_id}.html")
+        
+        # 같은 arXiv 버전의 파일이 이미 있으면 요청하지 않음
+        if os.path.exists(filepath) and is_immutable_url(html_url):
+            return
+        
+        # HTML 다운로드
+        html = self.pipeline.fetch_text(html_url, use_cache=True)
+        
+        # BeautifulSoup으로 파싱
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # 메타데이터 제거
+        for element in soup.find_all(['script', 'style', 'nav', 'header', 'footer']):
+            element.decompose()
+        
+        # 본문 추출
+        main_content = soup.find('main')
+        if not main_content:
+            raise ValueError(f"본문을 찾을 수 없음: {html_url}")
+        
+        # 이미지 URL 수정
+        for img in main_content.find_all('img'):
+            if img.get('src', '').startswith('/'):
+                img['src'] = f"https://arxiv.org{img['src']}"
+        
+        # HTML 저장
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(str(main_content))
+
+    def _fetch_html_text(self, entry_id: str, output_path: str):
+        """HTML 버전의 <main> 본문 텍스트를 스트리밍 파서로 추출해 저장합니다.
+
+        HTML 버전이 없거나 본문이 너무 짧으면 예외를 전달합니다.
+        """
+        paper_id = entry_id.split('/')[-1]
+        html_url = f"https://arxiv.org/html/{paper_id}"
+
+        # </main>을 만나면 나머지 페이지는 받지 않음
+        parser = MainTextParser()
+        self.pipeline.download(html_url, parser.feed_bytes)
+        parser.close()
+        if not parser.found_main:
+            raise ValueError(f"본문을 찾을 수 없음: {html_url}")
+        text = parser.text()
+        if len(text) < self.min_html_chars:
+            raise ValueError(f"HTML 본문이 너무 짧음 ({len(text)}자): {html_url}")
+
+        tmp_path = f"{output_path}.part"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, output_path)
+
     def extract_text_from_pdf(self, pdf_path: str, output_path: str) -> bool:
-        """PDF에서 텍스트 추출"""
-        try:
-            text = extract_text(pdf_path)
-            
-            # 텍스트 정리
-            text = re.sub(r'\s+', ' ', text)  # 연속된 공백 제거
-            text = text.strip()
-            
-            # 파일 저장
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(text)
-            
-            return True
-        except (PDFSyntaxError, Exception) as e:
-            logger.error(f"PDF 텍스트 추출 중 오류 발생: {str(e)}")
-            return False
+        """PDF에서 텍스트 추출 (프로세스 풀에서 실행)"""
+        return self.extractor.extract(pdf_path, output_path)
+
+    def _process_pdf(self, result: arxiv.Result, paper_info: Dict[str, Any]):
+        """PDF를 받고 이어서 텍스트를 추출합니다. 상태는 paper_info에 기록합니다."""
+        started = time.monotonic()
+        if self.in_memory:
+            fetched = {}
+
+            def fetch():
+                fetched["data"], paper_info["pdf_sha256"] = self.pipeline.fetch_bytes(result.pdf_url)
+                if self.keep_pdfs:
+                    paper_info["pdf_path"] = self._store_pdf(fetched["data"], paper_info["pdf_sha256"])
+
+            status = self.pipeline.run(fetch)
+        else:
+            status = self.pipeline.run(lambda: self._fetch_pdf(result.pdf_url, paper_info["pdf_path"]))
+        paper_info["download_status"]["pdf"] = status
+        if status["status"] != "ok":
+            logger.warning(f"PDF 다운로드 실패 ({status['status']}): {result.entry_id} - {status['error']}")
+            paper_info["text_seconds"] = round(time.monotonic() - started, 3)
+            return
+
+        extract_started = time.monotonic()
+        if self.in_memory:
+            extracted = self.extractor.extract_bytes(fetched.pop("data"), paper_info["text_path"])
+        else:
+            extracted = self.extract_text_from_pdf(paper_info["pdf_path"], paper_info["text_path"])
+        paper_info["download_status"]["text"] = {
+            "status": "ok" if extracted else "error",
+            "seconds": round(time.monotonic() - extract_started, 3),
+            "error": None if extracted else "텍스트 추출 실패"
+        }
+        if extracted:
+            paper_info["text_source"] = "pdf"
+        paper_info["text_seconds"] = round(time.monotonic() - started, 3)
+
+    def _process_html_first(self, result: arxiv.Result, paper_info: Dict[str, Any]):
+        """HTML 버전에서 본문을 추출하고, 실패하면 PDF로 대신합니다. 사용한 경로와 시간을 기록합니다."""
+        started = time.monotonic()
+        # 같은 arXiv 버전의 본문 텍스트가 이미 있으면 건너뜀
+        if os.path.exists(paper_info["text_path"]) and is_immutable_url(result.entry_id):
+            paper_info["text_source"] = "existing"
+            paper_info["text_seconds"] = 0.0
+            return
+        status = self.pipeline.run(lambda: self._fetch_html_text(result.entry_id, paper_info["text_path"]))
+        paper_info["download_status"]["html"] = status
+        if status["status"] == "ok":
+            paper_info["html_success"] = True
+            paper_info["text_source"] = "html"
+        else:
+            logger.info(f"HTML 본문을 사용할 수 없어 PDF로 추출합니다: {result.entry_id} - {status['error']}")
+            self._process_pdf(result, paper_info)
+        paper_info["text_seconds"] = round(time.monotonic() - started, 3)
+
+    def _process_html(self, result: arxiv.Result, paper_info: Dict[str, Any]):
+        """HTML 버전을 받습니다. 상태는 paper_info에 기록합니다."""
+        status = self.pipeline.run(lambda: self._fetch_html(result.entry_id))
+        paper_info["download_status"]["html"] = status
+        paper_info["html_success"] = status["status"] == "ok"
 
     def collect(self) -> List[Dict[str, Any]]:
-        """논문 정보 수집"""
+        """논문 정보 수집
+
+        메타데이터 페이지를 받는 동안 이미 받은 논문의 PDF/HTML 다운로드와 텍스트 추출을
+        스레드 풀에서 동시에 진행합니다. 항목별 결과는 download_status에 기록됩니다.
+        """
         try:
-            # 검색 쿼리 생성
-            query = 'cat:cs.AI'
-            
             # arxiv API 클라이언트 설정
             client = arxiv.Client(
                 page_size=100,  # 한 번에 가져올 결과 수
                 delay_seconds=3.0,  # 요청 간 지연 시간
                 num_retries=3  # 실패 시 재시도 횟수
             )
-            
-            search = arxiv.Search(
-                query=query,
-                max_results=self.max_papers,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending
-            )
+            state = (HarvestState(self.harvest_state_path, overlap_hours=self.harvest_overlap_hours)
+                     if self.incremental else None)
 
             papers = []
-            one_day_ago = datetime.now(pytz.UTC) - timedelta(days=1)
-
-            # 논문 수집
-            for result in client.results(search):
-                # 최근 1일 이내의 논문만 수집
-                if result.published < one_day_ago:
-                    continue
-
-                # PDF 다운로드 및 텍스트 추출
-                paper_id = result.entry_id.split('/')[-1]
-                pdf_filename = f"{paper_id}.pdf"
-                pdf_path = os.path.join(self.papers_dir, pdf_filename)
-                text_path = os.path.join(self.text_dir, f"{paper_id}.txt")
-                
-                if self.download_pdf(result.pdf_url, pdf_filename):
-                    self.extract_text_from_pdf(pdf_path, text_path)
-
-                # HTML 다운로드 시도
-                html_success = self.download_html(result.entry_id)
-
-                # 논문 정보 저장
-                paper_info = {
-                    "title": result.title,
-                    "authors": ', '.join([author.name for author in result.authors]),
-                    "abstract": result.summary,
-                    "submission_date": result.published,
-                    "categories": result.categories,
-                    "pdf_url": result.pdf_url,
-                    "html_url": result.entry_id,
-                    "pdf_path": pdf_path,
-                    "text_path": text_path,
-                    "html_success": html_success
-                }
-                papers.append(paper_info)
-                logger.info(f"논문 수집 완료: {result.title}")
+            now = datetime.now(pytz.UTC)
+            one_day_ago = now - timedelta(days=1)
+
+            # 다운로드 스레드가 시작되기 전에 추출 워커 프로세스를 띄움
+            self.extractor.start()
+            with ThreadPoolExecutor(max_workers=self.pipeline.max_workers) as executor:
+                futures = []
+                # 최근 1일 이내의 논문만 수집 (기간을 벗어나면 검색 중단)
+                for result in iter_window_papers(client, self.target_categories, one_day_ago, now,
+                                                 max_results=self.max_papers, state=state,
+                                                 state_key=f"arxiv_collector:{build_category_query(self.target_categories)}"):
+                    paper_id = result.entry_id.split('/')[-1]
+
+                    # 논문 정보 저장
+                    paper_info = {
+                        "title": result.title,
+                        "authors": ', '.join([author.name for author in result.authors]),
+                        "abstract": result.summary,
+                        "submission_date": result.published,
+                        "categories": result.categories,
+                        "pdf_url": result.pdf_url,
+                        "html_url": result.entry_id,
+                        # 메모리 모드에서는 원본을 보관할 때만 경로가 채워짐
+                        "pdf_path": None if self.in_memory else os.path.join(self.papers_dir, f"{paper_id}.pdf"),
+                        "pdf_sha256": None,
+                        "text_path": os.path.join(self.text_dir, f"{paper_id}.txt"),
+                        "html_success": False,
+                        # 본문 텍스트를 만든 경로(html/pdf)와 걸린 시간
+                        "text_source": None,
+                        "text_seconds": None,
+                        "download_status": {}
+                    }
+                    papers.append(paper_info)
 
+                    if self.html_first:
+                        futures.append(executor.submit(self._process_html_first, result, paper_info))
+                    else:
+                        # PDF 다운로드 및 텍스트 추출, HTML 다운로드를 동시에 진행
+                        futures.append(executor.submit(self._process_pdf, result, paper_info))
+                        futures.append(executor.submit(self._process_html, result, paper_info))
+
+                for future in as_completed(futures):
+                    future.result()
+
+            self._log_download_summary(papers)
+            if state is not None:
+                state.save()
             return papers
 
         except Exception as e:
             logger.error(f"논문 수집 중 오류 발생: {str(e)}")
-            return [] 
\ No newline at end of file
+            return []
+        finally:
+            self.cleanup()
+
+    def cleanup(self):
+        """추출 워커 프로세스와 HTTP 캐시 연결을 정리합니다."""
+        self.extractor.close()
+        self.http_cache.close()
+
+    def _log_download_summary(self, papers: List[Dict[str, Any]]):
+        """다운로드 종류별 성공/실패 건수를 기록합니다."""
+        summary: Dict[str, Dict[str, int]] = {}
+        for paper in papers:
+            for kind, status in paper["download_status"].items():
+                counts = summary.setdefault(kind, {})
+                counts[status["status"]] = counts.get(status["status"], 0) + 1
+        for kind, counts in summary.items():
+            logger.info(f"{kind} 처리 결과: " + ", ".join(f"{name} {count}건" for name, count in sorted(counts.items())))
+
+        sources: Dict[str, List[float]] = {}
+        for paper in papers:
+            if paper.get("text_seconds") is not None:
+                sources.setdefault(paper["text_source"] or "실패", []).append(paper["text_seconds"])
+        for source, seconds in sorted(sources.items()):
+            logger.info(f"본문 추출 경로 {source}: {len(seconds)}건, 평균 {sum(seconds) / len(seconds):.2f}초")
+
+        if self.pipeline.cache is not None:
+            stats = self.pipeline.cache.stats()
+            logger.info(
+                f"HTTP 캐시: 적중 {stats['hits']}건, 재검증 {stats['revalidated']}건, 미스 {stats['misses']}건 "
+                f"(적중률 {stats['hit_rate']:.0%}, 절약 {stats['bytes_saved'] / (1024 * 1024):.1f}MB)"
+            )
+        logger.info(f"논문 수집 완료: {len(papers)}개")
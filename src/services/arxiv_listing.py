@@ -0,0 +1,193 @@
+import re
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+from urllib.parse import urljoin
+
+from .arxiv_utils import parse_arxiv_id
+
+_WHITESPACE = re.compile(r"\s+")
+# "Artificial Intelligence (cs.AI)" 형식에서 카테고리 코드를 추출
+CATEGORY_CODE = re.compile(r"\(([\w.\-]+)\)")
+_DAY_HEADER = re.compile(r"(\w{3}, \d{1,2} \w{3} \d{4})")
+_TOTAL = re.compile(r"Total of (\d+) entries")
+
+# 목록 페이지 <dd> 안에서 값을 모으는 요소 (class -> 필드 이름)
+_LISTING_FIELDS = {"list-title": "title", "list-authors": "authors", "list-subjects": "subjects"}
+
+
+def _clean(text: str) -> str:
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _classes(attrs) -> List[str]:
+    return (dict(attrs).get("class") or "").split()
+
+
+class ListingPageParser(HTMLParser):
+    """arXiv 목록 페이지(/list/...)를 한 번에 읽어 항목별 메타데이터를 모으는 파서
+
+    제목, 저자, 주제 분류와 PDF/HTML/소스 링크를 추출하고, /new 페이지처럼 초록이 함께 실려 있으면
+    초록도 가져옵니다. 각 항목의 날짜는 바로 앞의 날짜 제목(<h3>)에서 가져옵니다.
+    """
+
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.entries: List[Dict[str, Any]] = []
+        self.total: Optional[int] = None
+        self._entry: Optional[Dict[str, Any]] = None
+        self._day: Optional[datetime] = None
+        self._field: Optional[str] = None
+        self._field_tag = ""
+        self._field_depth = 0
+        self._skip_depth = 0
+        self._pieces: List[str] = []
+        self._in_primary = False
+        self._in_header = False
+        self._in_dt = False
+
+    def handle_starttag(self, tag, attrs):
+        classes = _classes(attrs)
+        if tag == "h3":
+            self._in_header = True
+            self._pieces = []
+        elif tag == "dt":
+            self._entry = {"abstract": None, "submission_date": self._day}
+            self.entries.append(self._entry)
+            self._in_dt = True
+        elif tag == "a" and self._in_dt:
+            self._link(dict(attrs).get("href") or "")
+
+        if self._field is not None:
+            if tag == self._field_tag:
+                self._field_depth += 1
+            if tag == "span" and "descriptor" in classes:
+                self._skip_depth += 1
+            elif tag == "span" and "primary-subject" in classes:
+                self._in_primary = True
+            return
+
+        if self._entry is None:
+            return
+        field = next((_LISTING_FIELDS[c] for c in classes if c in _LISTING_FIELDS), None)
+        if tag == "div" and field:
+            self._start_field(field, tag)
+        elif tag == "p" and "mathjax" in classes:
+            self._start_field("abstract", tag)
+
+    def _start_field(self, field: str, tag: str):
+        self._field = field
+        self._field_tag = tag
+        self._field_depth = 1
+        self._pieces = []
+
+    def _link(self, href: str):
+        url = urljoin(self.base_url, href)
+        if "/abs/" in href and "abs_url" not in self._entry:
+            self._entry["abs_url"] = url
+            self._entry["paper_id"] = parse_arxiv_id(url)[0]
+        elif "/pdf/" in href:
+            self._entry["pdf_url"] = url
+        elif "/html/" in href:
+            self._entry["html_url"] = url
+        elif "/src/" in href or "/source/" in href:
+            self._entry["source_url"] = url
+
+    def handle_endtag(self, tag):
+        if self._in_header and tag == "h3":
+            self._in_header = False
+            match = _DAY_HEADER.search("".join(self._pieces))
+            if match:
+                try:
+                    self._day = datetime.strptime(match.group(1), "%a, %d %b %Y")
+                except ValueError:
+                    pass
+            return
+        if tag == "dt":
+            self._in_dt = False
+        if self._field is None:
+            return
+        if tag == "span":
+            if self._skip_depth:
+                self._skip_depth -= 1
+            self._in_primary = False
+        if tag == self._field_tag:
+            self._field_depth -= 1
+            if not self._field_depth:
+                self._finish_field()
+
+    def _finish_field(self):
+        text = _clean("".join(self._pieces))
+        if self._field == "subjects":
+            self._entry["categories"] = CATEGORY_CODE.findall(text)
+        else:
+            self._entry[self._field] = text
+        self._field = None
+        self._skip_depth = 0
+        self._pieces = []
+
+    def handle_data(self, data):
+        if self._in_header:
+            self._pieces.append(data)
+        elif self._field is not None and not self._skip_depth:
+            self._pieces.append(data)
+            if self._in_primary and self._field == "subjects":
+                codes = CATEGORY_CODE.findall(data)
+                if codes:
+                    self._entry["primary_category"] = codes[0]
+        elif self.total is None:
+            match = _TOTAL.search(data)
+            if match:
+                self.total = int(match.group(1))
+
+
+class AbstractPageParser(HTMLParser):
+    """논문 상세 페이지(/abs/...)에서 초록(blockquote.abstract)만 읽는 파서"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.done = False
+        self._depth = 0
+        self._skip_depth = 0
+        self._pieces: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == "blockquote" and (self._depth or "abstract" in _classes(attrs)):
+            self._depth += 1
+        elif self._depth and tag == "span" and "descriptor" in _classes(attrs):
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if not self._depth or self.done:
+            return
+        if tag == "blockquote":
+            self._depth -= 1
+            self.done = not self._depth
+        elif tag == "span" and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if self._depth and not self._skip_depth and not self.done:
+            self._pieces.append(data)
+
+    def text(self) -> str:
+        return _clean("".join(self._pieces))
+
+
+def parse_listing(html: str, base_url: str) -> ListingPageParser:
+    """목록 페이지 HTML을 파싱한 파서를 반환합니다 (entries, total)."""
+    parser = ListingPageParser(base_url)
+    parser.feed(html)
+    parser.close()
+    return parser
+
+
+def parse_abstract(html: str) -> str:
+    """상세 페이지 HTML에서 초록 텍스트를 추출합니다."""
+    parser = AbstractPageParser()
+    parser.feed(html)
+    parser.close()
+    return parser.text()
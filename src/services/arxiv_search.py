@@ -0,0 +1,95 @@
+import datetime
+import logging
+from typing import Iterable, Iterator, Optional
+
+import arxiv
+
+from .arxiv_utils import parse_arxiv_id
+from .harvest_state import HarvestState
+
+logger = logging.getLogger(__name__)
+
+# arXiv API가 한 번에 돌려주는 최대 결과 수
+MAX_PAGE_SIZE = 2000
+
+# submittedDate 필터가 사용하는 시각 형식 (GMT, 분 단위)
+_SUBMITTED_DATE_FORMAT = "%Y%m%d%H%M"
+
+
+def build_category_query(categories: Iterable[str]) -> str:
+    """카테고리 목록을 OR로 묶은 검색식을 만듭니다."""
+    clauses = [f"cat:{category}" for category in categories]
+    if not clauses:
+        raise ValueError("검색할 카테고리가 없습니다.")
+    if len(clauses) == 1:
+        return clauses[0]
+    return "(" + " OR ".join(clauses) + ")"
+
+
+def build_window_query(categories: Iterable[str], start: datetime.datetime, end: datetime.datetime) -> str:
+    """카테고리 검색식에 [start, end) 제출 기간 필터를 더합니다.
+
+    submittedDate 범위는 양 끝을 포함하므로 끝 시각에서 1분을 뺍니다.
+    """
+    start = start.astimezone(datetime.timezone.utc)
+    last_minute = end.astimezone(datetime.timezone.utc) - datetime.timedelta(minutes=1)
+    return (
+        f"{build_category_query(categories)} AND submittedDate:"
+        f"[{start.strftime(_SUBMITTED_DATE_FORMAT)} TO {last_minute.strftime(_SUBMITTED_DATE_FORMAT)}]"
+    )
+
+
+def page_size_for(expected_volume: int, headroom: float = 1.2) -> int:
+    """예상 논문 수에 여유분을 더해, 한 페이지로 기간 전체를 받을 수 있는 크기를 계산합니다."""
+    return max(1, min(MAX_PAGE_SIZE, int(expected_volume * headroom)))
+
+
+def iter_window_papers(client: arxiv.Client, categories: Iterable[str],
+                       start: datetime.datetime, end: datetime.datetime,
+                       windowed: bool = True,
+                       max_results: Optional[int] = None,
+                       state: Optional[HarvestState] = None,
+                       state_key: Optional[str] = None) -> Iterator[arxiv.Result]:
+    """[start, end) 기간에 제출된 논문을 최신순으로 반환합니다.
+
+    windowed=True이면 기간 필터를 검색식에 넣어 API가 기간 안의 결과만 돌려주게 하고,
+    False이면 카테고리 전체를 최신순으로 훑으면서 기간을 벗어나는 즉시 중단합니다.
+    state가 주어지면 이전 수집의 기준 시각 이후 논문 중 처음 보는 것만 반환하고 상태에 기록합니다.
+    저장은 호출한 쪽이 처리를 마친 뒤 state.save()로 합니다.
+    """
+    categories = list(categories)
+    category_query = build_category_query(categories)
+    state_key = state_key or category_query
+
+    if state is not None:
+        cutoff = state.cutoff(state_key)
+        if cutoff and cutoff > start:
+            logger.info(f"이전 수집 기준 시각 이후만 검색합니다: {cutoff.isoformat()}")
+            start = cutoff
+        if start >= end:
+            return
+
+    query = build_window_query(categories, start, end) if windowed else category_query
+    search = arxiv.Search(
+        query=query,
+        max_results=max_results,
+        sort_by=arxiv.SortCriterion.SubmittedDate,
+        sort_order=arxiv.SortOrder.Descending
+    )
+    logger.info(f"arXiv 검색 쿼리: {query}")
+
+    try:
+        for paper in client.results(search):
+            if paper.published < start:
+                # 최신순 정렬이므로 이후 결과는 모두 기간 밖
+                break
+            if paper.published >= end:
+                continue
+            if state is not None:
+                base_id, _ = parse_arxiv_id(paper.entry_id)
+                if state.is_seen(state_key, base_id):
+                    continue
+                state.record(state_key, base_id, paper.published)
+            yield paper
+    except arxiv.UnexpectedEmptyPageError as e:
+        logger.warning(f"arXiv가 빈 페이지를 반환해 검색을 종료합니다: {str(e)}")
@@ -0,0 +1,24 @@
+import re
+from typing import Optional, Tuple
+
+_VERSION_PATTERN = re.compile(r"v(\d+)$")
+
+
+def parse_arxiv_id(entry_id: str) -> Tuple[str, Optional[int]]:
+    """arXiv 링크나 식별자에서 버전을 제외한 기본 ID와 버전 번호를 추출합니다.
+
+    예: 'http://arxiv.org/abs/2401.01234v2' -> ('2401.01234', 2)
+    """
+    identifier = entry_id.strip()
+    for marker in ("/abs/", "/pdf/", "/html/"):
+        if marker in identifier:
+            identifier = identifier.split(marker, 1)[1]
+            break
+    identifier = identifier.split("?", 1)[0].split("#", 1)[0].rstrip("/")
+    if identifier.endswith(".pdf"):
+        identifier = identifier[:-len(".pdf")]
+
+    match = _VERSION_PATTERN.search(identifier)
+    if match:
+        return identifier[:match.start()], int(match.group(1))
+    return identifier, None
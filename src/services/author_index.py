@@ -0,0 +1,152 @@
+import datetime
+import json
+import logging
+import os
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 저자 이력 점수의 최대값 (품질 점수의 저자 세부 점수에 더해짐)
+AUTHOR_REPUTATION_MAX = 0.5
+
+_HISTORY_FILE = re.compile(r"top10_(\d{8})\.csv$")
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+# 색인 항목: [본 논문 수, Top 10 선정 횟수, 마지막으로 본 날짜, 마지막 Top 10 날짜] (날짜는 서수, 없으면 0)
+PAPERS, TOP10, LAST_SEEN, LAST_TOP10 = range(4)
+
+
+@lru_cache(maxsize=65536)
+def normalize_author_name(name: str) -> str:
+    """악센트, 대소문자, 구두점, 공백 차이를 없앤 저자 이름 키를 반환합니다."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(_PUNCTUATION.sub(" ", stripped.lower()).split())
+
+
+class AuthorIndex:
+    """저장된 기록에서 저자별 논문 수, Top 10 선정 횟수, 최근 등장일을 모아 둔 조회 테이블
+
+    순위를 매길 때는 파일을 한 번 읽은 dict만 조회하므로 논문당 비용은 저자 수에 비례합니다.
+    기록은 출처(날짜)별로 한 번만 반영되어 같은 날을 다시 실행해도 두 번 세지 않습니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, recency_days: float = 365):
+        self.path = path
+        self.recency_days = recency_days
+        self._authors: Dict[str, List[int]] = {}
+        self._sources = set()
+        self._dirty = False
+        if path:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._authors)
+
+    def has_source(self, source: str) -> bool:
+        return source in self._sources
+
+    def get(self, name: str) -> Optional[List[int]]:
+        return self._authors.get(normalize_author_name(name))
+
+    def record(self, source: str, papers: Iterable[Iterable[str]], top_papers: Iterable[Iterable[str]],
+               day: datetime.date) -> bool:
+        """하루치 후보 논문과 Top 10 논문의 저자 목록을 반영합니다. 이미 반영한 출처면 False를 반환합니다."""
+        if source in self._sources:
+            return False
+        ordinal = day.toordinal()
+        for names, top in [(names, False) for names in papers] + [(names, True) for names in top_papers]:
+            for key in {normalize_author_name(name) for name in names} - {""}:
+                entry = self._authors.setdefault(key, [0, 0, 0, 0])
+                if top:
+                    entry[TOP10] += 1
+                    entry[LAST_TOP10] = max(entry[LAST_TOP10], ordinal)
+                else:
+                    entry[PAPERS] += 1
+                entry[LAST_SEEN] = max(entry[LAST_SEEN], ordinal)
+        self._sources.add(source)
+        self._dirty = True
+        return True
+
+    def update_from_history(self, directory: str) -> int:
+        """아직 반영하지 않은 Top 10 CSV(top10_YYYYMMDD.csv)를 읽어 색인에 더하고, 반영한 파일 수를 반환합니다.
+
+        CSV에는 Top 10 논문만 있으므로 각 행을 본 논문이자 Top 10 논문으로 셉니다.
+        저자 이름 열(author_names)이 없는 예전 파일은 출처로만 기록합니다.
+        """
+        if not os.path.isdir(directory):
+            return 0
+        added = 0
+        for file_name in sorted(os.listdir(directory)):
+            match = _HISTORY_FILE.match(file_name)
+            if not match or match.group(1) in self._sources:
+                continue
+            try:
+                frame = pd.read_csv(os.path.join(directory, file_name))
+            except (OSError, ValueError) as e:
+                logger.error(f"Top 10 기록을 읽는 중 오류 발생 ({file_name}): {str(e)}")
+                continue
+            rows = []
+            if "author_names" in frame:
+                rows = [[name for name in names.split("; ") if name]
+                        for names in frame["author_names"].fillna("").astype(str)]
+            day = datetime.datetime.strptime(match.group(1), "%Y%m%d").date()
+            added += self.record(match.group(1), rows, rows, day)
+        return added
+
+    def reputation(self, name: str, today: int) -> float:
+        """저자 한 명의 이력 점수(0~AUTHOR_REPUTATION_MAX)를 반환합니다. today는 날짜 서수입니다."""
+        entry = self._authors.get(normalize_author_name(name))
+        if entry is None:
+            return 0.0
+        top10 = entry[TOP10]
+        if top10 >= 3:
+            score = 0.5
+        elif top10 == 2:
+            score = 0.4
+        elif top10 == 1:
+            score = 0.3
+        elif entry[PAPERS] >= 3:
+            score = 0.1
+        else:
+            score = 0.0
+        # 마지막 Top 10 선정이 오래된 저자는 절반만 인정
+        if top10 and today - entry[LAST_TOP10] > self.recency_days:
+            score *= 0.5
+        return score
+
+    def paper_reputation(self, names: Iterable[str], today: int) -> float:
+        """논문 저자 중 가장 높은 이력 점수를 반환합니다."""
+        return max((self.reputation(name, today) for name in names), default=0.0)
+
+    def save(self):
+        """색인을 파일에 저장합니다 (바뀐 내용이 있을 때만)."""
+        if not self.path or not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"sources": sorted(self._sources), "authors": self._authors},
+                          f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.error(f"저자 색인 저장 중 오류 발생: {str(e)}")
+
+    def _load(self):
+        """파일에 저장된 색인을 불러옵니다."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._authors = {name: list(entry) for name, entry in data.get("authors", {}).items()}
+            self._sources = set(data.get("sources", []))
+        except (OSError, ValueError, AttributeError) as e:
+            logger.error(f"저자 색인 로드 중 오류 발생: {str(e)}")
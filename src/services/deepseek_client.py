@@ -0,0 +1,163 @@
+import json
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .rate_limiter import RateLimiter, get_shared_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class DeepSeekClient:
+    """연결 풀, 타임아웃, 재시도, 속도 제한을 갖춘 DeepSeek API 클라이언트"""
+
+    def __init__(self, api_key: str, api_url: str,
+                 connect_timeout: float = 10.0, read_timeout: float = 180.0,
+                 max_retries: int = 4, backoff_base: float = 1.0, backoff_max: float = 60.0,
+                 pool_size: int = 10, requests_per_minute: float = 60,
+                 rate_limiter: Optional[RateLimiter] = None):
+        self.api_url = api_url
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        # keep-alive 연결을 재사용하는 세션
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        })
+
+        # 동시에 실행되는 분석이 API에 한꺼번에 몰리지 않도록 프로세스 단위로 공유
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter(
+            "deepseek", requests_per_minute / 60.0, burst=pool_size
+        )
+
+    def chat_completion(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """채팅 완성 API를 호출하고 JSON 응답을 반환합니다."""
+        response = self._post(payload)
+        try:
+            return response.json()
+        finally:
+            response.close()
+
+    def stream_chat_completion(self, payload: Dict[str, Any],
+                               on_chunk: Optional[Callable[[str], None]] = None,
+                               stop_markers: Iterable[str] = ()) -> str:
+        """스트리밍(SSE) 방식으로 응답을 받아 본문을 점진적으로 조립합니다.
+
+        조각이 도착할 때마다 on_chunk를 호출하며, stop_markers 중 하나가 나타나면
+        연결을 즉시 끊고 그 앞까지의 내용만 반환합니다.
+        """
+        stop_markers = [marker for marker in stop_markers if marker]
+        # 종료 문자열의 앞부분일 수 있는 꼬리는 다음 조각을 볼 때까지 콜백에 넘기지 않음
+        holdback = max((len(marker) for marker in stop_markers), default=1) - 1
+        content = ""
+        emitted = 0
+
+        response = self._post({**payload, "stream": True}, stream=True)
+        # text/event-stream 응답에는 charset이 없는 경우가 많아 직접 지정
+        response.encoding = "utf-8"
+        try:
+            # chunk_size=None이면 서버가 보낸 청크를 도착하는 즉시 읽음
+            for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                # 빈 줄과 keep-alive 주석(': ...')은 무시
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+
+                choices = json.loads(data).get("choices") or [{}]
+                delta = (choices[0].get("delta") or {}).get("content") or ""
+                if not delta:
+                    continue
+
+                # 조각 경계에 걸친 종료 문자열도 찾을 수 있도록 직전 내용 일부부터 검색
+                search_from = max(0, len(content) - holdback)
+                content += delta
+                positions = [content.find(marker, search_from) for marker in stop_markers]
+                positions = [position for position in positions if position >= 0]
+                if positions:
+                    content = content[:min(positions)]
+                    logger.debug("종료 문자열이 나타나 스트리밍을 조기 종료합니다.")
+                    break
+
+                safe_end = len(content) - holdback
+                if on_chunk and safe_end > emitted:
+                    on_chunk(content[emitted:safe_end])
+                    emitted = safe_end
+        finally:
+            # 조기 종료 시 연결을 닫아 서버의 생성도 중단시킴
+            response.close()
+
+        if on_chunk and len(content) > emitted:
+            on_chunk(content[emitted:])
+
+        return content
+
+    def _post(self, payload: Dict[str, Any], stream: bool = False) -> requests.Response:
+        """재시도와 지수 백오프를 적용해 POST 요청을 보냅니다."""
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.post(self.api_url, json=payload, timeout=self.timeout, stream=stream)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.warning(f"DeepSeek API 연결 오류, {delay:.1f}초 후 재시도합니다 ({attempt + 1}/{self.max_retries}): {str(e)}")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    if response.status_code >= 400:
+                        response.close()
+                    response.raise_for_status()
+                    return response
+
+                retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                delay = retry_after if retry_after is not None else self._backoff_delay(attempt)
+                if response.status_code == 429:
+                    # 요청 제한에 걸리면 다른 스레드도 함께 대기
+                    self.rate_limiter.penalize(delay)
+                response.close()
+                logger.warning(f"DeepSeek API 응답 {response.status_code}, {delay:.1f}초 후 재시도합니다 ({attempt + 1}/{self.max_retries})")
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """지터를 적용한 지수 백오프 대기 시간을 계산합니다."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환합니다."""
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        return min(max(seconds, 0.0), self.backoff_max)
+
+    def close(self):
+        self.session.close()
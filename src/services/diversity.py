@@ -0,0 +1,84 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .relevance_ranker import SparseTermMatrix, tokenize
+
+
+def _normalized_rows(matrix: SparseTermMatrix, weights: np.ndarray) -> np.ndarray:
+    """행마다 L2 노름이 1이 되도록 0이 아닌 원소의 값을 나눕니다 (빈 행은 그대로 0)."""
+    norms = np.sqrt(np.bincount(matrix.rows, weights=weights * weights, minlength=matrix.shape[0]))
+    norms[norms == 0] = 1.0
+    return weights / norms[matrix.rows]
+
+
+class MMRReranker:
+    """점수와 서로 간의 유사도를 함께 보고 상위 k개를 고르는 MMR(maximal marginal relevance) 재순위기
+
+    매 선택마다 (1 - diversity) x 정규화 점수 - diversity x (이미 고른 논문과의 최대 유사도)가
+    가장 큰 논문을 고릅니다. 유사도는 TF-IDF 단어 벡터의 코사인 유사도와 카테고리 벡터의
+    코사인 유사도를 category_weight 비율로 섞은 값입니다.
+
+    벡터는 희소 행렬로 한 번만 만들어 두고, 논문을 하나 고를 때마다 그 논문과 나머지 후보의
+    유사도 한 열만 계산해 최대 유사도 벡터를 갱신하므로 후보 쌍 전체를 비교하지 않습니다.
+    """
+
+    def __init__(self, diversity: float = 0.3, category_weight: float = 0.3):
+        if not 0.0 <= diversity <= 1.0 or not 0.0 <= category_weight <= 1.0:
+            raise ValueError("diversity와 category_weight는 0과 1 사이여야 합니다.")
+        self.diversity = diversity
+        self.category_weight = category_weight
+
+    def _vectors(self, texts: Sequence[str], categories: Sequence[Sequence[str]]):
+        terms = SparseTermMatrix(tokenize(text or "") for text in texts)
+        doc_count = terms.shape[0]
+        idf = np.log((doc_count + 1) / (terms.document_frequency() + 1)) + 1
+        term_weights = _normalized_rows(terms, terms.data * idf[terms.indices])
+
+        labels = SparseTermMatrix(sorted(set(doc_categories)) for doc_categories in categories)
+        label_weights = _normalized_rows(labels, labels.data)
+        return (terms, term_weights), (labels, label_weights)
+
+    @staticmethod
+    def _similarity_to(vectors, doc: int) -> np.ndarray:
+        """doc 한 편과 모든 후보의 코사인 유사도를 반환합니다 (희소 행렬 x 벡터 한 번)."""
+        matrix, weights = vectors
+        start, end = matrix.indptr[doc], matrix.indptr[doc + 1]
+        query = np.zeros(len(matrix.vocabulary))
+        query[matrix.indices[start:end]] = weights[start:end]
+        return np.bincount(matrix.rows, weights=weights * query[matrix.indices], minlength=matrix.shape[0])
+
+    def select(self, texts: Sequence[str], categories: Sequence[Sequence[str]], scores: Sequence[float],
+               k: int, candidates: Optional[Sequence[int]] = None) -> List[int]:
+        """MMR 순서로 고른 상위 k개 논문의 인덱스를 반환합니다.
+
+        candidates를 주면 그 논문들(예: 중복 제거 후 남은 논문) 중에서만 고릅니다.
+        diversity=0이면 점수 순서와 같으며, 동점이면 앞선 논문이 먼저입니다.
+        """
+        indices = np.arange(len(texts)) if candidates is None else np.asarray(candidates, dtype=np.int64)
+        if not len(indices) or k <= 0:
+            return []
+        values = np.asarray(scores, dtype=np.float64)[indices]
+        spread = values.max() - values.min()
+        relevance = (values - values.min()) / spread if spread > 0 else np.ones(len(values))
+
+        if self.diversity == 0:
+            order = np.lexsort((indices, -values))[:k]
+            return [int(i) for i in indices[order]]
+
+        term_vectors, label_vectors = self._vectors([texts[i] for i in indices],
+                                                    [categories[i] for i in indices])
+        max_similarity = np.zeros(len(indices))
+        available = np.ones(len(indices), dtype=bool)
+        picks = []
+        for _ in range(min(k, len(indices))):
+            objective = (1 - self.diversity) * relevance - self.diversity * max_similarity
+            objective[~available] = -np.inf
+            pick = int(np.argmax(objective))
+            picks.append(pick)
+            available[pick] = False
+            similarity = (1 - self.category_weight) * self._similarity_to(term_vectors, pick)
+            if self.category_weight > 0:
+                similarity += self.category_weight * self._similarity_to(label_vectors, pick)
+            np.maximum(max_similarity, similarity, out=max_similarity)
+        return [int(indices[pick]) for pick in picks]
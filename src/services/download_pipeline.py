@@ -0,0 +1,176 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from io import BytesIO
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .http_cache import HttpCache, is_immutable_url
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class DownloadTimeout(Exception):
+    """다운로드가 전체 제한 시간을 넘긴 경우"""
+
+
+class HostPoliteness:
+    """호스트별 동시 연결 수와 초당 요청 수를 제한합니다."""
+
+    def __init__(self, max_concurrency: int = 2, requests_per_second: float = 2.0):
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        self._hosts: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _limits(self, host: str) -> tuple:
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = (
+                    threading.BoundedSemaphore(self.max_concurrency),
+                    RateLimiter(self.requests_per_second, burst=self.max_concurrency)
+                )
+            return self._hosts[host]
+
+    @contextmanager
+    def slot(self, url: str):
+        """해당 호스트에 요청을 보낼 차례가 될 때까지 기다렸다가 연결 슬롯을 점유합니다."""
+        semaphore, rate_limiter = self._limits(urlparse(url).netloc)
+        with semaphore:
+            rate_limiter.acquire()
+            yield
+
+
+class DownloadPipeline:
+    """연결을 재사용하는 세션과 호스트별 제한, 항목별 제한 시간을 갖춘 다운로드 도구
+
+    응답이 멈추면 읽기 타임아웃이, 조금씩 흘러 들어오면 청크마다 확인하는 전체 제한 시간(deadline)이
+    다운로드를 끊으므로 연결 하나가 전체 수집을 붙잡아 두지 않습니다.
+    """
+
+    def __init__(self, max_workers: int = 8, per_host_concurrency: int = 2,
+                 per_host_rate: float = 2.0, connect_timeout: float = 10,
+                 read_timeout: float = 30, deadline: float = 120,
+                 chunk_size: int = 16 * 1024, session: Optional[requests.Session] = None,
+                 cache: Optional[HttpCache] = None):
+        self.max_workers = max_workers
+        self.timeout = (connect_timeout, read_timeout)
+        self.deadline = deadline
+        self.chunk_size = chunk_size
+        self.politeness = HostPoliteness(per_host_concurrency, per_host_rate)
+        # 조건부 요청용 디스크 캐시 (선택)
+        self.cache = cache
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def download(self, url: str, write: Callable[[bytes], Optional[bool]], use_cache: bool = False) -> int:
+        """응답 본문을 청크 단위로 write에 전달하고 받은 바이트 수를 반환합니다.
+
+        write가 False를 반환하면 그 자리에서 다운로드를 멈춥니다.
+        use_cache=True이고 캐시가 있으면 버전이 고정된 arXiv 주소는 요청 없이 캐시에서, 그 밖의 주소는
+        조건부 요청(If-None-Match/If-Modified-Since)으로 확인한 뒤 304이면 캐시에서 읽습니다.
+        본문을 끝까지 받은 경우에만 캐시에 저장하며, 중간에 멈춘 본문은 버립니다.
+        HTTP 오류는 requests.HTTPError, 제한 시간 초과는 DownloadTimeout으로 알립니다.
+        """
+        cache = self.cache if use_cache else None
+        entry = cache.lookup(url) if cache is not None else None
+        if entry and is_immutable_url(url):
+            self._replay(entry["path"], write)
+            cache.record_hit(url, entry["size"])
+            return entry["size"]
+
+        headers = cache.conditional_headers(entry) if entry else {}
+        with self.politeness.slot(url):
+            # 호스트 슬롯을 기다린 시간은 제한 시간에 포함하지 않음
+            started = time.monotonic()
+            with self.session.get(url, stream=True, timeout=self.timeout, headers=headers) as response:
+                if entry and response.status_code == 304:
+                    self._replay(entry["path"], write)
+                    cache.record_hit(url, entry["size"], revalidated=True)
+                    return entry["size"]
+                response.raise_for_status()
+
+                cache_path = None
+                if cache is not None:
+                    cache.record_miss()
+                    cache_path = f"{cache.body_path(url)}.{threading.get_ident()}.part"
+                cache_file = open(cache_path, "wb") if cache_path else None
+                try:
+                    received = 0
+                    completed = True
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        if time.monotonic() - started > self.deadline:
+                            raise DownloadTimeout(f"{self.deadline:g}초 안에 다운로드를 마치지 못했습니다: {url}")
+                        if not chunk:
+                            continue
+                        received += len(chunk)
+                        if cache_file:
+                            cache_file.write(chunk)
+                        if write(chunk) is False:
+                            completed = False
+                            break
+                    if cache_file and completed:
+                        cache_file.close()
+                        cache.store(url, cache_path, response.headers.get("ETag"),
+                                    response.headers.get("Last-Modified"))
+                    return received
+                finally:
+                    if cache_file:
+                        cache_file.close()
+                    # 저장하지 않은(중간에 멈췄거나 오류가 난) 임시 파일은 지움
+                    if cache_path and os.path.exists(cache_path):
+                        os.remove(cache_path)
+
+    def _replay(self, path: str, write: Callable[[bytes], Optional[bool]]):
+        """캐시된 본문을 다운로드와 같은 방식으로 write에 전달합니다."""
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk or write(chunk) is False:
+                    return
+
+    def fetch_bytes(self, url: str) -> Tuple[bytes, str]:
+        """응답 본문을 디스크를 거치지 않고 메모리로 받으며, 받는 동안 SHA-256을 함께 계산합니다 (캐시 사용 안 함)."""
+        buffer = BytesIO()
+        digest = hashlib.sha256()
+
+        def write(chunk: bytes):
+            buffer.write(chunk)
+            digest.update(chunk)
+
+        self.download(url, write)
+        return buffer.getvalue(), digest.hexdigest()
+
+    def fetch_text(self, url: str, use_cache: bool = False) -> str:
+        """응답 본문 전체를 문자열로 받아옵니다."""
+        chunks = []
+        self.download(url, chunks.append, use_cache=use_cache)
+        return b"".join(chunks).decode("utf-8", errors="replace")
+
+    def run(self, task: Callable[[], None]) -> Dict:
+        """작업을 실행하고 상태(ok/timeout/error), 소요 시간, 오류 메시지를 반환합니다."""
+        started = time.monotonic()
+        status = {"status": "ok", "seconds": 0.0, "error": None}
+        try:
+            task()
+        except (DownloadTimeout, requests.Timeout) as e:
+            status.update(status="timeout", error=str(e))
+        except Exception as e:
+            status.update(status="error", error=str(e))
+        status["seconds"] = round(time.monotonic() - started, 3)
+        return status
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,135 @@
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def default_health_check(driver: Any) -> bool:
+    """드라이버 세션이 살아 있는지 확인합니다."""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+class DriverPool:
+    """오래 유지되는 WebDriver를 정해진 수만큼 두고 필요할 때 빌려 쓰는 풀
+
+    빌려줄 때마다 상태를 확인하고, 응답하지 않거나 max_uses번 사용한 드라이버는 새로 만듭니다.
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int = 4, max_uses: int = 50,
+                 health_check: Callable[[Any], bool] = default_health_check):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.health_check = health_check
+        self.created = 0
+        self.recycled = 0
+        self._idle: "queue.Queue" = queue.Queue()
+        self._uses: Dict[int, int] = {}
+        self._live = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _acquire(self) -> Any:
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("이미 닫힌 드라이버 풀입니다.")
+                try:
+                    return self._idle.get_nowait()
+                except queue.Empty:
+                    pass
+                create = self._live < self.size
+                if create:
+                    self._live += 1
+
+            if create:
+                try:
+                    return self._create()
+                except Exception:
+                    with self._lock:
+                        self._live -= 1
+                    raise
+            # 다른 스레드가 반납하거나, 재생성에 실패해 자리가 비면 다시 시도
+            try:
+                return self._idle.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+    def _create(self) -> Any:
+        driver = self.factory()
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self.created += 1
+        return driver
+
+    def _discard(self, driver: Any):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"드라이버 종료 중 오류 (무시): {str(e)}")
+
+    def _replace(self, driver: Any) -> Any:
+        self._discard(driver)
+        with self._lock:
+            self.recycled += 1
+        try:
+            return self._create()
+        except Exception:
+            with self._lock:
+                self._live -= 1
+            raise
+
+    @contextmanager
+    def checkout(self):
+        """드라이버 하나를 빌려주고, 블록이 끝나면 풀에 돌려놓습니다.
+
+        블록 안에서 예외가 나면 그 드라이버는 상태를 알 수 없으므로 새로 만듭니다.
+        """
+        driver = self._acquire()
+        with self._lock:
+            worn_out = self._uses.get(id(driver), 0) >= self.max_uses
+        if worn_out or not self.health_check(driver):
+            driver = self._replace(driver)
+
+        healthy = True
+        try:
+            yield driver
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            with self._lock:
+                self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+                closed = self._closed
+            if closed:
+                self._discard(driver)
+            elif healthy:
+                self._idle.put(driver)
+            else:
+                try:
+                    self._idle.put(self._replace(driver))
+                except Exception as e:
+                    logger.error(f"드라이버 재생성 중 오류 발생: {str(e)}")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"live": self._live, "created": self.created, "recycled": self.recycled}
+
+    def close(self):
+        """모든 드라이버를 종료합니다. 사용 중인 드라이버는 반납될 때 종료됩니다."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
@@ -4,7 +4,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from dotenv import load_dotenv
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 class EmailSender:
     def __init__(self):
@@ -90,9 +90,11 @@ class EmailSender:
         """
         return html
     
-    def send_report(self, papers: List[Dict[str, Any]]) -> bool:
-        """Send the paper report to all recipients."""
-        if not self.recipient_list:
+    def send_report(self, papers: List[Dict[str, Any]], recipients: Optional[List[str]] = None,
+                    report_name: Optional[str] = None) -> bool:
+        """Send the paper report to the given recipients (all recipients by default)."""
+        recipients = self.recipient_list if recipients is None else recipients
+        if not recipients:
             print("No recipients found. Skipping email sending.")
             return False
         
@@ -103,8 +105,10 @@ class EmailSender:
         try:
             msg = MIMEMultipart('alternative')
             msg['Subject'] = f"{self.subject_prefix}Daily AI Paper Report - {datetime.now().strftime('%Y-%m-%d')}"
+            if report_name:
+                msg['Subject'] += f" ({report_name})"
             msg['From'] = self.sender_email
-            msg['To'] = ', '.join(self.recipient_list)
+            msg['To'] = ', '.join(recipients)
             
             html_content = self._create_html_content(papers)
             msg.attach(MIMEText(html_content, 'html'))
@@ -114,9 +118,28 @@ class EmailSender:
                 server.login(self.sender_email, self.sender_password)
                 server.send_message(msg)
             
-            print(f"Report sent successfully to {len(self.recipient_list)} recipients")
+            print(f"Report sent successfully to {len(recipients)} recipients")
             return True
             
         except Exception as e:
             print(f"Failed to send email: {str(e)}")
-            return False 
\ No newline at end of file
+            return False
+
+    def send_personalized_reports(self, default_papers: List[Dict[str, Any]],
+                                  group_reports: Dict[str, Dict[str, Any]]) -> bool:
+        """Send each recipient group its own report and everyone else the default report.
+
+        group_reports maps a group name to {"emails": [...], "papers": [...]}.
+        """
+        assigned = set()
+        success = True
+        for name, report in group_reports.items():
+            emails = [email for email in report.get("emails", []) if email not in assigned]
+            assigned.update(emails)
+            if emails:
+                success = self.send_report(report["papers"], recipients=emails, report_name=name) and success
+
+        remaining = [email for email in self.recipient_list if email not in assigned]
+        if remaining:
+            success = self.send_report(default_papers, recipients=remaining) and success
+        return success
@@ -0,0 +1,81 @@
+import datetime
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class HarvestState:
+    """검색별로 마지막으로 수집한 논문의 게시 시각(high-water mark)과 이미 본 arXiv ID를 기록합니다.
+
+    arXiv는 제출 후 공개까지 시간이 걸려 기준 시각보다 이전에 제출된 논문이 뒤늦게 나타날 수 있으므로,
+    기준 시각에서 overlap_hours만큼 앞선 시점까지 다시 확인하고 이미 본 ID는 건너뜁니다.
+    """
+
+    def __init__(self, path: str, overlap_hours: float = 24):
+        self.path = path
+        self.overlap = datetime.timedelta(hours=overlap_hours)
+        self._queries: Dict[str, Dict] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def high_water_mark(self, key: str) -> Optional[datetime.datetime]:
+        """가장 최근에 수집한 논문의 게시 시각을 반환합니다."""
+        with self._lock:
+            mark = self._queries.get(key, {}).get("high_water_mark")
+        return datetime.datetime.fromisoformat(mark) if mark else None
+
+    def cutoff(self, key: str) -> Optional[datetime.datetime]:
+        """이 시각보다 오래된 결과가 나오면 검색을 중단해도 됩니다."""
+        mark = self.high_water_mark(key)
+        return mark - self.overlap if mark else None
+
+    def is_seen(self, key: str, arxiv_id: str) -> bool:
+        with self._lock:
+            return arxiv_id in self._queries.get(key, {}).get("seen_ids", {})
+
+    def record(self, key: str, arxiv_id: str, published: datetime.datetime):
+        """수집한 논문을 기록하고 기준 시각을 갱신합니다."""
+        with self._lock:
+            query = self._queries.setdefault(key, {"high_water_mark": None, "seen_ids": {}})
+            query["seen_ids"][arxiv_id] = published.isoformat()
+            if query["high_water_mark"] is None or published > datetime.datetime.fromisoformat(query["high_water_mark"]):
+                query["high_water_mark"] = published.isoformat()
+            self._dirty = True
+
+    def save(self):
+        """겹침 구간보다 오래된 ID를 정리한 뒤 상태를 파일에 저장합니다."""
+        with self._lock:
+            if not self._dirty:
+                return
+            for query in self._queries.values():
+                if not query["high_water_mark"]:
+                    continue
+                oldest = datetime.datetime.fromisoformat(query["high_water_mark"]) - self.overlap
+                query["seen_ids"] = {
+                    arxiv_id: published for arxiv_id, published in query["seen_ids"].items()
+                    if datetime.datetime.fromisoformat(published) >= oldest
+                }
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._queries, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.error(f"수집 상태 저장 중 오류 발생: {str(e)}")
+
+    def _load(self):
+        """파일에 저장된 수집 상태를 불러옵니다."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._queries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"수집 상태 로드 중 오류 발생: {str(e)}")
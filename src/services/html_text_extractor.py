@@ -0,0 +1,79 @@
+import codecs
+import re
+from html.parser import HTMLParser
+from typing import List
+
+_WHITESPACE = re.compile(r"\s+")
+
+# <main> 안에서도 본문이 아닌 요소
+SKIPPED_TAGS = {"script", "style", "nav", "header", "footer", "button", "annotation", "annotation-xml"}
+
+# 앞뒤로 공백을 넣어 단어가 붙지 않도록 하는 블록 요소
+BLOCK_TAGS = {
+    "p", "div", "section", "article", "br", "li", "ul", "ol", "table", "tr", "td", "th",
+    "h1", "h2", "h3", "h4", "h5", "h6", "figcaption", "blockquote", "pre", "dd", "dt"
+}
+
+
+class MainTextParser(HTMLParser):
+    """문서 트리를 만들지 않고 <main> 안의 텍스트만 모으는 스트리밍 파서
+
+    청크 단위로 feed할 수 있으며, </main>을 만나면 done이 True가 되어 나머지는 읽지 않아도 됩니다.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.done = False
+        self._main_depth = 0
+        self._skip_depth = 0
+        self._pieces: List[str] = []
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def feed_bytes(self, chunk: bytes) -> bool:
+        """바이트 청크를 파싱하고, 더 읽어야 하면 True를 반환합니다."""
+        if not self.done:
+            self.feed(self._decoder.decode(chunk))
+        return not self.done
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == "main":
+            self._main_depth += 1
+        elif self._main_depth:
+            if tag in SKIPPED_TAGS:
+                self._skip_depth += 1
+            elif tag in BLOCK_TAGS:
+                self._pieces.append(" ")
+
+    def handle_endtag(self, tag):
+        if self.done or not self._main_depth:
+            return
+        if tag == "main":
+            self._main_depth -= 1
+            if not self._main_depth:
+                self.done = True
+        elif tag in SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self._pieces.append(" ")
+
+    def handle_data(self, data):
+        if self._main_depth and not self._skip_depth and not self.done:
+            self._pieces.append(data)
+
+    @property
+    def found_main(self) -> bool:
+        return self.done or self._main_depth > 0
+
+    def text(self) -> str:
+        """공백을 정리한 본문 텍스트를 반환합니다."""
+        return _WHITESPACE.sub(" ", "".join(self._pieces)).strip()
+
+
+def extract_main_text(html: str) -> str:
+    """HTML 문자열에서 <main> 본문 텍스트를 추출합니다."""
+    parser = MainTextParser()
+    parser.feed(html)
+    parser.close()
+    return parser.text()
@@ -0,0 +1,154 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from .arxiv_utils import parse_arxiv_id
+
+logger = logging.getLogger(__name__)
+
+
+def is_immutable_url(url: str) -> bool:
+    """버전이 명시된 arXiv PDF/HTML 주소처럼 내용이 바뀌지 않는 주소인지 확인합니다."""
+    if not urlparse(url).netloc.endswith("arxiv.org"):
+        return False
+    if not any(marker in url for marker in ("/pdf/", "/html/", "/abs/")):
+        return False
+    _, version = parse_arxiv_id(url)
+    return version is not None
+
+
+class HttpCache:
+    """ETag/Last-Modified를 기록해 조건부 요청에 쓰는 디스크 HTTP 캐시
+
+    본문은 cache_dir 아래 파일로, 메타데이터는 SQLite에 저장합니다.
+    전체 크기가 상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    디렉터리와 SQLite 파일은 처음 조회할 때 만들어지므로 객체를 만드는 것만으로는 파일이 생기지 않습니다.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1024 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """SQLite 연결을 반환합니다. 처음 호출될 때 디렉터리와 테이블을 만듭니다 (self._lock 안에서 호출)."""
+        if self._conn is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            conn = sqlite3.connect(os.path.join(self.cache_dir, "index.db"), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS http_cache (
+                        url TEXT PRIMARY KEY,
+                        etag TEXT,
+                        last_modified TEXT,
+                        size INTEGER NOT NULL,
+                        accessed_at REAL NOT NULL
+                    )
+                """)
+            self._conn = conn
+        return self._conn
+
+    def body_path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".body")
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """캐시 항목(etag, last_modified, size, path)을 반환합니다. 본문 파일이 없으면 None입니다."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT etag, last_modified, size FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        path = self.body_path(url)
+        if not os.path.exists(path):
+            return None
+        return {"etag": row[0], "last_modified": row[1], "size": row[2], "path": path}
+
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record_hit(self, url: str, size: int, revalidated: bool = False):
+        """캐시에서 응답한 경우 통계와 사용 시각을 갱신합니다."""
+        with self._lock:
+            if revalidated:
+                self.revalidated += 1
+            else:
+                self.hits += 1
+            self.bytes_saved += size
+            conn = self._connection()
+            with conn:
+                conn.execute("UPDATE http_cache SET accessed_at = ? WHERE url = ?", (time.time(), url))
+
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def store(self, url: str, tmp_path: str, etag: Optional[str], last_modified: Optional[str]):
+        """임시 파일로 받은 본문을 캐시에 넣고 용량 초과 항목을 정리합니다."""
+        size = os.path.getsize(tmp_path)
+        if size > self.max_bytes:
+            os.remove(tmp_path)
+            return
+        with self._lock:
+            conn = self._connection()
+            os.replace(tmp_path, self.body_path(url))
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, size, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (url, etag, last_modified, size, time.time())
+                )
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        """전체 크기가 상한을 넘으면 오래 사용되지 않은 항목부터 지웁니다."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        stale_urls = []
+        for url, size in conn.execute("SELECT url, size FROM http_cache ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            stale_urls.append(url)
+            total -= size
+        conn.executemany("DELETE FROM http_cache WHERE url = ?", [(url,) for url in stale_urls])
+        for url in stale_urls:
+            try:
+                os.remove(self.body_path(url))
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """적중률과 절약한 바이트 수를 반환합니다."""
+        with self._lock:
+            total = self.hits + self.revalidated + self.misses
+            return {
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.revalidated) / total if total else 0.0,
+                "bytes_saved": self.bytes_saved,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,74 @@
+import re
+from typing import Dict, Iterable, List, Mapping, Set
+
+_WORD_CHAR = re.compile(r"\w")
+
+
+class KeywordMatcher:
+    """여러 키워드 그룹을 하나의 정규식으로 컴파일해 텍스트를 한 번만 훑는 매처
+
+    lexicon은 {그룹 이름: 키워드 목록} 형식입니다. 키워드는 단어 경계에서 시작할 때만
+    인정하며(대소문자 무시), whole_words=False이면 'result'가 'results'처럼
+    같은 단어로 시작하는 형태도 찾습니다. 여러 단어로 된 키워드는 사이 공백 종류를 가리지 않습니다.
+    겹치는 키워드('neural'과 'neural network')는 그룹과 상관없이 각각 셉니다.
+    """
+
+    def __init__(self, lexicon: Mapping[str, Iterable[str]], whole_words: bool = False):
+        self.groups = list(lexicon)
+        self._groups_by_keyword: Dict[str, Set[str]] = {}
+        for group, keywords in lexicon.items():
+            for keyword in keywords:
+                normalized = self._normalize(keyword)
+                if normalized:
+                    self._groups_by_keyword.setdefault(normalized, set()).add(group)
+
+        # 긴 키워드를 먼저 두어 위치마다 가장 긴 키워드가 잡히도록 하고,
+        # 같은 위치에서 함께 일치하는 짧은 키워드(가장 긴 키워드의 접두어)는 미리 목록으로 만들어 둠
+        keywords = sorted(self._groups_by_keyword, key=len, reverse=True)
+        self._keywords_at: Dict[str, List[str]] = {
+            longest: [keyword for keyword in keywords
+                      if longest.startswith(keyword)
+                      and (not whole_words or len(keyword) == len(longest)
+                           or not _WORD_CHAR.match(longest, len(keyword)))]
+            for longest in keywords
+        }
+        alternatives = [r"\s+".join(re.escape(word) for word in keyword.split()) for keyword in keywords]
+        # 'c++'처럼 단어 문자가 아닌 문자로 끝나는 키워드도 있으므로 \b 대신 (?!\w)로 단어 끝을 확인
+        suffix = r"(?!\w)" if whole_words else ""
+        # 전방 탐색으로 잡아 매치가 글자를 소비하지 않으므로 'neural network' 안의 'network'도 찾음
+        # 텍스트를 소문자로 바꿔 검사하므로 IGNORECASE 없이 컴파일 (더 빠름)
+        self._pattern = re.compile(rf"\b(?=((?:{'|'.join(alternatives)}){suffix}))") if alternatives else None
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    def matches(self, text: str) -> Dict[str, Set[str]]:
+        """그룹별로 텍스트에 나온 (서로 다른) 키워드 집합을 반환합니다."""
+        found: Dict[str, Set[str]] = {group: set() for group in self.groups}
+        if self._pattern is None or not text:
+            return found
+        for longest in set(self._pattern.findall(text.lower())):
+            if longest not in self._keywords_at:
+                # 여러 단어 키워드는 줄바꿈 등 다른 공백으로 이어져 있을 수 있음
+                longest = self._normalize(longest)
+            for keyword in self._keywords_at.get(longest, ()):
+                for group in self._groups_by_keyword[keyword]:
+                    found[group].add(keyword)
+        return found
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """그룹별로 텍스트에 나온 서로 다른 키워드 수를 반환합니다."""
+        return {group: len(keywords) for group, keywords in self.matches(text).items()}
+
+    def count_many(self, texts: Iterable[str]) -> Dict[str, List[int]]:
+        """여러 텍스트의 그룹별 키워드 수를 열 단위로 반환합니다."""
+        columns: Dict[str, List[int]] = {group: [] for group in self.groups}
+        for text in texts:
+            for group, count in self.counts(text).items():
+                columns[group].append(count)
+        return columns
+
+    def matched_groups(self, text: str) -> List[str]:
+        """키워드가 하나 이상 나온 그룹 이름을 lexicon 순서대로 반환합니다 (태그 부여용)."""
+        return [group for group, keywords in self.matches(text).items() if keywords]
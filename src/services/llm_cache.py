@@ -0,0 +1,107 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """프롬프트 내용으로 주소를 정하는 LLM 응답 캐시 (LRU 방식)"""
+
+    def __init__(self, max_entries: int = 2048, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        if path:
+            self._load()
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: str,
+                 temperature: float, max_tokens: int, **options: Any) -> str:
+        """요청 내용의 해시로 캐시 키를 생성합니다."""
+        request = {
+            "model": model,
+            "system": system_prompt,
+            "user": user_prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            # 응답 형식, 종료 문자열 등 결과에 영향을 주는 추가 옵션
+            "options": {name: value for name, value in options.items() if value},
+        }
+        encoded = json.dumps(request, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답을 반환하고, 없으면 None을 반환합니다."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: str):
+        """응답을 캐시에 저장하고, 용량을 넘으면 가장 오래 사용되지 않은 항목을 제거합니다."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def discard(self, key: str):
+        """캐시에서 항목을 제거합니다 (잘못된 응답이 저장되어 있던 경우 등)."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._dirty = True
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/미스 통계를 반환합니다."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": len(self._entries),
+            }
+
+    def flush(self):
+        """변경된 캐시 내용을 파일에 저장합니다."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    # 사용 순서를 유지하도록 목록 형태로 저장
+                    json.dump(list(self._entries.items()), f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.error(f"LLM 응답 캐시 저장 중 오류 발생: {str(e)}")
+
+    def _load(self):
+        """파일에 저장된 캐시 내용을 불러옵니다."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            self._entries = OrderedDict(entries[-self.max_entries:])
+        except (OSError, ValueError) as e:
+            logger.error(f"LLM 응답 캐시 로드 중 오류 발생: {str(e)}")
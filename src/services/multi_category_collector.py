@@ -0,0 +1,101 @@
+import datetime
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+import arxiv
+
+from .arxiv_search import build_category_query, iter_window_papers, page_size_for
+from .arxiv_utils import parse_arxiv_id
+from .harvest_state import HarvestState
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitedClient(arxiv.Client):
+    """모든 페이지 요청(재시도 포함) 전에 공유 속도 제한기를 거치는 arXiv 클라이언트"""
+
+    def __init__(self, rate_limiter: RateLimiter, **kwargs):
+        # 요청 간격은 공유 제한기가 관리하므로 클라이언트별 지연은 두지 않음
+        kwargs.setdefault("delay_seconds", 0)
+        super().__init__(**kwargs)
+        self.rate_limiter = rate_limiter
+
+    def _parse_feed(self, url: str, first_page: bool = True, _try_index: int = 0):
+        self.rate_limiter.acquire()
+        return super()._parse_feed(url, first_page=first_page, _try_index=_try_index)
+
+
+class MultiCategoryCollector:
+    """카테고리별 검색을 동시에 실행하고 arXiv ID 기준으로 중복을 제거해 합칩니다.
+
+    여러 카테고리에 교차 등록된 논문은 한 번만 남고, 전체 소요 시간은
+    가장 느린 카테고리에 가깝게 유지됩니다.
+    """
+
+    def __init__(self, categories: Iterable[str], rate_limiter: RateLimiter,
+                 expected_volume: int = 500, windowed: bool = True,
+                 max_workers: Optional[int] = None, num_retries: int = 3,
+                 query_url_format: Optional[str] = None):
+        self.categories = list(dict.fromkeys(categories))
+        self.rate_limiter = rate_limiter
+        self.expected_volume = expected_volume
+        self.windowed = windowed
+        self.max_workers = max_workers or len(self.categories)
+        self.num_retries = num_retries
+        self.query_url_format = query_url_format
+        self.category_counts: Dict[str, int] = {}
+
+    def _make_client(self) -> RateLimitedClient:
+        client = RateLimitedClient(
+            self.rate_limiter,
+            page_size=page_size_for(self.expected_volume),
+            num_retries=self.num_retries
+        )
+        if self.query_url_format:
+            client.query_url_format = self.query_url_format
+        return client
+
+    def collect(self, start: datetime.datetime, end: datetime.datetime,
+                state: Optional[HarvestState] = None,
+                state_prefix: str = "multi_category") -> List[arxiv.Result]:
+        """[start, end) 기간의 논문을 모든 카테고리에서 모아 최신순으로 반환합니다.
+
+        state가 주어지면 카테고리마다 '<state_prefix>:cat:<카테고리>' 키로 증분 수집합니다.
+        """
+        merged: Dict[str, arxiv.Result] = {}
+        lock = threading.Lock()
+
+        def collect_category(category: str) -> int:
+            count = 0
+            # arxiv.Client는 마지막 요청 시각을 기록하므로 스레드마다 따로 생성
+            client = self._make_client()
+            for paper in iter_window_papers(
+                client, [category], start, end, windowed=self.windowed, state=state,
+                state_key=f"{state_prefix}:{build_category_query([category])}"
+            ):
+                base_id, _ = parse_arxiv_id(paper.entry_id)
+                with lock:
+                    merged.setdefault(base_id, paper)
+                count += 1
+            return count
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {category: executor.submit(collect_category, category) for category in self.categories}
+            self.category_counts = {}
+            for category, future in futures.items():
+                try:
+                    self.category_counts[category] = future.result()
+                except Exception as e:
+                    logger.error(f"{category} 논문 수집 중 오류 발생: {str(e)}")
+                    self.category_counts[category] = 0
+
+        logger.info(
+            f"{len(self.categories)}개 카테고리에서 {sum(self.category_counts.values())}건, "
+            f"중복 제거 후 {len(merged)}개 논문 수집 ({time.monotonic() - started:.1f}초)"
+        )
+        return sorted(merged.values(), key=lambda paper: paper.published, reverse=True)
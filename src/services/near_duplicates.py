@@ -0,0 +1,152 @@
+import re
+import zlib
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# 해시 값은 32비트이므로 2^32는 "shingle 없음"을 나타내는 값으로 씀
+_EMPTY = np.uint64(1 << 32)
+_SHIFT = np.uint64(32)
+_MASK32 = np.uint64(0xFFFFFFFF)
+_MIX = np.uint64(0x01000193)
+_TOKEN = re.compile(r"\w+")
+
+
+class MinHashDeduper:
+    """제목+초록의 단어 n-gram(shingle)으로 MinHash 서명을 만들고 LSH로 거의 같은 논문을 묶습니다.
+
+    서명을 bands개 구간으로 나눠 같은 구간 값을 가진 논문만 후보 쌍으로 비교하므로
+    모든 쌍을 비교하지 않고도 추정 Jaccard 유사도가 threshold 이상인 쌍으로 이어진 묶음을 찾습니다.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, threshold: float = 0.8,
+                 shingle_size: int = 3, seed: int = 1, chunk_elements: int = 4_000_000):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands로 나누어 떨어져야 합니다.")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        # 한 번에 계산하는 (해시 함수 수 x shingle 수) 행렬의 최대 원소 수
+        self.chunk_elements = chunk_elements
+
+        # 해시 함수 h(x) = (a * x + b) mod 2^64 >> 32 (a는 홀수, multiply-shift 방식)
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+        self._band_weights = rng.integers(1, 1 << 62, size=self.rows, dtype=np.uint64) | np.uint64(1)
+        self._token_hashes: Dict[str, int] = {}
+
+    def _shingles(self, text: str) -> np.ndarray:
+        """텍스트의 단어 n-gram 해시(32비트)를 반환합니다."""
+        tokens = _TOKEN.findall(text.lower())
+        if not tokens:
+            return np.empty(0, dtype=np.uint64)
+        cache = self._token_hashes
+        hashes = np.fromiter(
+            (cache[token] if token in cache else cache.setdefault(token, zlib.crc32(token.encode("utf-8")))
+             for token in tokens),
+            dtype=np.uint64, count=len(tokens)
+        )
+        size = min(self.shingle_size, len(hashes))
+        # n개 연속 단어의 해시를 FNV 방식으로 섞어 하나의 shingle 해시로 만듦
+        combined = hashes[:len(hashes) - size + 1].copy()
+        for offset in range(1, size):
+            combined = ((combined * _MIX) ^ hashes[offset:len(hashes) - size + 1 + offset]) & _MASK32
+        return np.unique(combined)
+
+    def signatures(self, texts: Sequence[str]) -> np.ndarray:
+        """(논문 수, num_perm) 크기의 MinHash 서명 행렬을 반환합니다.
+
+        단어가 하나도 없는 텍스트의 행은 모두 _EMPTY로 채워지며 중복 판정에서 제외됩니다.
+        """
+        signatures = np.full((len(texts), self.num_perm), _EMPTY, dtype=np.uint64)
+        shingles = [self._shingles(text or "") for text in texts]
+
+        start = 0
+        while start < len(texts):
+            # 행렬 크기가 chunk_elements를 넘지 않도록 논문을 묶어서 계산
+            end, total = start + 1, len(shingles[start])
+            while end < len(texts) and (total + len(shingles[end])) * self.num_perm <= self.chunk_elements:
+                total += len(shingles[end])
+                end += 1
+
+            chunk = shingles[start:end]
+            lengths = np.array([len(s) for s in chunk])
+            non_empty = np.flatnonzero(lengths)
+            if len(non_empty):
+                values = np.concatenate([chunk[i] for i in non_empty])
+                offsets = np.concatenate([[0], np.cumsum(lengths[non_empty])[:-1]])
+                # 큰 행렬을 새로 만들지 않도록 제자리 연산 사용
+                hashed = np.multiply.outer(self._a, values)
+                hashed += self._b[:, None]
+                hashed >>= _SHIFT
+                signatures[start + non_empty] = np.minimum.reduceat(hashed, offsets, axis=1).T
+            start = end
+        return signatures
+
+    def _candidate_pairs(self, signatures: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        """밴드 값이 같은 논문(같은 버킷)을 잇는 후보 쌍을 (i, j) 배열로 반환합니다.
+
+        버킷 안의 모든 쌍을 만들지 않고, 각 논문을 버킷의 첫 논문 및 바로 앞 논문과만 이어
+        버킷 크기에 비례하는 수의 쌍만 만듭니다. 묶음은 확인된 쌍의 연결 요소로 정해지므로
+        같은 글이 수천 번 반복되는 버킷도 선형 시간에 처리됩니다.
+        """
+        indices = np.flatnonzero(valid)
+        edges = []
+        for band in range(self.bands):
+            block = signatures[indices, band * self.rows:(band + 1) * self.rows]
+            keys = (block * self._band_weights).sum(axis=1)
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            same = sorted_keys[1:] == sorted_keys[:-1]
+            # 바로 앞 논문과 잇는 쌍
+            edges.append(np.column_stack([order[:-1][same], order[1:][same]]))
+            # 버킷의 첫 논문과 잇는 쌍
+            starts = np.flatnonzero(np.concatenate([[True], ~same]))
+            first = np.repeat(order[starts], np.diff(np.append(starts, len(order))))
+            linked = first != order
+            edges.append(np.column_stack([first[linked], order[linked]]))
+
+        pairs = indices[np.concatenate(edges)] if edges else np.empty((0, 2), dtype=np.int64)
+        if not len(pairs):
+            return np.empty((0, 2), dtype=np.int64)
+        return np.unique(np.sort(pairs, axis=1), axis=0).astype(np.int64)
+
+    def clusters(self, texts: Sequence[str], signatures: Optional[np.ndarray] = None) -> List[List[int]]:
+        """거의 같은 논문끼리 묶은 인덱스 목록(2개 이상인 묶음만)을 반환합니다."""
+        if signatures is None:
+            signatures = self.signatures(texts)
+        valid = (signatures != _EMPTY).any(axis=1)
+        pairs = self._candidate_pairs(signatures, valid)
+        if not len(pairs):
+            return []
+
+        # 후보 쌍의 실제 서명 일치율(추정 Jaccard 유사도)로 확인
+        similarity = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+        parent = list(range(len(texts)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, j in pairs[similarity >= self.threshold]:
+            root_i, root_j = find(int(i)), find(int(j))
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(texts)):
+            groups.setdefault(find(i), []).append(i)
+        return [members for members in groups.values() if len(members) > 1]
+
+    def collapse(self, texts: Sequence[str], scores: Sequence[float]) -> List[int]:
+        """묶음마다 점수가 가장 높은(동점이면 앞선) 논문만 남긴 인덱스를 입력 순서대로 반환합니다."""
+        dropped = set()
+        for members in self.clusters(texts):
+            best = max(members, key=lambda i: (scores[i], -i))
+            dropped.update(i for i in members if i != best)
+        return [i for i in range(len(texts)) if i not in dropped]
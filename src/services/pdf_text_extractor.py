@@ -0,0 +1,245 @@
+import logging
+import os
+import re
+import signal
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO, StringIO
+from itertools import islice
+from typing import BinaryIO, List, Optional, Union
+
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import LITERAL_PAGE, LITERAL_PAGES, PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import resolve1
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def select_pages(page_count: int, max_pages: Optional[int]) -> List[int]:
+    """앞쪽 max_pages 페이지와 (결론이 있는) 마지막 페이지의 번호를 반환합니다."""
+    if not max_pages or page_count <= max_pages + 1:
+        return list(range(page_count))
+    return list(range(max_pages)) + [page_count - 1]
+
+
+def _page_count(document: PDFDocument) -> Optional[int]:
+    """페이지 트리 루트의 Count 값을 반환합니다 (없거나 잘못되면 None)."""
+    try:
+        return int(resolve1(resolve1(document.catalog["Pages"])["Count"]))
+    except Exception:
+        return None
+
+
+def _last_page(document: PDFDocument) -> Optional[PDFPage]:
+    """페이지 트리에서 마지막 자식만 따라 내려가 마지막 페이지를 찾습니다 (상속 속성 반영)."""
+    try:
+        ref = document.catalog["Pages"]
+        inherited = {}
+        for _ in range(64):  # 잘못된 순환 참조 대비
+            node = dict(resolve1(ref))
+            for key, value in inherited.items():
+                node.setdefault(key, value)
+            node_type = node.get("Type")
+            if node_type is LITERAL_PAGES and resolve1(node.get("Kids")):
+                inherited = {key: value for key, value in node.items() if key in PDFPage.INHERITABLE_ATTRS}
+                ref = resolve1(node["Kids"])[-1]
+            elif node_type is LITERAL_PAGE:
+                return PDFPage(document, getattr(ref, "objid", None), node, None)
+            else:
+                return None
+    except Exception:
+        return None
+    return None
+
+
+def _selected_pages(document: PDFDocument, max_pages: Optional[int]) -> List[PDFPage]:
+    """select_pages가 고른 페이지 객체만 읽습니다.
+
+    앞쪽 max_pages 페이지까지만 순회하고 마지막 페이지는 페이지 트리에서 바로 찾으므로,
+    나머지 페이지 객체는 읽지 않습니다. 페이지 수를 알 수 없으면 전체를 순회합니다.
+    """
+    count = _page_count(document) if max_pages else None
+    if count is not None:
+        selected = select_pages(count, max_pages)
+        if len(selected) < count:
+            head = list(islice(PDFPage.create_pages(document), max_pages))
+            last = _last_page(document)
+            if len(head) == max_pages and last is not None:
+                return head + [last]
+    pages = list(PDFPage.create_pages(document))
+    return [pages[number] for number in select_pages(len(pages), max_pages)]
+
+
+def _on_deadline(signum, frame):
+    raise TimeoutError("PDF 텍스트 추출 제한 시간을 넘겼습니다.")
+
+
+def extract_pdf_text(source: Union[str, BinaryIO], output_path: str,
+                     max_pages: Optional[int] = None, timeout: Optional[float] = None) -> int:
+    """PDF 텍스트를 페이지 단위로 추출해 공백을 정리한 뒤 바로 파일에 이어 씁니다.
+
+    문서 전체 텍스트를 메모리에 모으지 않으며, 완료되면 임시 파일을 output_path로 옮깁니다.
+    기록한 페이지 수를 반환하고 실패하면 예외를 전달합니다.
+    """
+    # 워커 프로세스의 메인 스레드에서는 SIGALRM으로 한 페이지 처리 도중에도 중단할 수 있음
+    use_alarm = bool(timeout) and hasattr(signal, "setitimer")
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _on_deadline)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    deadline = time.monotonic() + timeout if timeout else None
+
+    tmp_path = f"{output_path}.part"
+    pdf_file = open(source, "rb") if isinstance(source, str) else source
+    try:
+        document = PDFDocument(PDFParser(pdf_file))
+        selected = _selected_pages(document, max_pages)
+
+        resource_manager = PDFResourceManager()
+        laparams = LAParams()
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            separator = ""
+            for page in selected:
+                if deadline and time.monotonic() > deadline:
+                    raise TimeoutError("PDF 텍스트 추출 제한 시간을 넘겼습니다.")
+                buffer = StringIO()
+                device = TextConverter(resource_manager, buffer, laparams=laparams)
+                try:
+                    PDFPageInterpreter(resource_manager, device).process_page(page)
+                finally:
+                    device.close()
+                # 연속된 공백 제거
+                text = _WHITESPACE.sub(" ", buffer.getvalue()).strip()
+                if text:
+                    out.write(separator + text)
+                    separator = " "
+        os.replace(tmp_path, output_path)
+        return len(selected)
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+        if isinstance(source, str):
+            pdf_file.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _extract_pdf_bytes(data: bytes, output_path: str,
+                       max_pages: Optional[int], timeout: Optional[float]) -> int:
+    """메모리에 있는 PDF 내용을 그대로 추출합니다 (워커 프로세스용)."""
+    return extract_pdf_text(BytesIO(data), output_path, max_pages, timeout)
+
+
+def _noop() -> None:
+    return None
+
+
+class PdfTextExtractor:
+    """CPU를 많이 쓰는 pdfminer 추출을 프로세스 풀에서 실행합니다.
+
+    문서마다 제한 시간(timeout)이 있고, max_pages를 주면 앞쪽 N페이지와 마지막 페이지만 추출합니다.
+    동시에 제출되는 작업은 워커 수로 제한하므로 제출된 작업은 곧바로 실행되고, 부모 쪽 대기 시간은
+    대기열에서 기다린 시간이 아니라 실행 시간만 셉니다. 워커 안의 제한 시간이 지켜지지 않아 부모 쪽
+    대기 시간이 끝나면, 멈춘 워커가 풀에 남지 않도록 풀을 종료하고 다음 작업 때 새로 띄웁니다
+    (그때 같은 풀에서 진행 중이던 작업도 실패로 처리됨).
+    """
+
+    # 워커 안에서 제한 시간이 지켜지지 않는 경우에 대비한 여유 시간 (초)
+    timeout_grace = 5.0
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: float = 120,
+                 max_pages: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # 실행 중인 작업 수 제한 (워커 수만큼)
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        # 작업별로 제출된 풀 (제한 시간이 지나면 그 풀만 교체)
+        self._owners: "weakref.WeakKeyDictionary[Future, ProcessPoolExecutor]" = weakref.WeakKeyDictionary()
+
+    def start(self):
+        """워커 프로세스를 미리 띄웁니다.
+
+        fork 방식에서는 첫 작업 때 워커가 한꺼번에 생성되므로,
+        다운로드 스레드가 돌기 전에 호출해 두는 편이 안전합니다.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                self._executor.submit(_noop).result()
+            return self._executor
+
+    def _submit(self, fn, *args) -> Future:
+        # 빈 워커가 생길 때까지 기다렸다가 제출 (대기열에 쌓인 시간이 제한 시간을 잡아먹지 않도록)
+        self._slots.acquire()
+        try:
+            executor = self.start()
+            future = executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        self._owners[future] = executor
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def submit(self, pdf_path: str, output_path: str) -> Future:
+        return self._submit(extract_pdf_text, pdf_path, output_path, self.max_pages, self.timeout)
+
+    def submit_bytes(self, data: bytes, output_path: str) -> Future:
+        return self._submit(_extract_pdf_bytes, data, output_path, self.max_pages, self.timeout)
+
+    def extract(self, pdf_path: str, output_path: str) -> bool:
+        """PDF 텍스트를 추출해 output_path에 저장하고 성공 여부를 반환합니다."""
+        return self._wait(self.submit(pdf_path, output_path), pdf_path)
+
+    def extract_bytes(self, data: bytes, output_path: str) -> bool:
+        """내려받은 PDF 내용을 파일로 저장하지 않고 바로 추출합니다."""
+        return self._wait(self.submit_bytes(data, output_path), output_path)
+
+    def _wait(self, future: Future, name: str) -> bool:
+        # 부모 쪽 대기 시간이 끝나도 작업이 끝나지 않았을 때만 워커가 멈춘 것으로 봄
+        done, _ = wait([future], timeout=self.timeout + self.timeout_grace)
+        if not done:
+            logger.error(f"PDF 텍스트 추출 제한 시간({self.timeout:g}초) 초과, 워커를 종료합니다: {name}")
+            self._recycle(self._owners.get(future))
+            return False
+        try:
+            future.result()
+            return True
+        except TimeoutError:
+            # 워커 안에서 제한 시간을 지킨 경우이므로 풀은 그대로 둠
+            logger.error(f"PDF 텍스트 추출 제한 시간({self.timeout:g}초) 초과: {name}")
+        except BrokenProcessPool:
+            logger.error(f"PDF 텍스트 추출 워커가 종료되었습니다: {name}")
+        except Exception as e:
+            logger.error(f"PDF 텍스트 추출 중 오류 발생 ({name}): {str(e)}")
+        return False
+
+    def _recycle(self, executor: Optional[ProcessPoolExecutor]):
+        """멈춘 워커가 있는 풀을 강제로 종료합니다. 다음 작업 때 새 풀이 만들어집니다."""
+        if executor is None:
+            return
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        # ProcessPoolExecutor에는 실행 중인 작업을 멈추는 공개 API가 없어 워커를 직접 종료
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
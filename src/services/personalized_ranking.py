@@ -0,0 +1,94 @@
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .relevance_ranker import BM25Scorer, profile_terms
+
+
+class PersonalizedRanker:
+    """수신자(또는 그룹)별 관심사 프로필로 각자의 상위 K개 논문을 한 번에 고릅니다.
+
+    논문 특징(BM25 단어 가중치 + 카테고리)을 희소 행렬로 두고, 프로필 행렬과 한 번 곱해
+    (논문 수 x 프로필 수) 점수를 얻습니다. 사람마다 다시 순위를 매기지 않습니다.
+    프로필 형식: {"keywords": [...] 또는 {단어: 가중치}, "categories": [...], "weight": 1.0}
+    """
+
+    def __init__(self, profiles: Mapping[str, Mapping], top_k: int = 10,
+                 category_weight: float = 1.0, k1: float = 1.5, b: float = 0.75):
+        self.profiles = profiles
+        self.names = list(profiles)
+        self.top_k = top_k
+        self.category_weight = category_weight
+        self.k1 = k1
+        self.b = b
+
+    def score_matrix(self, texts: Sequence[str], categories: Sequence[Sequence[str]]) -> np.ndarray:
+        """(논문 수, 프로필 수) 크기의 점수 행렬을 반환합니다."""
+        scorer = BM25Scorer(texts, self.k1, self.b)
+        vocab_size = len(scorer.matrix.vocabulary)
+        category_index: Dict[str, int] = {}
+        for profile in self.profiles.values():
+            for category in profile.get("categories", []):
+                category_index.setdefault(category, len(category_index))
+
+        # 프로필 행렬: [단어 가중치 | 카테고리 가중치]
+        queries = np.zeros((len(self.names), vocab_size + len(category_index)))
+        for row, name in enumerate(self.names):
+            profile = self.profiles[name]
+            weight = float(profile.get("weight", 1.0))
+            queries[row, :vocab_size] = weight * scorer.query_vector(profile_terms(profile))
+            for category in profile.get("categories", []):
+                queries[row, vocab_size + category_index[category]] = self.category_weight
+
+        # 논문 특징 행렬 (좌표 형식): BM25 원소 + 논문이 속한 카테고리 원소
+        category_rows, category_cols = [], []
+        for doc, doc_categories in enumerate(categories):
+            for category in set(doc_categories):
+                if category in category_index:
+                    category_rows.append(doc)
+                    category_cols.append(vocab_size + category_index[category])
+        rows = np.concatenate([scorer.matrix.rows, np.asarray(category_rows, dtype=np.int64)])
+        cols = np.concatenate([scorer.matrix.indices, np.asarray(category_cols, dtype=np.int64)])
+        values = np.concatenate([scorer.weights, np.ones(len(category_rows))])
+
+        # 어느 프로필도 쓰지 않는 열은 곱셈에서 제외
+        used = queries.any(axis=0)[cols] if len(cols) else np.zeros(0, dtype=bool)
+        scores = np.zeros((len(texts), len(self.names)))
+        np.add.at(scores, rows[used], values[used, None] * queries[:, cols[used]].T)
+        return scores
+
+    def select(self, texts: Sequence[str], categories: Sequence[Sequence[str]],
+               eligible: Optional[Sequence[int]] = None,
+               fallback: Sequence[int] = ()) -> Dict[str, List[Tuple[int, float]]]:
+        """프로필별 (논문 인덱스, 점수) 상위 top_k 목록을 반환합니다.
+
+        eligible에 없는 논문(예: 중복으로 제외된 논문)은 고르지 않으며, 관련 논문이 top_k개보다
+        적으면 fallback 순서(공통 순위)로 나머지를 채웁니다. 동점이면 앞선 논문이 먼저입니다.
+        """
+        scores = self.score_matrix(texts, categories)
+        allowed = np.zeros(len(texts), dtype=bool)
+        allowed[list(range(len(texts))) if eligible is None else list(eligible)] = True
+
+        selections = {}
+        for column, name in enumerate(self.names):
+            column_scores = scores[:, column]
+            candidates = np.flatnonzero(allowed & (column_scores > 0))
+            if len(candidates) > self.top_k:
+                # k번째 점수를 기준으로 잘라 전체 정렬 없이 상위 k개만 남김
+                values = column_scores[candidates]
+                kth = np.partition(values, len(values) - self.top_k)[len(values) - self.top_k]
+                above = candidates[values > kth]
+                tied = candidates[values == kth][:self.top_k - len(above)]
+                candidates = np.concatenate([above, tied])
+            order = candidates[np.lexsort((candidates, -column_scores[candidates]))]
+
+            selected = [(int(i), float(column_scores[i])) for i in order]
+            chosen = set(int(i) for i in order)
+            for i in fallback:
+                if len(selected) >= self.top_k:
+                    break
+                if i not in chosen and allowed[i]:
+                    selected.append((i, float(column_scores[i])))
+                    chosen.add(i)
+            selections[name] = selected
+        return selections
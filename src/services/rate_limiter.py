@@ -0,0 +1,51 @@
+import threading
+import time
+from typing import Dict
+
+
+class RateLimiter:
+    """스레드 간에 공유되는 토큰 버킷 방식의 요청 속도 제한기"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        # rate: 초당 허용 요청 수, burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """요청을 보낼 수 있을 때까지 대기합니다."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def penalize(self, seconds: float):
+        """서버가 요청 제한을 알린 경우 모든 호출자를 지정된 시간 동안 대기시킵니다."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+_shared_limiters: Dict[str, RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(name: str, rate: float, burst: int = 1) -> RateLimiter:
+    """프로세스 내에서 이름별로 하나만 생성되는 속도 제한기를 반환합니다."""
+    with _shared_lock:
+        if name not in _shared_limiters:
+            _shared_limiters[name] = RateLimiter(rate, burst)
+        return _shared_limiters[name]
@@ -0,0 +1,173 @@
+import json
+import logging
+import os
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9\-]*[a-z0-9]|[a-z]")
+
+# 관심사 점수에 영향을 주지 않는 흔한 영어 단어
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the this to was we were which with
+our their these those using via into than then there can also based show shows paper propose proposed
+""".split())
+
+
+# 복수형 's'를 떼지 않는 어미 ('analysis', 'class', 'focus' 등)
+_KEEP_S_ENDINGS = ("ss", "is", "us", "as", "os")
+
+
+def normalize_token(token: str) -> str:
+    """간단한 복수형 정리: 'models' -> 'model', 'llms' -> 'llm', 'studies' -> 'study'."""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(_KEEP_S_ENDINGS):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """소문자로 바꾸고 불용어를 뺀 뒤 복수형을 정리한 단어 목록을 반환합니다."""
+    return [normalize_token(token) for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def index_terms(tokens: Sequence[str]) -> List[str]:
+    """단어 목록에 이웃한 두 단어를 이은 구(bigram)를 더합니다. 여러 단어 키워드를 구로 찾는 데 사용합니다."""
+    return list(tokens) + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+
+
+def query_terms(phrase: str) -> List[str]:
+    """키워드를 검색할 어휘 항목으로 바꿉니다. 한 단어는 그 단어, 여러 단어는 이웃한 두 단어 구들입니다."""
+    tokens = tokenize(phrase)
+    return tokens if len(tokens) == 1 else index_terms(tokens)[len(tokens):]
+
+
+class SparseTermMatrix:
+    """문서 x 단어 빈도 행렬을 CSR 형식(indptr, indices, data)의 NumPy 배열로 저장합니다."""
+
+    def __init__(self, documents: Iterable[Sequence[str]]):
+        self.vocabulary: Dict[str, int] = {}
+        indptr = [0]
+        indices: List[int] = []
+        data: List[int] = []
+        lengths: List[int] = []
+        vocabulary = self.vocabulary
+        for tokens in documents:
+            # 문자열 그대로 세고 서로 다른 단어만 번호로 바꿈
+            counts = Counter(tokens)
+            indices.extend([vocabulary.setdefault(token, len(vocabulary)) for token in counts])
+            data.extend(counts.values())
+            indptr.append(len(indices))
+            lengths.append(len(tokens))
+
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=np.float64)
+        self.doc_lengths = np.asarray(lengths, dtype=np.float64)
+        # 0이 아닌 원소마다 해당하는 문서 번호 (행 단위 합계에 사용)
+        self.rows = np.repeat(np.arange(len(lengths)), np.diff(self.indptr))
+
+    @property
+    def shape(self):
+        return len(self.doc_lengths), len(self.vocabulary)
+
+    def document_frequency(self) -> np.ndarray:
+        return np.bincount(self.indices, minlength=len(self.vocabulary)).astype(np.float64)
+
+
+class BM25Scorer:
+    """그날의 초록으로 만든 희소 단어 행렬에 대해 관심사 프로필별 BM25 점수를 계산합니다.
+
+    단어별 BM25 가중치를 행렬의 0이 아닌 원소에 한 번만 계산해 두고,
+    프로필 점수는 해당 단어 열만 골라 문서별로 합산합니다.
+    어휘에는 단어와 함께 이웃한 두 단어 구도 들어 있어 'large language model' 같은 키워드는
+    'large'나 'model'이 따로 나온 초록이 아니라 구가 나온 초록에만 점수를 줍니다.
+    """
+
+    def __init__(self, texts: Sequence[str], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.matrix = SparseTermMatrix(index_terms(tokenize(text)) for text in texts)
+
+        doc_count = self.matrix.shape[0]
+        df = self.matrix.document_frequency()
+        self.idf = np.log1p((doc_count - df + 0.5) / (df + 0.5))
+
+        average_length = self.matrix.doc_lengths.mean() if doc_count else 0.0
+        norm = k1 * (1 - b + b * self.matrix.doc_lengths / (average_length or 1.0))
+        tf = self.matrix.data
+        self.weights = self.idf[self.matrix.indices] * tf * (k1 + 1) / (tf + norm[self.matrix.rows])
+
+    def query_vector(self, terms: Mapping[str, float]) -> np.ndarray:
+        """{단어/구: 가중치}를 어휘 크기의 가중치 벡터로 바꿉니다.
+
+        여러 단어로 된 구는 이웃한 두 단어 구로 나누고 가중치를 구 수만큼 나눠 가지므로,
+        구 전체가 나오면 한 단어 키워드와 비슷한 크기의 점수를 받습니다.
+        """
+        vector = np.zeros(len(self.matrix.vocabulary))
+        for phrase, weight in terms.items():
+            keys = query_terms(phrase)
+            for key in keys:
+                column = self.matrix.vocabulary.get(key)
+                if column is not None:
+                    vector[column] = max(vector[column], weight / len(keys))
+        return vector
+
+    def score(self, terms: Mapping[str, float]) -> np.ndarray:
+        """문서별 BM25 점수 배열을 반환합니다."""
+        query = self.query_vector(terms)
+        return np.bincount(self.matrix.rows, weights=self.weights * query[self.matrix.indices],
+                           minlength=self.matrix.shape[0])
+
+
+def profile_terms(profile: Mapping) -> Dict[str, float]:
+    """프로필 설정의 keywords(목록 또는 {단어: 가중치})를 {단어: 가중치}로 통일합니다."""
+    keywords = profile.get("keywords", {})
+    if isinstance(keywords, Mapping):
+        return {str(term): float(weight) for term, weight in keywords.items()}
+    return {str(term): 1.0 for term in keywords}
+
+
+def load_interest_profiles(path: str) -> Dict[str, Dict]:
+    """관심사 프로필 JSON을 읽습니다. 파일이 없거나 형식이 잘못되면 빈 dict를 반환합니다.
+
+    형식: {"프로필 이름": {"keywords": [...] 또는 {단어: 가중치}, "weight": 1.0}, ...}
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            profiles = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error(f"관심사 프로필을 읽는 중 오류 발생 ({path}): {str(e)}")
+        return {}
+    return {name: profile for name, profile in profiles.items() if isinstance(profile, dict)}
+
+
+class RelevanceRanker:
+    """관심사 프로필과의 BM25 유사도로 논문 점수를 매깁니다."""
+
+    def __init__(self, profiles: Mapping[str, Mapping], k1: float = 1.5, b: float = 0.75):
+        self.profiles = profiles
+        self.k1 = k1
+        self.b = b
+
+    def profile_scores(self, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        """프로필별 문서 점수(프로필 weight 반영)를 반환합니다."""
+        scorer = BM25Scorer(texts, self.k1, self.b)
+        return {
+            name: float(profile.get("weight", 1.0)) * scorer.score(profile_terms(profile))
+            for name, profile in self.profiles.items()
+        }
+
+    def score(self, texts: Sequence[str]) -> np.ndarray:
+        """가장 잘 맞는 프로필의 점수를 문서 점수로 사용합니다."""
+        scores = self.profile_scores(texts)
+        if not scores:
+            return np.zeros(len(texts))
+        return np.max(np.vstack(list(scores.values())), axis=0)
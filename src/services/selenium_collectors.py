@@ -1,7 +1,7 @@
 import logging
 import os
-import time
-import requests
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from selenium import webdriver
@@ -12,17 +12,26 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import pandas as pd
 from ..models.news import News
+from .arxiv_listing import CATEGORY_CODE, parse_abstract, parse_listing
+from .download_pipeline import DownloadPipeline
+from .driver_pool import DriverPool
+from .http_cache import HttpCache, is_immutable_url
+from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
 class SeleniumBaseCollector:
-    def __init__(self, url: str):
+    def __init__(self, url: str, http_cache: Optional[HttpCache] = None):
         self.url = url
         self.driver = None
-        self.download_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'papers')
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        self.download_dir = os.path.join(base_dir, 'data', 'papers')
         os.makedirs(self.download_dir, exist_ok=True)
+        # PDF 다운로드는 조건부 요청 캐시를 거침 (캐시 파일은 처음 사용할 때 만들어짐)
+        self.http_cache = http_cache or HttpCache(os.path.join(base_dir, 'data', 'cache', 'http'))
+        self.pipeline = DownloadPipeline(cache=self.http_cache)
 
-    def setup_driver(self):
+    def create_driver(self):
         chrome_options = Options()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
@@ -35,10 +44,13 @@ class SeleniumBaseCollector:
             'download.directory_upgrade': True,
             'safebrowsing.enabled': True
         })
-        self.driver = webdriver.Chrome(options=chrome_options)
+        return webdriver.Chrome(options=chrome_options)
+
+    def setup_driver(self):
+        self.driver = self.create_driver()
 
-    def wait_for_element(self, by: By, value: str, timeout: int = 10):
-        return WebDriverWait(self.driver, timeout).until(
+    def wait_for_element(self, by: By, value: str, timeout: int = 10, driver=None):
+        return WebDriverWait(driver or self.driver, timeout).until(
                 EC.presence_of_element_located((by, value))
             )
 
@@ -55,121 +67,150 @@ class SeleniumBaseCollector:
             return ""
 
     def download_pdf(self, url: str, filename: str) -> bool:
+        filepath = os.path.join(self.download_dir, filename)
+        # 같은 arXiv 버전의 파일이 이미 있으면 요청하지 않음
+        if os.path.exists(filepath) and is_immutable_url(url):
+            return True
+        tmp_path = f"{filepath}.part"
         try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
-            filepath = os.path.join(self.download_dir, filename)
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            with open(tmp_path, 'wb') as f:
+                self.pipeline.download(url, f.write, use_cache=True)
+            os.replace(tmp_path, filepath)
             return True
         except Exception as e:
             logger.error(f"PDF 다운로드 중 오류 발생: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             return False
 
     def cleanup(self):
         if self.driver:
             self.driver.quit()
+        self.http_cache.close()
 
 class ArxivCSCollector(SeleniumBaseCollector):
-    def __init__(self):
-        super().__init__("https://arxiv.org/list/cs/recent")
+    def __init__(self, driver_factory=None, pool_size: int = 4, max_uses: int = 50,
+                 requests_per_second: float = 1.0, mode: str = "listing",
+                 listing_page_size: int = 2000, http_cache: Optional[HttpCache] = None):
+        super().__init__("https://arxiv.org/list/cs/recent", http_cache=http_cache)
+        # listing: 목록 페이지를 HTTP로 받아 한 번에 파싱하고 초록처럼 빠진 필드만 상세 페이지에서 채움
+        # browser: Selenium으로 목록과 상세 페이지를 하나씩 열어 수집
+        self.mode = mode
+        self.listing_page_size = listing_page_size
         self.max_papers = 3  # 테스트를 위해 3개로 제한
         self.target_categories = [
             'cs.AI', 'cs.CV', 'cs.LG', 'cs.CL', 'cs.NE', 
             'cs.IR', 'cs.ML', 'cs.RO', 'cs.SE', 'cs.SY'
         ]
+        # 논문마다 Chrome을 띄우지 않고 풀에 있는 드라이버를 빌려 씀
+        self.driver_factory = driver_factory or self.create_driver
+        self.pool_size = pool_size
+        self.max_uses = max_uses
+        self._driver_pool: Optional[DriverPool] = None
+        # 서버 부하 방지 (논문마다 1초씩 쉬던 방식 대신 모든 스레드가 공유)
+        self.rate_limiter = RateLimiter(requests_per_second, burst=pool_size)
+
+    @property
+    def driver_pool(self) -> DriverPool:
+        if self._driver_pool is None:
+            self._driver_pool = DriverPool(self.driver_factory, size=self.pool_size, max_uses=self.max_uses)
+        return self._driver_pool
+
+    def cleanup(self):
+        super().cleanup()
+        if self._driver_pool is not None:
+            self._driver_pool.close()
+            self._driver_pool = None
 
     def collect_paper_links(self) -> List[str]:
         """논문 링크 수집"""
         try:
-            self.setup_driver()
-            self.driver.get(self.url)
-            
-            # 페이지 로딩 대기
-            self.wait_for_element(By.CSS_SELECTOR, "dt")
-            
-            paper_links = []
-            skip = 0
-            
-            while len(paper_links) < self.max_papers:
-                # 현재 페이지의 논문 링크 수집
-                dt_elements = self.driver.find_elements(By.CSS_SELECTOR, "dt")
-                for dt in dt_elements:
-                    if len(paper_links) >= self.max_papers:
-                        break
-                    try:
-                        link = dt.find_element(By.CSS_SELECTOR, "a[href*='/abs/']")
-                        paper_links.append(link.get_attribute("href"))
-                    except (NoSuchElementException, StaleElementReferenceException):
-                        continue
+            with self.driver_pool.checkout() as driver:
+                self.rate_limiter.acquire()
+                driver.get(self.url)
                 
-                # 다음 페이지로 이동
-                if len(paper_links) < self.max_papers:
-                    skip += 25
-                    self.driver.get(f"{self.url}?skip={skip}")
-                    self.wait_for_element(By.CSS_SELECTOR, "dt")
-            
-            return paper_links[:self.max_papers]
+                # 페이지 로딩 대기
+                self.wait_for_element(By.CSS_SELECTOR, "dt", driver=driver)
+                
+                paper_links = []
+                skip = 0
+                
+                while len(paper_links) < self.max_papers:
+                    # 현재 페이지의 논문 링크 수집
+                    dt_elements = driver.find_elements(By.CSS_SELECTOR, "dt")
+                    for dt in dt_elements:
+                        if len(paper_links) >= self.max_papers:
+                            break
+                        try:
+                            link = dt.find_element(By.CSS_SELECTOR, "a[href*='/abs/']")
+                            paper_links.append(link.get_attribute("href"))
+                        except (NoSuchElementException, StaleElementReferenceException):
+                            continue
+                    
+                    # 다음 페이지로 이동
+                    if len(paper_links) < self.max_papers:
+                        skip += 25
+                        self.rate_limiter.acquire()
+                        driver.get(f"{self.url}?skip={skip}")
+                        self.wait_for_element(By.CSS_SELECTOR, "dt", driver=driver)
+                
+                return paper_links[:self.max_papers]
             
         except Exception as e:
             logger.error(f"논문 링크 수집 중 오류: {str(e)}")
             return []
-        finally:
-            self.cleanup()
 
     def get_paper_details(self, url: str) -> Dict[str, Any]:
         """개별 논문 상세 정보 수집"""
         try:
-            self.setup_driver()
-            self.driver.get(url)
-            
-            # 페이지 로딩 대기
-            self.wait_for_element(By.CSS_SELECTOR, "h1.title")
-            
-            # 제목 추출
-            title = self.get_text(self.driver.find_element(By.CSS_SELECTOR, "h1.title"))
-            
-            # 저자 추출
-            authors = self.get_text(self.driver.find_element(By.CSS_SELECTOR, "div.authors"))
-            
-            # 초록 추출
-            abstract = self.get_text(self.driver.find_element(By.CSS_SELECTOR, "blockquote.abstract"))
-            
-            # 카테고리 추출
-            categories = []
-            try:
-                categories_elem = self.driver.find_element(By.CSS_SELECTOR, "div.primary-subject")
-                categories = [cat.strip() for cat in categories_elem.text.split(',')]
-            except NoSuchElementException:
-                pass
-            
-            # 제출일 추출
-            submission_date = None
-            try:
-                submission_text = self.get_text(self.driver.find_element(By.CSS_SELECTOR, "div.submission-history"))
-                if submission_text:
-                    import re
-                    date_match = re.search(r"Submitted (\d{1,2} \w+, \d{4})", submission_text)
-                    if date_match:
-                        submission_date = datetime.strptime(date_match.group(1), "%d %B, %Y")
-            except (NoSuchElementException, ValueError):
-                pass
-            
-            # PDF 및 HTML URL 추출
-            pdf_url = None
-            html_url = None
-            source_url = None
-            try:
-                pdf_url = self.driver.find_element(By.CSS_SELECTOR, "a[href*='/pdf/']").get_attribute("href")
-                html_url = self.driver.find_element(By.CSS_SELECTOR, "a[href*='/html/']").get_attribute("href")
-                source_url = self.driver.find_element(By.CSS_SELECTOR, "a[href*='/source/']").get_attribute("href")
-            except NoSuchElementException:
-                pass
+            with self.driver_pool.checkout() as driver:
+                self.rate_limiter.acquire()
+                driver.get(url)
+                
+                # 페이지 로딩 대기
+                self.wait_for_element(By.CSS_SELECTOR, "h1.title", driver=driver)
+                
+                # 제목 추출
+                title = self.get_text(driver.find_element(By.CSS_SELECTOR, "h1.title"))
+                
+                # 저자 추출
+                authors = self.get_text(driver.find_element(By.CSS_SELECTOR, "div.authors"))
+                
+                # 초록 추출
+                abstract = self.get_text(driver.find_element(By.CSS_SELECTOR, "blockquote.abstract"))
+                
+                # 카테고리 추출
+                categories = []
+                try:
+                    categories_elem = driver.find_element(By.CSS_SELECTOR, "div.primary-subject")
+                    categories = (CATEGORY_CODE.findall(categories_elem.text)
+                                  or [cat.strip() for cat in categories_elem.text.split(',')])
+                except NoSuchElementException:
+                    pass
+                
+                # 제출일 추출
+                submission_date = None
+                try:
+                    submission_text = self.get_text(driver.find_element(By.CSS_SELECTOR, "div.submission-history"))
+                    if submission_text:
+                        date_match = re.search(r"Submitted (\d{1,2} \w+, \d{4})", submission_text)
+                        if date_match:
+                            submission_date = datetime.strptime(date_match.group(1), "%d %B, %Y")
+                except (NoSuchElementException, ValueError):
+                    pass
+                
+                # PDF 및 HTML URL 추출
+                pdf_url = None
+                html_url = None
+                source_url = None
+                try:
+                    pdf_url = driver.find_element(By.CSS_SELECTOR, "a[href*='/pdf/']").get_attribute("href")
+                    html_url = driver.find_element(By.CSS_SELECTOR, "a[href*='/html/']").get_attribute("href")
+                    source_url = driver.find_element(By.CSS_SELECTOR, "a[href*='/source/']").get_attribute("href")
+                except NoSuchElementException:
+                    pass
 
-            # PDF 다운로드
+            # PDF 다운로드 (드라이버를 먼저 반납한 뒤 진행)
             if pdf_url:
                 paper_id = url.split('/')[-1]
                 filename = f"{paper_id}.pdf"
@@ -189,11 +230,87 @@ class ArxivCSCollector(SeleniumBaseCollector):
         except Exception as e:
             logger.error(f"논문 상세 정보 수집 중 오류: {str(e)}")
             return {}
-        finally:
-            self.cleanup()
+
+    def is_wanted(self, details: Dict[str, Any], since: datetime) -> bool:
+        """대상 카테고리에 속하고 since 이후에 제출된 논문인지 확인합니다."""
+        if not any(cat in self.target_categories for cat in details.get("categories", [])):
+            return False
+        return not (details.get("submission_date") and details["submission_date"] < since)
+
+    def collect_listing_entries(self, since: datetime) -> List[Dict[str, Any]]:
+        """목록 페이지를 listing_page_size개씩 받아 조건에 맞는 항목을 max_papers개까지 모읍니다."""
+        entries = []
+        skip = 0
+        while len(entries) < self.max_papers:
+            page_url = f"{self.url}?skip={skip}&show={self.listing_page_size}"
+            self.rate_limiter.acquire()
+            listing = parse_listing(self.pipeline.fetch_text(page_url), page_url)
+            if not listing.entries:
+                break
+
+            for entry in listing.entries:
+                if len(entries) >= self.max_papers:
+                    break
+                if self.is_wanted(entry, since):
+                    entries.append(entry)
+
+            skip += len(listing.entries)
+            # 목록은 최신순이므로 기간을 벗어난 항목이 나오면 더 넘길 필요가 없음
+            oldest = listing.entries[-1].get("submission_date")
+            if (listing.total is not None and skip >= listing.total) or (oldest and oldest < since):
+                break
+        return entries
+
+    def complete_listing_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """목록에 없던 필드(초록)만 상세 페이지에서 채우고 PDF를 내려받습니다."""
+        try:
+            abstract = entry.get("abstract")
+            if not abstract:
+                self.rate_limiter.acquire()
+                abstract = parse_abstract(self.pipeline.fetch_text(entry["abs_url"]))
+
+            pdf_url = entry.get("pdf_url")
+            if pdf_url:
+                self.download_pdf(pdf_url, f"{entry['paper_id']}.pdf")
+
+            return {
+                "title": entry.get("title"),
+                "authors": entry.get("authors"),
+                "abstract": abstract,
+                "submission_date": entry.get("submission_date"),
+                "categories": entry.get("categories", []),
+                "pdf_url": pdf_url,
+                "html_url": entry.get("html_url"),
+                "source_url": entry.get("source_url")
+            }
+        except Exception as e:
+            logger.error(f"논문 상세 정보 보완 중 오류 ({entry.get('abs_url')}): {str(e)}")
+            return {}
+
+    def collect_from_listing(self) -> List[Dict[str, Any]]:
+        """Chrome 없이 목록 페이지만으로 논문 정보를 수집합니다."""
+        try:
+            one_week_ago = datetime.now() - timedelta(days=7)
+            entries = self.collect_listing_entries(one_week_ago)
+            if not entries:
+                logger.error("논문 링크를 찾을 수 없습니다.")
+                return []
+
+            with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+                return [details for details in executor.map(self.complete_listing_entry, entries) if details]
+
+        except Exception as e:
+            logger.error(f"논문 수집 중 오류: {str(e)}")
+            return []
 
     def collect(self) -> List[Dict[str, Any]]:
         """논문 정보 수집"""
+        if self.mode == "listing":
+            try:
+                return self.collect_from_listing()
+            finally:
+                self.cleanup()
+
         try:
             # 논문 링크 수집
             paper_links = self.collect_paper_links()
@@ -201,28 +318,24 @@ class ArxivCSCollector(SeleniumBaseCollector):
                 logger.error("논문 링크를 찾을 수 없습니다.")
                 return []
             
-            # 논문 상세 정보 수집
+            # 논문 상세 정보를 드라이버 풀 크기만큼 동시에 수집
             papers = []
             one_week_ago = datetime.now() - timedelta(days=7)
             
-            for url in paper_links:
-                details = self.get_paper_details(url)
-                if not details:
-                    continue
-                
-                # 카테고리 필터링
-                if not any(cat in self.target_categories for cat in details.get("categories", [])):
-                    continue
-                
-                # 최근 1주일 이내의 논문만 수집
-                if details.get("submission_date") and details["submission_date"] < one_week_ago:
-                    continue
-                
-                papers.append(details)
-                time.sleep(1)  # 서버 부하 방지
+            with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+                all_details = list(executor.map(self.get_paper_details, paper_links))
+            
+            for details in all_details:
+                # 대상 카테고리의 최근 1주일 이내 논문만 수집
+                if details and self.is_wanted(details, one_week_ago):
+                    papers.append(details)
             
+            stats = self.driver_pool.stats()
+            logger.info(f"드라이버 풀 사용 현황: 생성 {stats['created']}개, 교체 {stats['recycled']}개")
             return papers
             
         except Exception as e:
             logger.error(f"논문 수집 중 오류: {str(e)}")
-            return [] 
\ No newline at end of file
+            return [] 
+        finally:
+            self.cleanup()
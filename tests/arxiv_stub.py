@@ -0,0 +1,110 @@
+import datetime
+import os
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+ATOM = "http://www.w3.org/2005/Atom"
+OPENSEARCH = "http://a9.com/-/spec/opensearch/1.1/"
+
+# entry를 다시 직렬화할 때 feedparser가 인식하는 접두사를 유지
+ET.register_namespace("", ATOM)
+ET.register_namespace("arxiv", "http://arxiv.org/schemas/atom")
+
+_WINDOW_PATTERN = re.compile(r"submittedDate:\[(\d{12}) TO (\d{12})\]")
+_CATEGORY_PATTERN = re.compile(r"cat:([\w.\-]+)")
+
+
+def load_fixture_entries(name="arxiv_cs_ai_feed.xml"):
+    """기록된 arXiv 응답에서 entry 요소와 게시 시각, 카테고리를 읽습니다."""
+    root = ET.parse(os.path.join(FIXTURE_DIR, name)).getroot()
+    entries = []
+    for entry in root.findall(f"{{{ATOM}}}entry"):
+        published = datetime.datetime.strptime(
+            entry.findtext(f"{{{ATOM}}}published"), "%Y-%m-%dT%H:%M:%SZ"
+        ).replace(tzinfo=datetime.timezone.utc)
+        categories = {c.get("term") for c in entry.findall(f"{{{ATOM}}}category")}
+        entries.append({
+            "id": entry.findtext(f"{{{ATOM}}}id"),
+            "published": published,
+            "categories": categories,
+            "xml": ET.tostring(entry, encoding="unicode"),
+        })
+    return entries
+
+
+class ArxivStubHandler(BaseHTTPRequestHandler):
+    """export.arxiv.org/api/query를 흉내 내어 검색식, 정렬, start/max_results를 적용합니다."""
+
+    def do_GET(self):
+        params = {name: values[0] for name, values in parse_qs(urlparse(self.path).query).items()}
+        self.server.requests.append(params)
+        # 느린 응답을 흉내 내기 위한 지연
+        time.sleep(self.server.delay)
+
+        entries = self.select(params)
+        start = int(params.get("start", 0))
+        page = entries[start:start + int(params.get("max_results", 10))]
+        body = self.render(page, len(entries), start).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/atom+xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def select(self, params):
+        entries = self.server.entries
+        id_list = [i for i in params.get("id_list", "").split(",") if i]
+        if id_list:
+            entries = [e for e in entries if e["id"].rsplit("/", 1)[-1].split("v")[0] in id_list
+                       or e["id"].rsplit("/", 1)[-1] in id_list]
+
+        query = params.get("search_query", "")
+        categories = set(_CATEGORY_PATTERN.findall(query))
+        if categories:
+            entries = [e for e in entries if e["categories"] & categories]
+
+        window = _WINDOW_PATTERN.search(query)
+        if window:
+            low, high = (
+                datetime.datetime.strptime(value, "%Y%m%d%H%M").replace(tzinfo=datetime.timezone.utc)
+                for value in window.groups()
+            )
+            # 분 단위 범위이며 양 끝을 포함
+            high += datetime.timedelta(minutes=1)
+            entries = [e for e in entries if low <= e["published"] < high]
+
+        return sorted(entries, key=lambda e: e["published"],
+                      reverse=params.get("sortOrder") != "ascending")
+
+    def render(self, page, total, start):
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<feed xmlns="{ATOM}">\n'
+            f'  <title type="html">ArXiv Query</title>\n'
+            f'  <id>http://arxiv.org/api/stub</id>\n'
+            f'  <opensearch:totalResults xmlns:opensearch="{OPENSEARCH}">{total}</opensearch:totalResults>\n'
+            f'  <opensearch:startIndex xmlns:opensearch="{OPENSEARCH}">{start}</opensearch:startIndex>\n'
+            f'  <opensearch:itemsPerPage xmlns:opensearch="{OPENSEARCH}">{len(page)}</opensearch:itemsPerPage>\n'
+            + "\n".join(e["xml"] for e in page)
+            + "\n</feed>\n"
+        )
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(entries=None):
+    """스텁 서버를 띄우고 (서버, arxiv.Client.query_url_format 값)을 반환합니다."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ArxivStubHandler)
+    server.entries = entries if entries is not None else load_fixture_entries()
+    server.requests = []
+    server.delay = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/api/query?{{}}"
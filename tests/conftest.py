@@ -0,0 +1,7 @@
+import os
+import sys
+
+# src 아래 스크립트(rank_papers 등)는 services/config를 최상위 모듈로 가져오므로 경로에 추가
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
@@ -0,0 +1,14 @@
+import random
+
+WORDS = ["language", "model", "reasoning", "agent", "planning", "tool", "retrieval", "graph", "image",
+         "video", "diffusion", "robot", "control", "theorem", "proof", "protein", "graphene", "speech", "audio"]
+CATEGORIES = ["cs.AI", "cs.CL", "cs.CV", "cs.LG", "cs.RO", "math.LO"]
+
+
+def make_corpus(count, seed, max_words=12, max_categories=3):
+    """무작위 단어로 만든 초록, 카테고리 목록, 점수를 반환합니다 (순위 모듈 테스트용)."""
+    rng = random.Random(seed)
+    texts = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(2, max_words))) for _ in range(count)]
+    categories = [rng.sample(CATEGORIES, rng.randint(1, max_categories)) for _ in range(count)]
+    scores = [rng.random() for _ in range(count)]
+    return texts, categories, scores
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import paper_analyzer
+from paper_analyzer import ANALYSIS_STAGES, PaperAnalyzer
+from src.services.analysis_cache import AnalysisCache, get_content_key, get_stage_cache_key, remove_pickle_files
+
+
+class TestAnalysisCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "analysis_cache.db")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_batch_round_trip(self):
+        cache = AnalysisCache(self.path)
+        cache.put_many({"a": {"title": "논문 A", "tags": ["x"]}, "b": {"title": "논문 B"}})
+        self.assertEqual(cache.get_many(["a", "b", "c"]), {
+            "a": {"title": "논문 A", "tags": ["x"]},
+            "b": {"title": "논문 B"}
+        })
+        cache.close()
+
+    def test_expired_entries_are_not_returned(self):
+        cache = AnalysisCache(self.path, ttl_days=1)
+        cache.put("a", {"title": "A"})
+        cache._conn.execute("UPDATE analysis_cache SET created_at = ?", (time.time() - 2 * 24 * 60 * 60,))
+        self.assertIsNone(cache.get("a"))
+        cache.close()
+
+    def test_evicts_least_recently_used_over_size_cap(self):
+        value = {"text": "x" * 100}
+        cache = AnalysisCache(self.path, max_bytes=250)
+        cache.put("a", value)
+        cache.put("b", value)
+        cache.get("a")
+        cache.put("c", value)
+        self.assertEqual(set(cache.get_many(["a", "b", "c"])), {"a", "c"})
+        cache.close()
+
+    def test_removes_pickle_files(self):
+        with open(os.path.join(self.tmp_dir.name, "abc123.pkl"), "wb") as f:
+            f.write(b"old pickle")
+        cache = AnalysisCache(self.path)
+        self.assertEqual(remove_pickle_files(self.tmp_dir.name), 1)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp_dir.name, "abc123.pkl")))
+        self.assertTrue(os.path.exists(self.path))
+        self.assertEqual(remove_pickle_files(self.tmp_dir.name), 0)
+        cache.close()
+
+
+def stage_keys(paper, fingerprints):
+    content_key = get_content_key(paper)
+    return {stage: get_stage_cache_key(stage, content_key, fingerprints[stage][0]) for stage in ANALYSIS_STAGES}
+
+
+def current_fingerprints():
+    analyzer = PaperAnalyzer.__new__(PaperAnalyzer)
+    analyzer.analysis_mode = "separate"
+    analyzer._fingerprints = analyzer._compute_fingerprints()
+    return analyzer.stage_fingerprints()
+
+
+class TestStageCacheKeys(unittest.TestCase):
+    PAPER = {"url": "http://arxiv.org/abs/2506.00001v1", "abstract": "We study  caching.\n"}
+
+    def test_content_key_ignores_version_and_whitespace(self):
+        other = {"url": "http://arxiv.org/abs/2506.00001v3", "abstract": "We study caching."}
+        self.assertEqual(get_content_key(self.PAPER), get_content_key(other))
+        self.assertTrue(get_content_key(self.PAPER).startswith("2506.00001:"))
+
+    def test_prompt_change_invalidates_only_its_stage(self):
+        before = stage_keys(self.PAPER, current_fingerprints())
+        with mock.patch.dict(paper_analyzer.ANALYSIS_PROMPTS,
+                             {"summary": paper_analyzer.ANALYSIS_PROMPTS["summary"] + "\n간결하게."}):
+            after = stage_keys(self.PAPER, current_fingerprints())
+
+        self.assertNotEqual(before["summary"], after["summary"])
+        self.assertEqual(before["translation"], after["translation"])
+        self.assertEqual(before["classification"], after["classification"])
+
+    def test_translation_prompt_change(self):
+        before = stage_keys(self.PAPER, current_fingerprints())
+        with mock.patch.object(paper_analyzer, "TRANSLATION_PROMPT", paper_analyzer.TRANSLATION_PROMPT + " "):
+            after = stage_keys(self.PAPER, current_fingerprints())
+
+        self.assertEqual([stage for stage in ANALYSIS_STAGES if before[stage] != after[stage]], ["translation"])
+
+    def test_abstract_change_invalidates_every_stage(self):
+        fingerprints = current_fingerprints()
+        before = stage_keys(self.PAPER, fingerprints)
+        after = stage_keys(dict(self.PAPER, abstract="We study caching again."), fingerprints)
+
+        for stage in ANALYSIS_STAGES:
+            self.assertNotEqual(before[stage], after[stage])
+
+    def test_current_mode_fingerprint_comes_first(self):
+        analyzer = PaperAnalyzer.__new__(PaperAnalyzer)
+        analyzer._fingerprints = analyzer._compute_fingerprints()
+        for mode, other in [("separate", "combined"), ("combined", "separate")]:
+            analyzer.analysis_mode = mode
+            for stage, candidates in analyzer.stage_fingerprints().items():
+                self.assertEqual(candidates, [analyzer._fingerprints[mode][stage],
+                                              analyzer._fingerprints[other][stage]])
+
+
+if __name__ == '__main__':
+    unittest.main()
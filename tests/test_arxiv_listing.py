@@ -0,0 +1,158 @@
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from src.services.arxiv_listing import parse_abstract, parse_listing
+from src.services.http_cache import HttpCache
+from src.services.selenium_collectors import ArxivCSCollector
+
+ENTRY_TEMPLATE = """
+<dt>
+  <a name="item{n}">[{n}]</a>
+  <a href="/abs/{paper_id}" title="Abstract" id="{paper_id}"> arXiv:{paper_id} </a>
+  [<a href="/pdf/{paper_id}" title="Download PDF">pdf</a>,
+   <a href="https://arxiv.org/html/{paper_id}v1" title="View HTML">html</a>,
+   <a href="/src/{paper_id}">src</a>]
+</dt>
+<dd>
+  <div class="meta">
+    <div class="list-title mathjax"><span class="descriptor">Title:</span>
+      {title}
+    </div>
+    <div class="list-authors"><a href="/a/kim_j_1">Jiwon Kim</a>, <a href="/a/lee_s_1">Sora Lee</a></div>
+    <div class="list-comments mathjax"><span class="descriptor">Comments:</span> 12 pages</div>
+    <div class="list-subjects"><span class="descriptor">Subjects:</span>
+      <span class="primary-subject">{primary}</span>{others}
+    </div>
+    {abstract}
+  </div>
+</dd>
+"""
+
+
+def day_header(day: datetime, count: int) -> str:
+    return f"<h3>{day.strftime('%a, %d %b %Y')} (showing {count} of {count} entries )</h3>"
+
+
+def listing_page(entries, day: datetime, total: int) -> str:
+    rows = "".join(ENTRY_TEMPLATE.format(n=n, **entry) for n, entry in enumerate(entries, 1))
+    return (f"<html><body><div class='paging'>Total of {total} entries</div>"
+            f"{day_header(day, len(entries))}<dl id='articles'>{rows}</dl></body></html>")
+
+
+def make_entry(paper_id, title="A Title", primary="Artificial Intelligence (cs.AI)",
+               others="; Machine Learning (cs.LG)", abstract=""):
+    return {"paper_id": paper_id, "title": title, "primary": primary, "others": others, "abstract": abstract}
+
+
+class TestListingParser(unittest.TestCase):
+    def test_parses_entries_in_one_pass(self):
+        day = datetime(2025, 6, 13)
+        html = listing_page([
+            make_entry("2506.00001", title="Sparse <i>Attention</i> &amp; Memory"),
+            make_entry("2506.00002", primary="Robotics (cs.RO)", others="",
+                       abstract="<p class='mathjax'> We study   robots. </p>"),
+        ], day, total=437)
+
+        listing = parse_listing(html, "https://arxiv.org/list/cs/recent")
+
+        self.assertEqual(listing.total, 437)
+        self.assertEqual(len(listing.entries), 2)
+        first = listing.entries[0]
+        self.assertEqual(first["paper_id"], "2506.00001")
+        self.assertEqual(first["title"], "Sparse Attention & Memory")
+        self.assertEqual(first["authors"], "Jiwon Kim, Sora Lee")
+        self.assertEqual(first["categories"], ["cs.AI", "cs.LG"])
+        self.assertEqual(first["primary_category"], "cs.AI")
+        self.assertEqual(first["abs_url"], "https://arxiv.org/abs/2506.00001")
+        self.assertEqual(first["pdf_url"], "https://arxiv.org/pdf/2506.00001")
+        self.assertEqual(first["html_url"], "https://arxiv.org/html/2506.00001v1")
+        self.assertEqual(first["source_url"], "https://arxiv.org/src/2506.00001")
+        self.assertEqual(first["submission_date"], day)
+        self.assertIsNone(first["abstract"])
+        self.assertEqual(listing.entries[1]["abstract"], "We study robots.")
+
+    def test_parse_abstract_skips_descriptor(self):
+        html = ('<h1 class="title">T</h1><blockquote class="abstract mathjax">'
+                '<span class="descriptor">Abstract:</span> Line one.\n  Line two.</blockquote>')
+        self.assertEqual(parse_abstract(html), "Line one. Line two.")
+
+
+class ListingHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        path = self.path.split("?")[0]
+        if path == "/list/cs/recent":
+            with server.lock:
+                server.listing_requests += 1
+            body = server.listing_html
+        elif path.startswith("/abs/"):
+            with server.lock:
+                server.abs_requests.append(path)
+            body = (f'<blockquote class="abstract"><span class="descriptor">Abstract:</span>'
+                    f' Abstract of {path.split("/")[-1]}.</blockquote>')
+        elif path.startswith("/pdf/"):
+            body = "%PDF-1.4"
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestListingCollection(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ListingHandler)
+        self.server.lock = threading.Lock()
+        self.server.listing_requests = 0
+        self.server.abs_requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp_dir.cleanup()
+
+    def test_collect_without_browser(self):
+        self.server.listing_html = listing_page([
+            make_entry("2506.00001"),
+            make_entry("2506.00002", primary="General Mathematics (math.GM)", others=""),
+            make_entry("2506.00003", abstract="<p class='mathjax'>Already listed.</p>"),
+            make_entry("2506.00004"),
+        ], datetime.now() - timedelta(days=1), total=4)
+
+        def no_browser():
+            raise AssertionError("목록 수집에서는 브라우저를 띄우지 않아야 합니다.")
+
+        collector = ArxivCSCollector(driver_factory=no_browser, requests_per_second=100,
+                                     http_cache=HttpCache(os.path.join(self.tmp_dir.name, "http")))
+        collector.url = f"{self.base_url}/list/cs/recent"
+        collector.download_dir = self.tmp_dir.name
+        collector.max_papers = 3
+
+        with mock.patch.object(collector, "cleanup", wraps=collector.cleanup) as cleanup:
+            papers = collector.collect()
+        cleanup.assert_called_once_with()
+
+        self.assertEqual(self.server.listing_requests, 1)
+        self.assertEqual([paper["abstract"] for paper in papers],
+                         ["Abstract of 2506.00001.", "Already listed.", "Abstract of 2506.00004."])
+        # 초록이 목록에 있던 논문과 카테고리가 맞지 않는 논문은 상세 페이지를 요청하지 않음
+        self.assertEqual(sorted(self.server.abs_requests), ["/abs/2506.00001", "/abs/2506.00004"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import datetime
+import unittest
+
+import arxiv
+
+from arxiv_stub import load_fixture_entries, start_stub_server
+from src.services.arxiv_search import build_window_query, iter_window_papers, page_size_for
+
+UTC = datetime.timezone.utc
+
+
+class TestArxivSearch(unittest.TestCase):
+    def setUp(self):
+        self.server, self.query_url_format = start_stub_server()
+        self.start = datetime.datetime(2025, 6, 11, tzinfo=UTC)
+        self.end = self.start + datetime.timedelta(days=1)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def make_client(self, page_size):
+        client = arxiv.Client(page_size=page_size, delay_seconds=0, num_retries=0)
+        client.query_url_format = self.query_url_format
+        return client
+
+    def expected_ids(self):
+        return [e["id"] for e in load_fixture_entries() if self.start <= e["published"] < self.end]
+
+    def test_window_query_format(self):
+        self.assertEqual(
+            build_window_query(["cs.AI"], self.start, self.end),
+            "cat:cs.AI AND submittedDate:[202506110000 TO 202506112359]"
+        )
+        self.assertEqual(
+            build_window_query(["cs.AI", "cs.LG"], self.start, self.end),
+            "(cat:cs.AI OR cat:cs.LG) AND submittedDate:[202506110000 TO 202506112359]"
+        )
+
+    def test_page_size_from_expected_volume(self):
+        self.assertEqual(page_size_for(20), 24)
+        self.assertEqual(page_size_for(10000), 2000)
+
+    def test_windowed_query_matches_python_filter_in_one_request(self):
+        client = self.make_client(page_size_for(20))
+        papers = list(iter_window_papers(client, ["cs.AI"], self.start, self.end))
+        self.assertEqual([p.entry_id for p in papers], self.expected_ids())
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_scan_mode_stops_when_window_is_exhausted(self):
+        client = self.make_client(10)
+        papers = list(iter_window_papers(client, ["cs.AI"], self.start, self.end, windowed=False))
+        self.assertEqual([p.entry_id for p in papers], self.expected_ids())
+        # 기간보다 오래된 페이지를 만나면 바로 중단하므로 72개 전체를 받지 않음
+        self.assertEqual(len(self.server.requests), 5)
+
+    def test_windowed_query_pages_fewer_than_scan(self):
+        windowed = self.make_client(10)
+        list(iter_window_papers(windowed, ["cs.AI"], self.start, self.end))
+        windowed_requests = len(self.server.requests)
+
+        self.server.requests.clear()
+        scan = self.make_client(10)
+        list(iter_window_papers(scan, ["cs.AI"], self.start, self.end, windowed=False))
+        self.assertLess(windowed_requests, len(self.server.requests))
+
+
+if __name__ == '__main__':
+    unittest.main()
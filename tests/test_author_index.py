@@ -0,0 +1,84 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from src.services.author_index import AuthorIndex, normalize_author_name
+
+DAY = datetime.date(2025, 6, 13)
+
+
+class TestAuthorIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "cache", "author_index.json")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_normalize_author_name(self):
+        self.assertEqual(normalize_author_name("  José  M. Álvarez-Ruiz "), "jose m alvarez ruiz")
+        self.assertEqual(normalize_author_name("KIM Jiwon"), normalize_author_name("kim   jiwon"))
+        self.assertEqual(normalize_author_name("..."), "")
+
+    def test_record_counts_each_source_once(self):
+        index = AuthorIndex()
+        papers = [["Jiwon Kim", "Sora Lee"], ["jiwon kim"], ["Jiwon Kim", "Jiwon  Kim"]]
+        self.assertTrue(index.record("20250613", papers, [["Jiwon Kim"]], DAY))
+        self.assertFalse(index.record("20250613", papers, [["Jiwon Kim"]], DAY))
+
+        self.assertEqual(index.get("JIWON KIM"), [3, 1, DAY.toordinal(), DAY.toordinal()])
+        self.assertEqual(index.get("Sora Lee"), [1, 0, DAY.toordinal(), 0])
+        self.assertIsNone(index.get("Nobody"))
+
+    def test_reputation_steps_and_recency(self):
+        index = AuthorIndex(recency_days=30)
+        old = DAY - datetime.timedelta(days=60)
+        index.record("old", [["Prolific"]] * 3, [["Veteran"]] * 3, old)
+        index.record("new", [], [["Rising"], ["Rising"], ["Star"], ["Veteran"]], DAY)
+        today = DAY.toordinal()
+
+        self.assertEqual(index.reputation("Veteran", today), 0.5)
+        self.assertEqual(index.reputation("Rising", today), 0.4)
+        self.assertEqual(index.reputation("Star", today), 0.3)
+        self.assertEqual(index.reputation("Prolific", today), 0.1)
+        self.assertEqual(index.reputation("Nobody", today), 0.0)
+        # 마지막 Top 10 선정이 recency_days보다 오래되면 절반
+        self.assertEqual(index.reputation("Star", today + 31), 0.15)
+        self.assertEqual(index.paper_reputation(["Nobody", "Star", "Rising"], today), 0.4)
+        self.assertEqual(index.paper_reputation([], today), 0.0)
+
+    def test_update_from_history_and_reload(self):
+        history = os.path.join(self.tmp_dir.name, "daily_top10")
+        os.makedirs(history)
+        pd.DataFrame({"rank": [1, 2], "author_names": ["Jiwon Kim; Sora Lee", "Jiwon Kim"]}).to_csv(
+            os.path.join(history, "top10_20250612.csv"), index=False)
+        # 저자 이름 열이 없는 예전 형식과 관계없는 파일
+        pd.DataFrame({"rank": [1], "authors": [3]}).to_csv(os.path.join(history, "top10_20250611.csv"), index=False)
+        open(os.path.join(history, "notes.txt"), "w").close()
+
+        index = AuthorIndex(self.path)
+        self.assertEqual(index.update_from_history(history), 2)
+        self.assertEqual(index.update_from_history(history), 0)
+        index.save()
+
+        reloaded = AuthorIndex(self.path)
+        ordinal = datetime.date(2025, 6, 12).toordinal()
+        self.assertEqual(reloaded.get("jiwon kim"), [2, 2, ordinal, ordinal])
+        self.assertEqual(reloaded.get("Sora Lee"), [1, 1, ordinal, ordinal])
+        self.assertTrue(reloaded.has_source("20250611"))
+        # 오늘 실행에서 이미 반영한 날짜의 CSV는 다시 세지 않음
+        self.assertFalse(reloaded.record("20250612", [["Jiwon Kim"]], [], DAY))
+
+    def test_missing_or_broken_file(self):
+        self.assertEqual(len(AuthorIndex(self.path)), 0)
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{broken")
+        self.assertEqual(len(AuthorIndex(self.path)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from src.services.deepseek_client import DeepSeekClient
+from src.services.rate_limiter import RateLimiter
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        server = self.server
+        server.client_ports.append(self.client_address[1])
+
+        if payload.get("stream"):
+            self.send_stream(server.stream_chunks)
+            return
+
+        status, headers = server.responses.pop(0) if server.responses else (200, {})
+        body = json.dumps({"choices": [{"message": {"content": " ok "}}]}).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_stream(self, chunks):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            self.write_chunk(b": keep-alive\n\n")
+            for chunk in chunks:
+                if chunk is None:
+                    # 클라이언트가 조기 종료하지 않으면 테스트가 느려지도록 대기
+                    time.sleep(2)
+                    continue
+                event = {"choices": [{"delta": {"content": chunk}}]}
+                self.write_chunk(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8"))
+            self.write_chunk(b"data: [DONE]\n\n")
+            self.write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.close_connection = True
+
+    def write_chunk(self, data):
+        self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDeepSeekClient(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.responses = []
+        self.server.client_ports = []
+        self.server.stream_chunks = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{self.server.server_address[1]}/v1/chat/completions"
+        self.client = DeepSeekClient(
+            "test-key", url, max_retries=2, backoff_base=0.01,
+            rate_limiter=RateLimiter(rate=1000, burst=10)
+        )
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_retries_after_429_and_reuses_connection(self):
+        self.server.responses = [(429, {"Retry-After": "0"}), (503, {})]
+        response = self.client.chat_completion({"model": "deepseek-chat"})
+        self.assertEqual(response["choices"][0]["message"]["content"], " ok ")
+        self.assertEqual(len(self.server.client_ports), 3)
+        self.assertEqual(len(set(self.server.client_ports)), 1)
+
+    def test_gives_up_after_max_retries(self):
+        self.server.responses = [(500, {})] * 5
+        with self.assertRaises(requests.HTTPError):
+            self.client.chat_completion({"model": "deepseek-chat"})
+        self.assertEqual(len(self.server.client_ports), 3)
+
+    def test_client_error_is_not_retried(self):
+        self.server.responses = [(400, {})]
+        with self.assertRaises(requests.HTTPError):
+            self.client.chat_completion({"model": "deepseek-chat"})
+        self.assertEqual(len(self.server.client_ports), 1)
+
+    def test_stream_assembles_chunks(self):
+        self.server.stream_chunks = ["안녕", "하세요. ", "번역입니다."]
+        received = []
+        content = self.client.stream_chat_completion({"model": "deepseek-chat"}, on_chunk=received.append)
+        self.assertEqual(content, "안녕하세요. 번역입니다.")
+        self.assertEqual(received, ["안녕", "하세요. ", "번역입니다."])
+
+    def test_stream_stops_at_marker_across_chunks(self):
+        self.server.stream_chunks = ["번역문입니다.\n-", "--\n설명", None, "나머지"]
+        received = []
+        start = time.monotonic()
+        content = self.client.stream_chat_completion(
+            {"model": "deepseek-chat"}, on_chunk=received.append, stop_markers=("번역 규칙", "---")
+        )
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertEqual(content, "번역문입니다.\n")
+        self.assertEqual("".join(received), "번역문입니다.\n")
+
+    def test_retry_after_http_date(self):
+        self.assertEqual(self.client._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertEqual(self.client._parse_retry_after("2.5"), 2.5)
+        self.assertIsNone(self.client._parse_retry_after("soon"))
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_limits_request_rate(self):
+        limiter = RateLimiter(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import math
+import time
+import unittest
+from collections import Counter
+
+from random_corpus import make_corpus
+from src.services.diversity import MMRReranker
+from src.services.relevance_ranker import tokenize
+
+
+def cosine(a, b):
+    dot = sum(a[key] * b.get(key, 0.0) for key in a)
+    norm = math.sqrt(sum(v * v for v in a.values())) * math.sqrt(sum(v * v for v in b.values()))
+    return dot / norm if norm else 0.0
+
+
+def brute_force_mmr(texts, categories, scores, k, diversity, category_weight, candidates):
+    """모든 후보 쌍의 유사도를 미리 계산하고 매번 다시 최대값을 구하는 기준 구현"""
+    docs = [Counter(tokenize(texts[i])) for i in candidates]
+    df = Counter(term for doc in docs for term in doc)
+    n = len(docs)
+    vectors = [{term: tf * (math.log((n + 1) / (df[term] + 1)) + 1) for term, tf in doc.items()} for doc in docs]
+    labels = [{category: 1.0 for category in categories[i]} for i in candidates]
+    similarity = [[(1 - category_weight) * cosine(vectors[a], vectors[b])
+                   + category_weight * cosine(labels[a], labels[b]) for b in range(n)] for a in range(n)]
+
+    values = [scores[i] for i in candidates]
+    low, high = min(values), max(values)
+    relevance = [(v - low) / (high - low) for v in values]
+    picks = []
+    while len(picks) < min(k, n):
+        best = max((a for a in range(n) if a not in picks),
+                   key=lambda a: ((1 - diversity) * relevance[a]
+                                  - diversity * max((similarity[a][p] for p in picks), default=0.0), -a))
+        picks.append(best)
+    return [candidates[a] for a in picks]
+
+
+class TestMMRReranker(unittest.TestCase):
+    def test_matches_brute_force(self):
+        texts, categories, scores = make_corpus(150, seed=5, max_words=10, max_categories=2)
+        candidates = [i for i in range(150) if i % 7]
+        for diversity, category_weight in [(0.3, 0.3), (0.7, 0.0), (0.5, 1.0)]:
+            selected = MMRReranker(diversity, category_weight).select(
+                texts, categories, scores, 10, candidates=candidates
+            )
+            self.assertEqual(selected, brute_force_mmr(texts, categories, scores, 10,
+                                                       diversity, category_weight, candidates))
+
+    def test_zero_diversity_is_score_order(self):
+        texts, categories, scores = make_corpus(200, seed=5, max_words=10, max_categories=2)
+        scores[3] = scores[10] = max(scores) + 1  # 동점은 앞선 논문이 먼저
+        selected = MMRReranker(diversity=0).select(texts, categories, scores, 10)
+        self.assertEqual(selected, sorted(range(200), key=lambda i: (-scores[i], i))[:10])
+
+    def test_spreads_picks_across_topics(self):
+        texts = ["llm agent tool planning benchmark"] * 5 + ["protein folding structure",
+                                                              "robot grasping control"]
+        categories = [["cs.AI"]] * 5 + [["q-bio.BM"], ["cs.RO"]]
+        scores = [1.0, 0.99, 0.98, 0.97, 0.96, 0.5, 0.4]
+
+        self.assertEqual(MMRReranker(diversity=0).select(texts, categories, scores, 3), [0, 1, 2])
+        self.assertEqual(MMRReranker(diversity=0.5).select(texts, categories, scores, 3), [0, 5, 6])
+
+    def test_empty_and_invalid(self):
+        self.assertEqual(MMRReranker().select([], [], [], 10), [])
+        self.assertEqual(MMRReranker().select(["a b"], [[]], [1.0], 10), [0])
+        with self.assertRaises(ValueError):
+            MMRReranker(diversity=1.5)
+
+    def test_thousands_of_candidates(self):
+        texts, categories, scores = make_corpus(5000, seed=5, max_words=10, max_categories=2)
+        start = time.perf_counter()
+        selected = MMRReranker().select(texts, categories, scores, 10)
+        self.assertEqual(len(set(selected)), 10)
+        self.assertLess(time.perf_counter() - start, 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import hashlib
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.services.download_pipeline import DownloadPipeline
+
+BODY = b"%PDF-1.4\n" + b"x" * 4096
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            if self.path.startswith("/slow"):
+                # 1KB씩 조금씩 흘려보내는 응답
+                self.send_response(200)
+                self.send_header("Content-Length", str(100 * 1024))
+                self.end_headers()
+                try:
+                    for _ in range(100):
+                        self.wfile.write(b"x" * 1024)
+                        self.wfile.flush()
+                        time.sleep(0.1)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                self.close_connection = True
+                return
+            if self.path.startswith("/missing"):
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            time.sleep(0.05)
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDownloadPipeline(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.active = 0
+        self.server.max_active = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.pipeline = DownloadPipeline(
+            max_workers=8, per_host_concurrency=2, per_host_rate=1000,
+            read_timeout=2, deadline=0.5, chunk_size=1024
+        )
+
+    def tearDown(self):
+        self.pipeline.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def download(self, path):
+        chunks = []
+        status = self.pipeline.run(lambda: self.pipeline.download(f"{self.base_url}{path}", chunks.append))
+        status["body"] = b"".join(chunks)
+        return status
+
+    def test_reports_per_item_status(self):
+        self.assertEqual(self.download("/ok")["status"], "ok")
+        self.assertEqual(self.download("/ok")["body"], BODY)
+        missing = self.download("/missing")
+        self.assertEqual(missing["status"], "error")
+        self.assertIn("404", missing["error"])
+
+    def test_fetch_bytes_hashes_while_streaming(self):
+        data, sha256 = self.pipeline.fetch_bytes(f"{self.base_url}/ok")
+        self.assertEqual(data, BODY)
+        self.assertEqual(sha256, hashlib.sha256(BODY).hexdigest())
+
+    def test_slow_download_does_not_stall_others(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            slow = executor.submit(self.download, "/slow")
+            started = time.monotonic()
+            fast = [executor.submit(self.download, f"/ok{i}") for i in range(3)]
+            self.assertTrue(all(f.result()["status"] == "ok" for f in fast))
+            self.assertLess(time.monotonic() - started, 1.0)
+            self.assertEqual(slow.result()["status"], "timeout")
+
+    def test_limits_concurrent_requests_per_host(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            statuses = list(executor.map(self.download, [f"/ok{i}" for i in range(8)]))
+        self.assertTrue(all(s["status"] == "ok" for s in statuses))
+        self.assertEqual(self.server.max_active, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,230 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urljoin
+
+import requests
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import NoSuchElementException
+
+from src.services.driver_pool import DriverPool
+from src.services.http_cache import HttpCache
+from src.services.selenium_collectors import ArxivCSCollector
+
+PAPER_IDS = ["2506.00001", "2506.00002", "2506.00003", "2506.00004"]
+SUBJECTS = {
+    "2506.00001": "Artificial Intelligence (cs.AI)",
+    "2506.00002": "Computation and Language (cs.CL)",
+    "2506.00003": "General Mathematics (math.GM)",
+    "2506.00004": "Machine Learning (cs.LG)",
+}
+
+
+class CountingDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError("세션 종료")
+        return "about:blank"
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestDriverPool(unittest.TestCase):
+    def setUp(self):
+        self.drivers = []
+
+        def factory():
+            driver = CountingDriver()
+            self.drivers.append(driver)
+            return driver
+
+        self.factory = factory
+
+    def test_reuses_and_recycles_after_max_uses(self):
+        pool = DriverPool(self.factory, size=1, max_uses=3)
+        seen = []
+        for _ in range(7):
+            with pool.checkout() as driver:
+                seen.append(driver)
+        pool.close()
+
+        self.assertEqual(len(self.drivers), 3)
+        self.assertEqual(seen[:3], [self.drivers[0]] * 3)
+        self.assertEqual(seen[3:6], [self.drivers[1]] * 3)
+        self.assertTrue(self.drivers[0].quit_called)
+        self.assertEqual(pool.stats()["recycled"], 2)
+
+    def test_replaces_unhealthy_driver(self):
+        pool = DriverPool(self.factory, size=1)
+        with pool.checkout() as driver:
+            driver.alive = False
+        with pool.checkout() as driver:
+            self.assertIs(driver, self.drivers[1])
+        self.assertEqual(pool.stats(), {"live": 1, "created": 2, "recycled": 1})
+
+    def test_replaces_driver_after_error(self):
+        pool = DriverPool(self.factory, size=1)
+        with self.assertRaises(ValueError):
+            with pool.checkout():
+                raise ValueError("페이지 오류")
+        with pool.checkout() as driver:
+            self.assertIs(driver, self.drivers[1])
+
+    def test_never_exceeds_size(self):
+        pool = DriverPool(self.factory, size=2)
+        lock = threading.Lock()
+        state = {"active": 0, "max_active": 0}
+
+        def work(_):
+            with pool.checkout():
+                with lock:
+                    state["active"] += 1
+                    state["max_active"] = max(state["max_active"], state["active"])
+                time.sleep(0.02)
+                with lock:
+                    state["active"] -= 1
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(work, range(12)))
+
+        self.assertEqual(state["max_active"], 2)
+        self.assertEqual(len(self.drivers), 2)
+
+
+class StaticArxivHandler(BaseHTTPRequestHandler):
+    """목록 페이지와 논문 상세 페이지를 흉내 내는 정적 서버"""
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/list/cs/recent":
+            items = "".join(f'<dt><a href="/abs/{paper_id}">arXiv:{paper_id}</a></dt><dd>...</dd>'
+                            for paper_id in PAPER_IDS)
+            self._send(f"<html><body><dl>{items}</dl></body></html>".encode("utf-8"))
+        elif path.startswith("/abs/"):
+            paper_id = path.split("/")[-1]
+            page = f"""<html><body>
+                <h1 class="title">Title: Paper {paper_id}</h1>
+                <div class="authors">Authors: Kim, Lee</div>
+                <blockquote class="abstract">Abstract: About {paper_id}.</blockquote>
+                <div class="primary-subject">{SUBJECTS[paper_id]}</div>
+                <a href="/pdf/{paper_id}v1">PDF</a>
+                <a href="/html/{paper_id}v1">HTML</a>
+                <a href="/source/{paper_id}">Source</a>
+                <div class="submission-history">[v1] Submitted {datetime.now().strftime('%d %B, %Y')}</div>
+            </body></html>"""
+            self._send(page.encode("utf-8"))
+        elif path.startswith("/pdf/"):
+            self._send(b"%PDF-1.4\n" + path.encode("utf-8"))
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def _send(self, body: bytes):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeElement:
+    def __init__(self, driver, tag):
+        self.driver = driver
+        self.tag = tag
+
+    @property
+    def text(self):
+        return self.tag.get_text(" ", strip=True)
+
+    def get_attribute(self, name):
+        value = self.tag.get(name)
+        return urljoin(self.driver.current_url, value) if name == "href" and value else value
+
+    def find_element(self, by, value):
+        return self.driver._wrap(self.tag.select_one(value))
+
+    def find_elements(self, by, value):
+        return [FakeElement(self.driver, tag) for tag in self.tag.select(value)]
+
+
+class FakeWebDriver:
+    """Chrome 대신 requests와 BeautifulSoup으로 페이지를 읽는 드라이버"""
+
+    instances = []
+
+    def __init__(self):
+        self.current_url = "about:blank"
+        self.soup = BeautifulSoup("", "html.parser")
+        self.pages = 0
+        FakeWebDriver.instances.append(self)
+
+    def get(self, url):
+        self.current_url = url
+        self.soup = BeautifulSoup(requests.get(url, timeout=5).text, "html.parser")
+        self.pages += 1
+
+    def _wrap(self, tag):
+        if tag is None:
+            raise NoSuchElementException()
+        return FakeElement(self, tag)
+
+    def find_element(self, by, value):
+        return self._wrap(self.soup.select_one(value))
+
+    def find_elements(self, by, value):
+        return [FakeElement(self, tag) for tag in self.soup.select(value)]
+
+    def quit(self):
+        pass
+
+
+class TestArxivCSCollectorWithPool(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StaticArxivHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        FakeWebDriver.instances = []
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp_dir.cleanup()
+
+    def test_collect_reuses_pooled_drivers(self):
+        collector = ArxivCSCollector(driver_factory=FakeWebDriver, pool_size=2, mode="browser",
+                                     requests_per_second=100,
+                                     http_cache=HttpCache(os.path.join(self.tmp_dir.name, "http")))
+        collector.url = f"{self.base_url}/list/cs/recent"
+        collector.download_dir = self.tmp_dir.name
+        collector.max_papers = len(PAPER_IDS)
+
+        papers = collector.collect()
+
+        # math.GM 논문은 카테고리 필터에서 제외됨
+        self.assertEqual([paper["title"] for paper in papers],
+                         ["Title: Paper 2506.00001", "Title: Paper 2506.00002", "Title: Paper 2506.00004"])
+        self.assertEqual(papers[0]["categories"], ["cs.AI"])
+        self.assertEqual(papers[0]["pdf_url"], f"{self.base_url}/pdf/2506.00001v1")
+        self.assertTrue(os.path.exists(os.path.join(self.tmp_dir.name, "2506.00001.pdf")))
+
+        # 목록 1회 + 상세 4회를 드라이버 2개로 처리
+        self.assertLessEqual(len(FakeWebDriver.instances), 2)
+        self.assertEqual(sum(driver.pages for driver in FakeWebDriver.instances), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+import arxiv
+
+from arxiv_stub import load_fixture_entries, start_stub_server
+from src.services.arxiv_search import iter_window_papers
+from src.services.harvest_state import HarvestState
+
+UTC = datetime.timezone.utc
+
+
+class TestIncrementalHarvest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "harvest_state.json")
+        self.entries = load_fixture_entries()
+        self.server, query_url_format = start_stub_server(self.entries)
+        self.client = arxiv.Client(page_size=100, delay_seconds=0, num_retries=0)
+        self.client.query_url_format = query_url_format
+        self.start = datetime.datetime(2025, 6, 10, tzinfo=UTC)
+        self.end = datetime.datetime(2025, 6, 13, tzinfo=UTC)
+        self.first_night = datetime.datetime(2025, 6, 12, tzinfo=UTC)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp_dir.cleanup()
+
+    def harvest(self):
+        state = HarvestState(self.path, overlap_hours=6)
+        papers = list(iter_window_papers(self.client, ["cs.AI"], self.start, self.end, state=state))
+        state.save()
+        return [p.entry_id for p in papers]
+
+    def test_second_run_fetches_only_new_papers(self):
+        self.server.entries = [e for e in self.entries if e["published"] < self.first_night]
+        first = self.harvest()
+        self.assertEqual(len(first), len(self.server.entries))
+
+        self.server.entries = self.entries
+        self.server.requests.clear()
+        second = self.harvest()
+        expected = [e["id"] for e in self.entries if e["published"] >= self.first_night]
+        self.assertEqual(second, expected)
+        # 기준 시각 이전으로는 겹침 구간까지만 요청
+        self.assertIn("submittedDate:[202506111730 TO", self.server.requests[0]["search_query"])
+
+        self.server.requests.clear()
+        self.assertEqual(self.harvest(), [])
+
+    def test_late_paper_within_overlap_is_picked_up(self):
+        # 기준 시각보다 두 시간 앞서 제출됐지만 다음 실행 때 처음 공개된 논문
+        late = [e for e in self.entries if e["published"] < self.first_night][2]
+        self.server.entries = [e for e in self.entries if e["published"] < self.first_night and e is not late]
+        self.harvest()
+
+        self.server.entries = [e for e in self.entries if e["published"] < self.first_night]
+        self.assertEqual(self.harvest(), [late["id"]])
+
+    def test_prunes_ids_older_than_overlap(self):
+        self.harvest()
+        state = HarvestState(self.path, overlap_hours=6)
+        key = "cat:cs.AI"
+        self.assertEqual(state.high_water_mark(key), self.entries[0]["published"])
+        self.assertTrue(state.is_seen(key, "2506.10500"))
+        self.assertFalse(state.is_seen(key, "2506.10429"))
+
+
+if __name__ == '__main__':
+    unittest.main()
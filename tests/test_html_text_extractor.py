@@ -0,0 +1,43 @@
+import unittest
+
+from src.services.html_text_extractor import MainTextParser, extract_main_text
+
+PAGE = """<!DOCTYPE html><html><head><title>t</title><script>var x = 1;</script></head>
+<body><header>arXiv 헤더</header><nav>목차</nav>
+<main><article><h1>A Study&nbsp;of <em>Agents</em></h1>
+<p>We propose a method.</p><p>Results<br>improve &amp; scale.</p>
+<figure><img src="/x.png"><figcaption>Figure 1</figcaption></figure>
+<math alttext="x"><semantics><mi>x</mi><annotation encoding="application/x-tex">x</annotation></semantics></math>
+<footer>페이지 하단</footer><script>track()</script></article></main>
+<footer>사이트 하단</footer></body></html>"""
+
+
+class TestMainTextParser(unittest.TestCase):
+    def test_extracts_only_main_content(self):
+        self.assertEqual(
+            extract_main_text(PAGE),
+            "A Study of Agents We propose a method. Results improve & scale. Figure 1 x"
+        )
+
+    def test_streams_bytes_and_stops_after_main(self):
+        data = PAGE.encode("utf-8")
+        parser = MainTextParser()
+        fed = 0
+        # 멀티바이트 문자가 청크 경계에서 잘려도 올바르게 디코딩되어야 함
+        for i in range(0, len(data), 7):
+            fed = i
+            if not parser.feed_bytes(data[i:i + 7]):
+                break
+        self.assertTrue(parser.done)
+        self.assertLess(fed, len(data) - 7)
+        self.assertEqual(parser.text(), extract_main_text(PAGE))
+
+    def test_page_without_main(self):
+        parser = MainTextParser()
+        parser.feed_bytes(b"<html><body><p>No HTML version</p></body></html>")
+        self.assertFalse(parser.found_main)
+        self.assertEqual(parser.text(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
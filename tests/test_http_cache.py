@@ -0,0 +1,129 @@
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from src.services.download_pipeline import DownloadPipeline
+from src.services.http_cache import HttpCache, is_immutable_url
+
+BODY = b"%PDF-1.4\n" + b"y" * 2048
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/pdf/2506.00001"
+        self.cache = HttpCache(os.path.join(self.tmp_dir.name, "http"))
+        self.pipeline = DownloadPipeline(per_host_rate=1000, cache=self.cache)
+
+    def tearDown(self):
+        self.pipeline.close()
+        self.cache.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp_dir.cleanup()
+
+    def fetch(self):
+        chunks = []
+        self.pipeline.download(self.url, chunks.append, use_cache=True)
+        return b"".join(chunks)
+
+    def test_revalidates_with_etag(self):
+        self.assertEqual(self.fetch(), BODY)
+        self.assertEqual(self.fetch(), BODY)
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.server.requests[1].get("If-None-Match"), '"v1"')
+        self.assertEqual(self.cache.stats(), {
+            "hits": 0, "revalidated": 1, "misses": 1, "hit_rate": 0.5, "bytes_saved": len(BODY)
+        })
+
+    def test_versioned_url_skips_request(self):
+        self.fetch()
+        with mock.patch("src.services.download_pipeline.is_immutable_url", return_value=True):
+            self.assertEqual(self.fetch(), BODY)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_uncached_calls_skip_cache(self):
+        data, _ = self.pipeline.fetch_bytes(self.url)
+        self.assertEqual(data, BODY)
+        self.assertEqual(self.pipeline.fetch_text(self.url), BODY.decode())
+        self.assertIsNone(self.cache.lookup(self.url))
+        self.assertEqual(self.cache.stats()["misses"], 0)
+
+    def test_early_stop_discards_partial_body(self):
+        self.pipeline.chunk_size = 256
+        chunks = []
+
+        def write(chunk):
+            chunks.append(chunk)
+            return False
+
+        received = self.pipeline.download(self.url, write, use_cache=True)
+
+        self.assertEqual(len(chunks), 1)
+        self.assertLess(received, len(BODY))
+        self.assertIsNone(self.cache.lookup(self.url))
+        self.assertEqual([name for name in os.listdir(self.cache.cache_dir) if name.endswith(".part")], [])
+        # 다음 요청은 조건부 헤더 없이 본문 전체를 받음
+        self.assertEqual(self.fetch(), BODY)
+        self.assertNotIn("If-None-Match", self.server.requests[1])
+
+    def test_cache_files_created_on_first_use(self):
+        cache_dir = os.path.join(self.tmp_dir.name, "lazy")
+        cache = HttpCache(cache_dir)
+        self.assertFalse(os.path.exists(cache_dir))
+        self.assertIsNone(cache.lookup("missing"))
+        self.assertTrue(os.path.exists(os.path.join(cache_dir, "index.db")))
+        cache.close()
+        cache.close()
+
+    def test_evicts_least_recently_used_over_size_cap(self):
+        cache = HttpCache(os.path.join(self.tmp_dir.name, "small"), max_bytes=250)
+        for name in ("a", "b", "c"):
+            tmp_path = os.path.join(self.tmp_dir.name, f"{name}.part")
+            with open(tmp_path, "wb") as f:
+                f.write(b"x" * 100)
+            cache.store(name, tmp_path, None, None)
+            if name == "b":
+                cache.record_hit("a", 100)
+        self.assertIsNotNone(cache.lookup("a"))
+        self.assertIsNone(cache.lookup("b"))
+        self.assertIsNotNone(cache.lookup("c"))
+        self.assertFalse(os.path.exists(cache.body_path("b")))
+        cache.close()
+
+    def test_immutable_urls(self):
+        self.assertTrue(is_immutable_url("https://arxiv.org/pdf/2506.00001v2"))
+        self.assertTrue(is_immutable_url("https://arxiv.org/html/2506.00001v1"))
+        self.assertFalse(is_immutable_url("https://arxiv.org/pdf/2506.00001"))
+        self.assertFalse(is_immutable_url("https://example.com/pdf/2506.00001v2"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from src.services.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    def setUp(self):
+        self.matcher = KeywordMatcher({
+            "method": ["model", "framework", "neural network", "C++"],
+            "eval": ["result", "benchmark"],
+            "vision": ["image", "neural network"],
+        })
+
+    def test_counts_distinct_keywords_per_group(self):
+        text = "A Neural\nNetwork model and another model; results on two Benchmarks."
+        self.assertEqual(self.matcher.counts(text), {"method": 2, "eval": 2, "vision": 1})
+        self.assertEqual(self.matcher.matched_groups(text), ["method", "eval", "vision"])
+
+    def test_keywords_must_start_at_word_boundary(self):
+        # 'remodel', 'preresult'처럼 단어 중간에서 시작하면 세지 않음
+        self.assertEqual(self.matcher.counts("remodeled preresults imagery"),
+                         {"method": 0, "eval": 0, "vision": 1})
+
+    def test_whole_words(self):
+        matcher = KeywordMatcher({"eval": ["result"]}, whole_words=True)
+        self.assertEqual(matcher.counts("results"), {"eval": 0})
+        self.assertEqual(matcher.counts("the result."), {"eval": 1})
+
+    def test_overlapping_keywords_are_counted_in_every_group(self):
+        matcher = KeywordMatcher({"general": ["neural", "network"], "arch": ["neural network"]})
+        self.assertEqual(matcher.counts("a neural network"), {"general": 2, "arch": 1})
+        self.assertEqual(matcher.counts("a neural net"), {"general": 1, "arch": 0})
+
+        # 같은 그룹 안에서 겹치는 키워드도 각각 셈
+        matcher = KeywordMatcher({"method": ["neural", "neural network"]})
+        self.assertEqual(matcher.counts("Neural\nnetworks"), {"method": 2})
+
+    def test_whole_words_with_punctuation(self):
+        matcher = KeywordMatcher({"lang": ["c++"], "method": ["neural", "neural network"]}, whole_words=True)
+        self.assertEqual(matcher.counts("written in C++, fast"), {"lang": 1, "method": 0})
+        self.assertEqual(matcher.counts("c++x and neural networks"), {"lang": 0, "method": 1})
+
+    def test_escapes_special_characters_and_handles_empty_input(self):
+        self.assertEqual(self.matcher.counts("written in C++ "), {"method": 1, "eval": 0, "vision": 0})
+        self.assertEqual(self.matcher.count_many(["", "benchmark"]),
+                         {"method": [0, 0], "eval": [0, 1], "vision": [0, 0]})
+        self.assertEqual(KeywordMatcher({}).counts("anything"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
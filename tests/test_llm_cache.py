@@ -0,0 +1,127 @@
+import json
+import os
+import tempfile
+import unittest
+
+from paper_analyzer import ANALYSIS_PROMPTS, STAGE_SETTINGS, SYSTEM_PROMPT, PaperAnalyzer
+from src.services.llm_cache import LLMResponseCache
+
+VALID_COMBINED = json.dumps({
+    "classification": "자연어 처리",
+    "tags": ["LLM", "Reasoning", "Benchmark"],
+    "summary": "요약",
+    "translation": "번역"
+}, ensure_ascii=False)
+
+
+class FakeClient:
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def chat_completion(self, payload):
+        self.calls += 1
+        return {"choices": [{"message": {"content": self.replies.pop(0)}}]}
+
+
+def make_analyzer(replies, cache):
+    analyzer = PaperAnalyzer.__new__(PaperAnalyzer)
+    analyzer.client = FakeClient(replies)
+    analyzer.stream = False
+    analyzer.analysis_mode = "combined"
+    analyzer.response_cache = cache
+    analyzer._fingerprints = analyzer._compute_fingerprints()
+    return analyzer
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "cache", "llm_responses.json")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_lru_eviction(self):
+        cache = LLMResponseCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        self.assertEqual(cache.get("a"), "1")  # a를 최근 사용으로 만듦
+        cache.put("c", "3")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "1")
+        self.assertEqual(cache.get("c"), "3")
+
+    def test_hit_and_miss_counters(self):
+        cache = LLMResponseCache()
+        cache.put("a", "1")
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (2, 1, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+
+    def test_flush_and_reload_keeps_recent_entries(self):
+        cache = LLMResponseCache(max_entries=3, path=self.path)
+        for key in "abcd":
+            cache.put(key, key.upper())
+        cache.get("b")
+        cache.flush()
+
+        reloaded = LLMResponseCache(max_entries=2, path=self.path)
+        # 파일에는 사용 순서가 저장되므로 용량이 줄면 가장 최근 항목만 남음
+        self.assertEqual(reloaded.stats()["entries"], 2)
+        self.assertEqual(reloaded.get("b"), "B")
+        self.assertEqual(reloaded.get("d"), "D")
+        self.assertIsNone(reloaded.get("c"))
+
+    def test_make_key_depends_on_options(self):
+        base = LLMResponseCache.make_key("m", "s", "u", 0.7, 100)
+        self.assertEqual(base, LLMResponseCache.make_key("m", "s", "u", 0.7, 100, response_format=None))
+        self.assertNotEqual(base, LLMResponseCache.make_key("m", "s", "u", 0.7, 100,
+                                                            response_format={"type": "json_object"}))
+
+
+class TestCombinedResponseCaching(unittest.TestCase):
+    PAPER = {"title": "T", "abstract": "A", "url": "http://arxiv.org/abs/2506.00001v1"}
+
+    def test_invalid_reply_is_not_cached(self):
+        cache = LLMResponseCache()
+        analyzer = make_analyzer(["not json", VALID_COMBINED], cache)
+
+        with self.assertRaises(ValueError):
+            analyzer._analyze_paper_combined(self.PAPER)
+        self.assertEqual(cache.stats()["entries"], 0)
+
+        # 다시 실행하면 통합 호출을 재시도하고, 올바른 응답만 저장함
+        stages = analyzer._analyze_paper_combined(self.PAPER)
+        self.assertEqual(stages["classification"]["value"]["classification"], "자연어 처리")
+        self.assertEqual(analyzer.client.calls, 2)
+        self.assertEqual(cache.stats()["entries"], 1)
+
+        analyzer._analyze_paper_combined(self.PAPER)
+        self.assertEqual(analyzer.client.calls, 2)
+
+    def test_invalid_cached_reply_is_evicted(self):
+        cache = LLMResponseCache()
+        analyzer = make_analyzer([VALID_COMBINED], cache)
+        # 이전 버전이 저장해 둔 잘못된 응답
+        cache.put(self._combined_key(), '{"classification": ""}')
+
+        analyzer._analyze_paper_combined(self.PAPER)
+
+        self.assertEqual(analyzer.client.calls, 1)
+        self.assertEqual(list(cache._entries.values()), [VALID_COMBINED])
+
+    def _combined_key(self):
+        settings = STAGE_SETTINGS["combined"]
+        prompt = ANALYSIS_PROMPTS["combined"].format(title="T", abstract="A")
+        return LLMResponseCache.make_key(settings["model"], SYSTEM_PROMPT, prompt, settings["temperature"],
+                                         settings["max_tokens"], response_format={"type": "json_object"})
+
+
+if __name__ == "__main__":
+    unittest.main()
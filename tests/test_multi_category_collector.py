@@ -0,0 +1,55 @@
+import datetime
+import time
+import unittest
+
+from arxiv_stub import load_fixture_entries, start_stub_server
+from src.services.multi_category_collector import MultiCategoryCollector
+from src.services.rate_limiter import RateLimiter
+
+UTC = datetime.timezone.utc
+CATEGORIES = ["cs.AI", "cs.LG", "cs.CL", "cs.CV", "stat.ML"]
+
+
+class TestMultiCategoryCollector(unittest.TestCase):
+    def setUp(self):
+        self.server, self.query_url_format = start_stub_server()
+        self.start = datetime.datetime(2025, 6, 11, tzinfo=UTC)
+        self.end = self.start + datetime.timedelta(days=1)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def make_collector(self, rate_limiter=None):
+        return MultiCategoryCollector(
+            CATEGORIES, rate_limiter or RateLimiter(rate=1000, burst=5),
+            expected_volume=50, num_retries=0, query_url_format=self.query_url_format
+        )
+
+    def test_merges_cross_listed_papers_once(self):
+        collector = self.make_collector()
+        papers = collector.collect(self.start, self.end)
+
+        expected = [
+            e["id"] for e in load_fixture_entries()
+            if self.start <= e["published"] < self.end and e["categories"] & set(CATEGORIES)
+        ]
+        self.assertEqual([p.entry_id for p in papers], expected)
+        self.assertGreater(sum(collector.category_counts.values()), len(papers))
+        self.assertEqual(len(self.server.requests), len(CATEGORIES))
+
+    def test_wall_time_tracks_slowest_category(self):
+        self.server.delay = 0.3
+        started = time.monotonic()
+        self.make_collector().collect(self.start, self.end)
+        # 순차 실행이면 5 * 0.3초 이상 걸림
+        self.assertLess(time.monotonic() - started, 0.9)
+
+    def test_shared_rate_limiter_spaces_requests(self):
+        started = time.monotonic()
+        self.make_collector(RateLimiter(rate=20, burst=1)).collect(self.start, self.end)
+        self.assertGreaterEqual(time.monotonic() - started, 0.19)
+
+
+if __name__ == '__main__':
+    unittest.main()
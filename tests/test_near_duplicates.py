@@ -0,0 +1,67 @@
+import random
+import time
+import unittest
+
+import numpy as np
+
+from src.services.near_duplicates import MinHashDeduper
+
+
+def random_abstract(rng: random.Random, words: int = 150) -> str:
+    return " ".join(f"term{rng.randrange(5000)}" for _ in range(words))
+
+
+class TestMinHashDeduper(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(5)
+        base = random_abstract(rng)
+        other = random_abstract(rng)
+        edited = base.split()
+        edited[10] = "revised"
+        self.texts = [
+            "Graph Transformers at Scale. " + base,            # 0
+            random_abstract(rng),                              # 1
+            "Scaling Graph Transformers. " + " ".join(edited),  # 2: 0의 재제출
+            "Companion: " + other,                             # 3
+            "",                                                # 4: 내용 없음
+            "Companion paper, v2: " + other.upper(),           # 5: 3과 대소문자만 다름
+            "",                                                # 6
+        ]
+
+    def test_clusters_near_duplicates(self):
+        clusters = MinHashDeduper().clusters(self.texts)
+        self.assertEqual(sorted(clusters), [[0, 2], [3, 5]])
+
+    def test_collapse_keeps_best_scoring_member(self):
+        scores = [0.5, 0.9, 0.7, 0.4, 0.1, 0.4, 0.1]
+        kept = MinHashDeduper().collapse(self.texts, scores)
+        # 0/2 중에서는 점수가 높은 2, 3/5는 동점이라 앞선 3을 남김
+        self.assertEqual(kept, [1, 2, 3, 4, 6])
+
+    def test_chunked_signatures_are_identical(self):
+        full = MinHashDeduper().signatures(self.texts)
+        chunked = MinHashDeduper(chunk_elements=1000).signatures(self.texts)
+        np.testing.assert_array_equal(full, chunked)
+
+    def test_repeated_boilerplate_is_linear(self):
+        rng = random.Random(7)
+        notice = "This paper has been withdrawn by the author."
+        texts = [notice] * 3000 + [random_abstract(rng) for _ in range(50)]
+        deduper = MinHashDeduper()
+
+        start = time.perf_counter()
+        kept = deduper.collapse(texts, [0.0] * len(texts))
+        self.assertLess(time.perf_counter() - start, 10)
+        self.assertEqual(kept, [0] + list(range(3000, 3050)))
+
+        # 같은 버킷의 모든 쌍이 아니라 논문 수에 비례하는 후보 쌍만 만듦
+        pairs = deduper._candidate_pairs(deduper.signatures(texts), np.ones(len(texts), dtype=bool))
+        self.assertLess(len(pairs), 2 * len(texts))
+
+    def test_rejects_uneven_bands(self):
+        with self.assertRaises(ValueError):
+            MinHashDeduper(num_perm=100, bands=16)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import os
+import re
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from pdfminer.high_level import extract_text
+from pdfminer.pdfpage import PDFPage
+
+from pdf_fixture import make_pdf
+from src.services.pdf_text_extractor import PdfTextExtractor, extract_pdf_text, select_pages
+
+
+def raise_timeout():
+    raise TimeoutError("워커 안의 제한 시간 초과")
+
+
+class TestPdfTextExtractor(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.pdf_path = os.path.join(self.tmp_dir.name, "paper.pdf")
+        self.text_path = os.path.join(self.tmp_dir.name, "paper.txt")
+        with open(self.pdf_path, "wb") as f:
+            f.write(make_pdf([f"Page {i}   text  (section {i})" for i in range(1, 7)]))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def read_text(self):
+        with open(self.text_path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_select_pages_keeps_last_page(self):
+        self.assertEqual(select_pages(6, None), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(select_pages(6, 2), [0, 1, 5])
+        self.assertEqual(select_pages(3, 2), [0, 1, 2])
+
+    def test_matches_full_document_extraction(self):
+        self.assertEqual(extract_pdf_text(self.pdf_path, self.text_path), 6)
+        expected = re.sub(r"\s+", " ", extract_text(self.pdf_path)).strip()
+        self.assertEqual(self.read_text(), expected)
+
+    def test_max_pages_keeps_first_pages_and_conclusion(self):
+        extract_pdf_text(self.pdf_path, self.text_path, max_pages=2)
+        self.assertEqual(self.read_text(), "Page 1 text (section 1) Page 2 text (section 2) Page 6 text (section 6)")
+
+    def test_max_pages_reads_only_needed_page_objects(self):
+        with open(self.pdf_path, "wb") as f:
+            f.write(make_pdf([f"Page {i}" for i in range(200)]))
+        yielded = []
+        create_pages = PDFPage.create_pages
+
+        def counting(document):
+            for page in create_pages(document):
+                yielded.append(page)
+                yield page
+
+        with mock.patch.object(PDFPage, "create_pages", side_effect=counting):
+            self.assertEqual(extract_pdf_text(self.pdf_path, self.text_path, max_pages=2), 3)
+        self.assertEqual(len(yielded), 2)
+        self.assertEqual(self.read_text(), "Page 0 Page 1 Page 199")
+
+    def test_extracts_from_memory_buffer(self):
+        with open(self.pdf_path, "rb") as f:
+            data = f.read()
+        extractor = PdfTextExtractor(max_workers=1, max_pages=1)
+        try:
+            self.assertTrue(extractor.extract_bytes(data, self.text_path))
+        finally:
+            extractor.close()
+        self.assertEqual(self.read_text(), "Page 1 text (section 1) Page 6 text (section 6)")
+
+    def test_process_pool_timeout_leaves_no_output(self):
+        with open(self.pdf_path, "wb") as f:
+            f.write(make_pdf([f"Page {i}" for i in range(1000)]))
+        extractor = PdfTextExtractor(max_workers=1, timeout=0.05)
+        try:
+            self.assertFalse(extractor.extract(self.pdf_path, self.text_path))
+            self.assertFalse(os.path.exists(self.text_path))
+
+            extractor.timeout = 60
+            self.assertTrue(extractor.extract(self.pdf_path, self.text_path))
+            self.assertTrue(self.read_text().startswith("Page 0 Page 1"))
+        finally:
+            extractor.close()
+
+    def test_hung_worker_is_recycled(self):
+        extractor = PdfTextExtractor(max_workers=1, timeout=0.1)
+        extractor.timeout_grace = 0.2
+        try:
+            # 워커 안의 제한 시간을 무시하고 멈춘 작업
+            hung = extractor._submit(time.sleep, 30)
+            pool = extractor._executor
+            workers = list(pool._processes.values())
+            started = time.monotonic()
+
+            self.assertFalse(extractor._wait(hung, "hung.pdf"))
+            self.assertLess(time.monotonic() - started, 5)
+            for process in workers:
+                process.join(5)
+                self.assertFalse(process.is_alive())
+
+            # 다음 작업은 새 풀에서 정상 처리
+            extractor.timeout = 60
+            self.assertTrue(extractor.extract(self.pdf_path, self.text_path))
+            self.assertIsNot(extractor._executor, pool)
+        finally:
+            extractor.close()
+
+    def test_worker_side_timeout_keeps_pool(self):
+        extractor = PdfTextExtractor(max_workers=1, timeout=60)
+        try:
+            pool = extractor.start()
+            self.assertFalse(extractor._wait(extractor._submit(raise_timeout), "slow.pdf"))
+            self.assertIs(extractor._executor, pool)
+            self.assertTrue(extractor.extract(self.pdf_path, self.text_path))
+        finally:
+            extractor.close()
+
+    def test_queued_job_does_not_use_up_hung_budget(self):
+        extractor = PdfTextExtractor(max_workers=1, timeout=1.0)
+        extractor.timeout_grace = 0.5
+        try:
+            pool = extractor.start()
+            first = extractor._submit(time.sleep, 1.0)
+            results = []
+            # 첫 작업이 끝날 때까지 기다린 시간은 두 번째 작업의 대기 시간에 들어가지 않음
+            second = threading.Thread(
+                target=lambda: results.append(extractor._wait(extractor._submit(time.sleep, 0.8), "queued.pdf"))
+            )
+            second.start()
+            self.assertTrue(extractor._wait(first, "first.pdf"))
+            second.join(10)
+            self.assertEqual(results, [True])
+            self.assertIs(extractor._executor, pool)
+        finally:
+            extractor.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import json
+import os
+import unittest
+
+import numpy as np
+
+from random_corpus import make_corpus
+from src.services.personalized_ranking import PersonalizedRanker
+from src.services.relevance_ranker import BM25Scorer, profile_terms
+
+PROFILES = {
+    "nlp": {"emails": ["a@example.com"], "keywords": {"language model": 1.0, "reasoning": 0.5},
+            "categories": ["cs.CL"]},
+    "vision": {"emails": ["b@example.com"], "keywords": ["image", "video", "diffusion"], "weight": 0.5},
+    "robotics": {"emails": ["c@example.com"], "keywords": ["robot"], "categories": ["cs.RO", "cs.AI"]},
+    "nothing": {"emails": ["d@example.com"], "keywords": ["nonexistent"]},
+}
+
+EXAMPLE_PROFILES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "config", "recipient_profiles.example.json")
+
+
+def brute_force_scores(texts, categories, profile, category_weight=1.0):
+    """수신자 한 명씩 따로 점수를 계산하는 기준 구현"""
+    scores = float(profile.get("weight", 1.0)) * BM25Scorer(texts).score(profile_terms(profile))
+    wanted = set(profile.get("categories", []))
+    overlap = np.array([len(wanted & set(cats)) for cats in categories], dtype=float)
+    return scores + category_weight * overlap
+
+
+class TestPersonalizedRanker(unittest.TestCase):
+    def test_score_matrix_matches_per_recipient_scores(self):
+        texts, categories, _ = make_corpus(300, seed=3)
+        ranker = PersonalizedRanker(PROFILES, category_weight=0.7)
+
+        scores = ranker.score_matrix(texts, categories)
+
+        self.assertEqual(scores.shape, (300, len(PROFILES)))
+        for column, profile in enumerate(PROFILES.values()):
+            np.testing.assert_allclose(scores[:, column],
+                                       brute_force_scores(texts, categories, profile, 0.7), atol=1e-9)
+
+    def test_select_matches_full_sort(self):
+        texts, categories, _ = make_corpus(500, seed=3)
+        # 동점이 생기도록 같은 논문을 여러 번 넣음
+        texts += texts[:20]
+        categories += categories[:20]
+
+        selections = PersonalizedRanker(PROFILES, top_k=10).select(texts, categories)
+
+        for name, profile in PROFILES.items():
+            scores = brute_force_scores(texts, categories, profile)
+            expected = sorted((i for i in range(len(texts)) if scores[i] > 1e-12),
+                              key=lambda i: (-round(scores[i], 9), i))[:10]
+            self.assertEqual([i for i, _ in selections[name]], expected, name)
+
+    def test_eligible_and_fallback(self):
+        texts = ["robot control", "robot control", "robot arm", "graphene", "protein folding", "theorem proof"]
+        categories = [["cs.RO"], ["cs.RO"], ["cs.LG"], ["cond-mat"], ["q-bio"], ["math.LO"]]
+        profiles = {"robotics": {"keywords": ["robot"]}, "nothing": {"keywords": ["nonexistent"]}}
+
+        selections = PersonalizedRanker(profiles, top_k=4).select(
+            texts, categories, eligible=[0, 2, 3, 4, 5], fallback=[5, 1, 0, 4, 3]
+        )
+
+        # 제외된 논문(1)은 관련이 있어도 고르지 않고, 빈자리는 공통 순위로 채움
+        self.assertEqual([i for i, _ in selections["robotics"]][:2], [0, 2])
+        self.assertEqual([i for i, _ in selections["robotics"]][2:], [5, 4])
+        self.assertEqual([i for i, _ in selections["nothing"]], [5, 0, 4, 3])
+        self.assertEqual([score for _, score in selections["nothing"]], [0.0] * 4)
+
+    def test_example_profiles_are_valid(self):
+        with open(EXAMPLE_PROFILES, "r", encoding="utf-8") as f:
+            profiles = json.load(f)
+        for profile in profiles.values():
+            self.assertTrue(profile["emails"])
+        texts, categories, _ = make_corpus(50, seed=3)
+        selections = PersonalizedRanker(profiles).select(texts, categories)
+        self.assertEqual(set(selections), set(profiles))
+
+
+if __name__ == "__main__":
+    unittest.main()
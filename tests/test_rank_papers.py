@@ -0,0 +1,124 @@
+import datetime
+import random
+import unittest
+
+import arxiv
+import numpy as np
+
+from rank_papers import BatchQualityScorer, PaperQualityAnalyzer, StreamingTopK
+from services.author_index import AuthorIndex
+
+NOW = datetime.datetime(2025, 6, 13, 12, 0, tzinfo=datetime.timezone.utc)
+WORDS = ["model", "Attention", "approach", "benchmark", "results", "Graph", "learning",
+         "evaluation", "framework", "data", "ÉCOLE", "robust", "algorithm", "comparison"]
+
+
+def random_text(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def random_paper(rng: random.Random, index: int):
+    published = NOW - datetime.timedelta(hours=rng.randint(0, 24 * 9))
+    updated = published + datetime.timedelta(hours=rng.choice([0, 0, 5, 30, 100]))
+    title = random_text(rng, rng.randint(0, 18)).lower() if index % 7 == 0 else random_text(rng, rng.randint(1, 18))
+    abstract = random_text(rng, rng.choice([0, 40, 99, 100, 150, 199, 200, 260]))
+    categories = rng.sample(["cs.AI", "cs.LG", "cs.CL", "stat.ML"], rng.randint(0, 4))
+    author_names = [f"Author {i}" for i in range(rng.randint(0, 10))]
+
+    if index % 3 == 0:
+        # 수집기가 넘기는 dict 형식 (저자/카테고리가 문자열이거나 날짜가 없는 경우 포함)
+        return {
+            "title": title,
+            "abstract": abstract,
+            "authors": ", ".join(author_names) if index % 2 else author_names,
+            "categories": categories,
+            "submission_date": published.replace(tzinfo=None) if index % 5 else None,
+        }
+    return arxiv.Result(
+        entry_id=f"http://arxiv.org/abs/2506.{index:05d}v1",
+        updated=updated,
+        published=published,
+        title=title,
+        authors=[arxiv.Result.Author(name) for name in author_names],
+        summary=abstract,
+        categories=categories,
+    )
+
+
+class TestBatchQualityScorer(unittest.TestCase):
+    def test_matches_scalar_path(self):
+        rng = random.Random(7)
+        papers = [random_paper(rng, i) for i in range(600)]
+        analyzer = PaperQualityAnalyzer()
+
+        expected = np.array([analyzer.analyze_paper(paper, now=NOW) for paper in papers])
+        actual = BatchQualityScorer(analyzer.quality_indicators).score_papers(papers, now=NOW)
+
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-12)
+        self.assertTrue(((actual > 0) & (actual <= 1)).all())
+
+    def test_matches_scalar_path_with_author_index(self):
+        rng = random.Random(9)
+        papers = [random_paper(rng, i) for i in range(300)]
+        index = AuthorIndex(recency_days=30)
+        index.record("20250101", [["Author 0", "Author 1"]] * 3, [["author 1"], ["AUTHOR 2"]], datetime.date(2025, 1, 1))
+        index.record("20250610", [], [["Author 2"], ["Author 3"], ["Author 3"], ["Author 3"]], datetime.date(2025, 6, 10))
+        analyzer = PaperQualityAnalyzer(author_index=index)
+
+        expected = np.array([analyzer.analyze_paper(paper, now=NOW) for paper in papers])
+        actual = BatchQualityScorer(analyzer.quality_indicators, author_index=index).score_papers(papers, now=NOW)
+
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-12)
+        self.assertTrue(((actual > 0) & (actual <= 1)).all())
+        # 이력이 있는 저자가 있으면 점수가 오름
+        self.assertTrue((actual >= BatchQualityScorer().score_papers(papers, now=NOW)).all())
+
+    def test_scores_arxiv_results(self):
+        # arxiv.Result에 dict용 .get()을 호출하던 오류로 모든 점수가 0이 되던 문제
+        paper = arxiv.Result(
+            entry_id="http://arxiv.org/abs/2506.00001v1",
+            updated=NOW, published=NOW,
+            title="A Simple Framework for Robust Graph Learning",
+            authors=[arxiv.Result.Author("Kim"), arxiv.Result.Author("Lee")],
+            summary="We propose a method and report benchmark results. " * 30,
+            categories=["cs.AI", "cs.LG", "stat.ML"],
+        )
+        score = PaperQualityAnalyzer().analyze_paper(paper, now=NOW)
+        # 저자 1.5/2.0 (이력 없음), 논문 2.3/2.3, 시간 0.5/1.0, 내용 (method + benchmark, result) 0.6/1.0
+        self.assertAlmostEqual(score, 0.3 * 0.75 + 0.3 + 0.2 * 0.5 + 0.2 * 0.6)
+
+    def test_empty_input(self):
+        self.assertEqual(len(BatchQualityScorer().score_papers([], now=NOW)), 0)
+
+
+class TestStreamingTopK(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(11)
+        self.papers = [random_paper(rng, i) for i in range(300)]
+
+    def full_sort(self, k):
+        scores = BatchQualityScorer().score_papers(self.papers, now=NOW)
+        order = sorted(range(len(self.papers)), key=lambda i: scores[i], reverse=True)
+        return [(float(scores[i]), self.papers[i]) for i in order[:k]]
+
+    def test_matches_full_sort_from_generator(self):
+        ranker = StreamingTopK(10, chunk_size=7, now=NOW).consume(paper for paper in self.papers)
+
+        self.assertEqual(ranker.seen, 300)
+        actual = ranker.results()
+        expected = self.full_sort(10)
+        # 동점이면 먼저 들어온 논문이 앞에 옴 (정렬 후 자르던 기존 결과와 동일)
+        self.assertEqual([paper for _, paper in actual], [paper for _, paper in expected])
+        self.assertEqual([score for score, _ in actual], [score for score, _ in expected])
+
+    def test_k_larger_than_input(self):
+        results = StreamingTopK(1000, chunk_size=64, now=NOW).consume(self.papers).results()
+        self.assertEqual([paper for _, paper in results], [paper for _, paper in self.full_sort(1000)])
+
+    def test_no_limit_keeps_every_paper(self):
+        results = StreamingTopK(None, chunk_size=64, now=NOW).consume(self.papers).results()
+        self.assertEqual([paper for _, paper in results], [paper for _, paper in self.full_sort(len(self.papers))])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import json
+import math
+import os
+import tempfile
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from src.services.relevance_ranker import (
+    BM25Scorer, RelevanceRanker, index_terms, load_interest_profiles, normalize_token, profile_terms,
+    query_terms, tokenize
+)
+
+TEXTS = [
+    "Large language models improve reasoning with chain-of-thought prompting.",
+    "A diffusion model for video generation and image editing.",
+    "Retrieval-augmented generation grounds language models in retrieved documents.",
+    "We study the thermal properties of graphene.",
+    "",
+]
+
+REPO_PROFILES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "config", "interest_profiles.json")
+
+
+def dense_bm25(texts, terms, k1=1.5, b=0.75):
+    docs = [Counter(index_terms(tokenize(text))) for text in texts]
+    lengths = [sum(doc.values()) for doc in docs]
+    average = sum(lengths) / len(lengths)
+    query = {}
+    for phrase, weight in terms.items():
+        keys = query_terms(phrase)
+        for key in keys:
+            query[key] = max(query.get(key, 0.0), weight / len(keys))
+    scores = []
+    for doc, length in zip(docs, lengths):
+        score = 0.0
+        for term, weight in query.items():
+            tf = doc.get(term, 0)
+            if not tf:
+                continue
+            df = sum(1 for other in docs if term in other)
+            idf = math.log1p((len(docs) - df + 0.5) / (df + 0.5))
+            score += weight * idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / average))
+        scores.append(score)
+    return np.array(scores)
+
+
+class TestBM25Scorer(unittest.TestCase):
+    def test_matches_dense_reference(self):
+        terms = {"language": 1.0, "models": 0.5, "video": 2.0, "absent": 1.0, "language models": 0.8}
+        actual = BM25Scorer(TEXTS).score(terms)
+        np.testing.assert_allclose(actual, dense_bm25(TEXTS, terms))
+
+    def test_phrases_match_as_phrases(self):
+        texts = ["Large language models follow instructions.",
+                 "A large deep learning model trained on large datasets.",
+                 "Language is modeled by a large network."]
+        scores = BM25Scorer(texts).score({"large language model": 1.0})
+        self.assertGreater(scores[0], 0)
+        np.testing.assert_array_equal(scores[1:], [0, 0])
+
+    def test_plural_normalization(self):
+        self.assertEqual(tokenize("LLMs agents studies analysis class"),
+                         ["llm", "agent", "study", "analysis", "class"])
+        self.assertEqual(normalize_token("gas"), "gas")
+        self.assertEqual(query_terms("tool use"), ["tool use"])
+        scores = BM25Scorer(["Benchmarking LLMs as agents.", "Graphene."]).score({"llm": 1.0, "agent": 1.0})
+        self.assertGreater(scores[0], 0)
+
+
+class TestRelevanceRanker(unittest.TestCase):
+    def test_best_matching_profile_wins(self):
+        ranker = RelevanceRanker({
+            "llm": {"keywords": ["large language model", "reasoning"]},
+            "vision": {"keywords": {"diffusion": 1.0, "video": 1.0}, "weight": 0.5},
+        })
+        profile_scores = ranker.profile_scores(TEXTS)
+        scores = ranker.score(TEXTS)
+
+        np.testing.assert_allclose(scores, np.maximum(profile_scores["llm"], profile_scores["vision"]))
+        self.assertEqual(int(np.argmax(scores)), 0)
+        self.assertGreater(scores[1], 0)
+        self.assertEqual(scores[3], 0)
+        self.assertEqual(scores[4], 0)
+
+    def test_load_profiles(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "profiles.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"a": {"keywords": ["x"]}, "broken": "ignored"}, f)
+            self.assertEqual(load_interest_profiles(path), {"a": {"keywords": ["x"]}})
+            self.assertEqual(load_interest_profiles(os.path.join(tmp_dir, "missing.json")), {})
+
+        profiles = load_interest_profiles(REPO_PROFILES)
+        self.assertTrue(profiles)
+        for profile in profiles.values():
+            self.assertTrue(profile_terms(profile))
+
+    def test_default_profiles_prefer_on_topic_abstracts(self):
+        texts = [
+            "We fine-tune large language models with instruction tuning and show that LLMs agents "
+            "improve multi-step reasoning.",
+            "We present a deep learning model for protein folding trained on large datasets of "
+            "structures, improving accuracy on standard metrics.",
+            "We study the thermal properties of graphene under strain and report phonon spectra.",
+        ]
+        profile_scores = RelevanceRanker(load_interest_profiles(REPO_PROFILES)).profile_scores(texts)
+
+        self.assertGreater(profile_scores["llm"][0], 0)
+        self.assertEqual(profile_scores["llm"][1], 0)
+        self.assertGreater(profile_scores["agents"][0], profile_scores["agents"][1])
+        for scores in profile_scores.values():
+            self.assertEqual(scores[2], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,14 @@
+import os
+import tempfile
 import unittest
+from src.services.http_cache import HttpCache
 from src.services.selenium_collectors import ArxivCSCollector
 
 class TestArxivCSCollector(unittest.TestCase):
     def test_arxiv_cs_collector(self):
-        collector = ArxivCSCollector()
-        news_items = collector.collect()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            collector = ArxivCSCollector(http_cache=HttpCache(os.path.join(tmp_dir, 'http')))
+            news_items = collector.collect()
         self.assertIsInstance(news_items, list)
         if news_items:
             self.assertIsNotNone(news_items[0].title)